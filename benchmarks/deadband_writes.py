@@ -0,0 +1,136 @@
+"""Benchmark: sensor state writes per day with and without deadbands.
+
+Steps the unit of tools/simulator.py through one simulated day and polls it
+the way the coordinator does: at the fixed default interval, and at the
+interval AdaptivePollInterval picks from the data read. Two boosts, in the
+morning and the evening, drive the adaptive interval down to its minimum.
+Without filtering every change of a decoded value with a deadband is a state
+write (and a recorder row); with filtering only the changes DeadbandFilter
+lets through are.
+
+Run from the repository root:
+
+    python benchmarks/deadband_writes.py
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.jablotron_futura.const import (  # noqa: E402
+    HOLDING_REGISTERS,
+    INPUT_REGISTERS,
+    SCAN_INTERVAL,
+)
+from custom_components.jablotron_futura.deadband import DeadbandFilter  # noqa: E402
+from custom_components.jablotron_futura.interval import AdaptivePollInterval  # noqa: E402
+from custom_components.jablotron_futura.snapshot import (  # noqa: E402
+    STATUS_BITFIELDS,
+    Snapshot,
+)
+from tools.simulator import DAY, FuturaModel  # noqa: E402
+
+ZONES = 2
+# (time of day, duration) of the boosts, in seconds
+BOOSTS = ((7 * 3600, 1800), (19 * 3600, 1800))
+
+REGISTERS = {"input": INPUT_REGISTERS, "holding": HOLDING_REGISTERS}
+DEADBAND_KEYS = [key for key, config in INPUT_REGISTERS.items() if "deadband" in config]
+
+
+class Clock:
+    """Simulated monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def poll(model: FuturaModel) -> Snapshot:
+    """Return the decoded registers of the unit, like one coordinator poll."""
+    model.advance()
+    data = Snapshot()
+    for kind, registers in REGISTERS.items():
+        for key, config in registers.items():
+            if "count" not in config:
+                data[key] = model.get(kind, key)
+    for bitfield in STATUS_BITFIELDS:
+        data.update(bitfield.expand(data.get(bitfield.source)))
+    return data
+
+
+def run(next_interval: Callable[[Snapshot, float], float]) -> tuple[list[float], list[Snapshot]]:
+    """Return the poll times and data of one day on a fresh unit."""
+    clock = Clock()
+    model = FuturaModel(zones=ZONES, seed=1, clock=clock)
+    boosts = list(BOOSTS)
+    times: list[float] = []
+    snapshots: list[Snapshot] = []
+    elapsed = 0.0
+    while clock.now < DAY:
+        if boosts and clock.now >= boosts[0][0]:
+            # Press boost like the select entity does
+            model.write(HOLDING_REGISTERS["boost_time"]["address"], [boosts.pop(0)[1]])
+        data = poll(model)
+        times.append(clock.now)
+        snapshots.append(data)
+        elapsed = next_interval(data, elapsed)
+        clock.now += elapsed
+    return times, snapshots
+
+
+def writes(times: list[float], values: list, deadband: DeadbandFilter | None) -> int:
+    """Return the state writes for the values of one register at the poll times."""
+    count = 0
+    published = None
+    for now, value in zip(times, values):
+        if deadband is None:
+            if value != published:
+                count += 1
+                published = value
+        elif deadband.significant(value, now):
+            deadband.publish(value, now)
+            count += 1
+        elif value != deadband.value and deadband.silence_remaining(now) == 0:
+            # The sensor's silence timer fires at the latest on this poll
+            deadband.publish(value, now)
+            count += 1
+    return count
+
+
+def report(name: str, times: list[float], snapshots: list[Snapshot], verbose: bool) -> None:
+    """Print the state writes of one polling schedule."""
+    print(f"{name}: {len(times)} polls per day")
+    if verbose:
+        print(f"  {'register':<20} {'deadband':>8} {'before':>7} {'after':>7}")
+    total_before = total_after = 0
+    for key in DEADBAND_KEYS:
+        values = [data.get(key) for data in snapshots]
+        before = writes(times, values, None)
+        after = writes(times, values, DeadbandFilter.from_config(INPUT_REGISTERS[key]))
+        total_before += before
+        total_after += after
+        if verbose:
+            print(f"  {key:<20} {INPUT_REGISTERS[key]['deadband']:>8} {before:>7} {after:>7}")
+    reduction = 100 * (1 - total_after / total_before)
+    print(f"  {'total':<20} {'':>8} {total_before:>7} {total_after:>7} ({reduction:.1f}% fewer)")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    controller = AdaptivePollInterval()
+    times, snapshots = run(controller.update)
+    report("adaptive interval", times, snapshots, True)
+    times, snapshots = run(lambda data, elapsed: SCAN_INTERVAL)
+    report(f"fixed interval of {SCAN_INTERVAL} s", times, snapshots, False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Micro-benchmark: batch struct decoder vs per-register extraction.
+
+Run from the repository root:
+
+    python benchmarks/decode_batch.py
+"""
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.jablotron_futura.coordinator import (  # noqa: E402
+    JablotronFuturaCoordinator,
+)
+from custom_components.jablotron_futura.planner import READ_PLAN  # noqa: E402
+from custom_components.jablotron_futura.snapshot import Snapshot  # noqa: E402
+
+BLOCKS = [block for blocks in READ_PLAN.values() for block in blocks]
+RAW = {id(block): [random.randrange(65536) for _ in range(block.count)] for block in BLOCKS}
+extract = JablotronFuturaCoordinator._extract_register_value
+
+
+def per_register() -> dict:
+    """Decode one register at a time."""
+    data = {}
+    for block in BLOCKS:
+        raw = RAW[id(block)]
+        for offset, name, config in block.registers:
+            data[name] = extract(None, raw, offset, config)
+    return data
+
+
+def batch() -> Snapshot:
+    """Decode each block in one pass."""
+    data = Snapshot()
+    for block in BLOCKS:
+        for decoder in block.decoders():
+            decoder.decode_into(RAW[id(block)], data)
+    return data
+
+
+def main() -> None:
+    """Run the benchmark."""
+    assert per_register() == batch()
+    registers = sum(len(block.registers) for block in BLOCKS)
+    number = 5000
+    for label, func in (("per register", per_register), ("batch", batch)):
+        best = min(timeit.repeat(func, number=number, repeat=15)) / number
+        print(
+            f"{label:>12}: {best * 1e6:8.1f} us per poll, "
+            f"{registers / best / 1e6:5.2f} M registers/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
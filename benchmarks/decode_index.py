@@ -0,0 +1,58 @@
+"""Micro-benchmark: per-block decode index vs scanning the whole register map.
+
+Run from the repository root:
+
+    python benchmarks/decode_index.py
+"""
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.jablotron_futura.const import (  # noqa: E402
+    HOLDING_REGISTERS,
+    INPUT_REGISTERS,
+)
+from custom_components.jablotron_futura.planner import READ_PLAN  # noqa: E402
+
+BLOCKS = [block for blocks in READ_PLAN.values() for block in blocks]
+REGISTERS = {"input": INPUT_REGISTERS, "holding": HOLDING_REGISTERS}
+RAW = {id(block): [0] * block.count for block in BLOCKS}
+
+
+def scan_map() -> dict:
+    """Locate registers the way the coordinator did before the index."""
+    data = {}
+    for block in BLOCKS:
+        raw = RAW[id(block)]
+        for name, config in REGISTERS[block.kind].items():
+            addr = config["address"]
+            if block.start <= addr < block.start + block.count:
+                data[name] = raw[addr - block.start]
+    return data
+
+
+def use_index() -> dict:
+    """Locate registers through the precompiled per-block index."""
+    data = {}
+    for block in BLOCKS:
+        raw = RAW[id(block)]
+        for offset, name, _config in block.registers:
+            data[name] = raw[offset]
+    return data
+
+
+def main() -> None:
+    """Run the benchmark."""
+    assert scan_map() == use_index()
+    number = 2000
+    for label, func in (("scan map", scan_map), ("decode index", use_index)):
+        best = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print(f"{label:>12}: {best * 1e6:8.1f} us per poll")
+
+
+if __name__ == "__main__":
+    main()
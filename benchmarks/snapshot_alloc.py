@@ -0,0 +1,89 @@
+"""Micro-benchmark: memory allocated per poll by the coordinator data.
+
+Compares the string-keyed dict the coordinator used to rebuild every cycle
+with the list-backed Snapshot. Each simulated poll copies the previous data,
+decodes every block of the read plan into it and expands the status words.
+
+Run from the repository root:
+
+    python benchmarks/snapshot_alloc.py
+"""
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.jablotron_futura.coordinator import (  # noqa: E402
+    JablotronFuturaCoordinator,
+)
+from custom_components.jablotron_futura.planner import READ_PLAN  # noqa: E402
+from custom_components.jablotron_futura.snapshot import Snapshot  # noqa: E402
+
+BLOCKS = [block for blocks in READ_PLAN.values() for block in blocks]
+RAW = {id(block): [random.randrange(65536) for _ in range(block.count)] for block in BLOCKS}
+process = JablotronFuturaCoordinator._process_status_registers
+
+
+def poll_dict(previous: dict) -> dict:
+    """Copy and refill a string-keyed dict (the previous implementation)."""
+    data = dict(previous)
+    for block in BLOCKS:
+        for decoder in block.decoders():
+            values = decoder.unpack(RAW[id(block)])
+            data.update(zip(decoder.keys, values))
+            for index, scale in decoder.scaled:
+                data[decoder.keys[index]] = values[index] * scale
+    data.update(process(data, previous))
+    return data
+
+
+def poll_snapshot(previous: Snapshot) -> Snapshot:
+    """Copy and refill a list-backed snapshot."""
+    data = previous.copy()
+    for block in BLOCKS:
+        for decoder in block.decoders():
+            decoder.decode_into(RAW[id(block)], data)
+    data.update(process(data, previous))
+    return data
+
+
+def allocated(poll, previous) -> tuple[int, int]:
+    """Return the bytes still held by one poll's result and the peak."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    result = poll(previous)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return after - before, peak - before
+
+
+def main() -> None:
+    """Run the benchmark."""
+    # Steady state: the previous poll already carries every key
+    previous_dict = poll_dict(poll_dict({}))
+    previous_snapshot = poll_snapshot(poll_snapshot(Snapshot()))
+    assert previous_dict == previous_snapshot
+
+    number = 2000
+    print(f"{len(previous_dict)} keys, {len(BLOCKS)} blocks")
+    for label, poll, previous in (
+        ("dict", poll_dict, previous_dict),
+        ("snapshot", poll_snapshot, previous_snapshot),
+    ):
+        retained, peak = allocated(poll, previous)
+        best = min(timeit.repeat(lambda: poll(previous), number=number, repeat=7)) / number
+        print(
+            f"{label:>9}: {retained:6d} bytes retained, {peak:6d} bytes peak, "
+            f"{best * 1e6:6.1f} us per poll"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Micro-benchmark: status bitfield expansion cost per poll.
+
+Compares rebuilding every mode/error/warning/config/zone flag each poll with
+the cached, change-only expansion in the coordinator.
+
+Run from the repository root:
+
+    python benchmarks/status_bits.py
+"""
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.jablotron_futura.const import (  # noqa: E402
+    CONFIG_BITS,
+    ERROR_BITS,
+    MODE_BITS,
+    WARNING_BITS,
+    ZONE_BITS,
+)
+from custom_components.jablotron_futura.coordinator import (  # noqa: E402
+    JablotronFuturaCoordinator,
+)
+
+WORDS = {
+    "current_mode": 0x0005,
+    "errors": 0,
+    "warnings": 0x0002,
+    "device_config": 0x001F,
+    "vzv_identify": 0x0003,
+}
+process = JablotronFuturaCoordinator._process_status_registers
+
+
+def rebuild(data: dict) -> dict:
+    """Expand every bit of every status word (the previous implementation)."""
+    status_data = {}
+    for source, prefix, bits in (
+        ("current_mode", "mode", MODE_BITS),
+        ("errors", "error", ERROR_BITS),
+        ("warnings", "warning", WARNING_BITS),
+        ("device_config", "config", CONFIG_BITS),
+        ("vzv_identify", "zone", ZONE_BITS),
+    ):
+        word = data.get(source)
+        if word is not None:
+            for bit, name in bits.items():
+                status_data[f"{prefix}_{name}"] = bool(word & (1 << bit))
+    return status_data
+
+
+def main() -> None:
+    """Run the benchmark."""
+    previous = dict(WORDS)
+    previous.update(process(previous))
+    unchanged = dict(previous)
+    changed = dict(previous, errors=0x0004)
+    assert rebuild(previous) == process(WORDS)
+    assert {**unchanged, **process(changed, previous)} != unchanged
+
+    flags = len(rebuild(WORDS))
+    number = 20000
+    cases = (
+        ("rebuild", lambda: rebuild(unchanged)),
+        ("cached, unchanged", lambda: process(unchanged, previous)),
+        ("cached, one changed", lambda: process(changed, previous)),
+    )
+    print(f"{flags} flags from {len(WORDS)} status words")
+    for label, func in cases:
+        best = min(timeit.repeat(func, number=number, repeat=15)) / number
+        print(f"{label:>20}: {best * 1e6:6.2f} us per poll")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""Benchmark suite: the coordinator's poll cycle against the local simulator.
+
+Starts tools/simulator.py on a free local port and drives a real
+JablotronFuturaCoordinator through it, measuring:
+
+- update: wall time of _async_update_data for full cycles (every tier due)
+  and steady cycles (fast tier only)
+- blocks: round-trip time of every planned block read
+- decode: throughput of BlockDecoder.decode_into, of the register-by-register
+  _extract_register_value fallback and of _process_status_registers, in
+  registers per second, over the raw words captured from the simulator
+- listeners: cost of async_update_listeners with one keyed listener per data
+  key, for consecutive real polls and for a snapshot where every key changed
+
+Results are written as JSON; pass an earlier result with --compare to print
+the relative change of every timing.
+
+Run from the repository root:
+
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --compare before.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.jablotron_futura.const import TIER_SLOW, TRANSPORT_TCP  # noqa: E402
+from custom_components.jablotron_futura.coordinator import (  # noqa: E402
+    JablotronFuturaCoordinator,
+)
+from custom_components.jablotron_futura.snapshot import (  # noqa: E402
+    KEYS,
+    STATUS_BITFIELDS,
+    Snapshot,
+)
+from custom_components.jablotron_futura.transport import ModbusEndpoint  # noqa: E402
+from tools.simulator import FaultProfile, FuturaModel, FuturaSimulator  # noqa: E402
+
+SLAVE_ID = 1
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Return the distribution of timings in seconds, in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "min_ms": ordered[0] * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def throughput(function: Any, registers: int, min_time: float) -> dict[str, float]:
+    """Call function until min_time has passed and return registers per second."""
+    calls = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        for _ in range(100):
+            function()
+        calls += 100
+        elapsed = time.perf_counter() - started
+    return {
+        "calls": calls,
+        "us_per_call": elapsed / calls * 1e6,
+        "registers_per_s": registers * calls / elapsed,
+    }
+
+
+def git_commit() -> str | None:
+    """Return the commit being benchmarked, if run from a checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, check=True, text=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class TimedReaders:
+    """Wrap the coordinator's block readers to time and capture every read."""
+
+    def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
+        """Replace the readers of coordinator."""
+        self.times: dict[str, list[float]] = {}
+        self.words: dict[tuple[str, int, int], list[int]] = {}
+        coordinator._readers = {
+            kind: self._wrap(kind, reader) for kind, reader in coordinator._readers.items()
+        }
+
+    def _wrap(self, kind: str, reader: Any) -> Any:
+        async def read(start: int, count: int) -> Any:
+            started = time.perf_counter()
+            result = await reader(start, count)
+            self.times.setdefault(f"{kind}:{start}+{count}", []).append(
+                time.perf_counter() - started
+            )
+            if not result.isError():
+                self.words[(kind, start, count)] = list(result.registers)
+            return result
+
+        return read
+
+
+async def bench_update(
+    coordinator: JablotronFuturaCoordinator, polls: int
+) -> tuple[dict[str, Any], list[Snapshot]]:
+    """Time full and steady poll cycles and return the snapshots read."""
+    full, steady, snapshots = [], [], []
+    for index in range(2 * polls):
+        full_cycle = index % 2 == 0
+        if full_cycle:
+            # Make the static and slow tiers due again
+            coordinator._static_session = None
+            coordinator._tier_read_at[TIER_SLOW] = None
+        started = time.perf_counter()
+        data = await coordinator._async_update_data()
+        (full if full_cycle else steady).append(time.perf_counter() - started)
+        coordinator.data = data
+        snapshots.append(data)
+    return {"full": summarize(full), "steady": summarize(steady)}, snapshots
+
+
+def bench_decode(
+    coordinator: JablotronFuturaCoordinator, readers: TimedReaders, min_time: float
+) -> dict[str, Any]:
+    """Measure decoding of the raw words captured from the simulator."""
+    blocks = [
+        (block, readers.words[(block.kind, block.start, block.count)])
+        for tier in coordinator.read_plan.values()
+        for block in tier
+        if (block.kind, block.start, block.count) in readers.words
+    ]
+    words = sum(block.count for block, _ in blocks)
+    registers = sum(len(block.registers) for block, _ in blocks)
+
+    def decode_blocks() -> None:
+        data = Snapshot()
+        for block, raw in blocks:
+            for decoder in block.decoders():
+                decoder.decode_into(raw, data)
+
+    extract = coordinator._extract_register_value
+
+    def extract_registers() -> None:
+        data = Snapshot()
+        for block, raw in blocks:
+            for offset, name, config in block.registers:
+                data[name] = extract(raw, offset, config)
+
+    data = Snapshot()
+    for block, raw in blocks:
+        for decoder in block.decoders():
+            decoder.decode_into(raw, data)
+    expanded = Snapshot()
+    expanded.update(data)
+    process = JablotronFuturaCoordinator._process_status_registers
+    expanded.update(process(data))
+    status_words = sum(1 for bitfield in STATUS_BITFIELDS if data.get(bitfield.source) is not None)
+
+    return {
+        "blocks": len(blocks),
+        "words": words,
+        "registers": registers,
+        "decode_into": throughput(decode_blocks, registers, min_time),
+        "extract_register_value": throughput(extract_registers, registers, min_time),
+        "process_status_registers": {
+            "status_words": status_words,
+            "changed": throughput(lambda: process(data), status_words, min_time),
+            "unchanged": throughput(lambda: process(expanded, expanded), status_words, min_time),
+        },
+    }
+
+
+def bench_listeners(
+    coordinator: JablotronFuturaCoordinator, snapshots: list[Snapshot], rounds: int
+) -> dict[str, Any]:
+    """Measure notifying one keyed listener per data key after a poll."""
+    called = 0
+
+    def update() -> None:
+        nonlocal called
+        called += 1
+
+    removes = [
+        coordinator.async_add_listener(update, frozenset({key})) for key in KEYS
+    ]
+    changed = Snapshot()
+    for key in KEYS:
+        changed[key] = -1
+
+    def notify(sequence: list[Snapshot]) -> dict[str, Any]:
+        nonlocal called
+        coordinator.data = sequence[0]
+        coordinator.async_update_listeners()
+        called = 0
+        samples = []
+        for _ in range(rounds):
+            for data in sequence[1:]:
+                coordinator.data = data
+                started = time.perf_counter()
+                coordinator.async_update_listeners()
+                samples.append(time.perf_counter() - started)
+        return {
+            **summarize(samples),
+            "callbacks_per_update": called / len(samples),
+        }
+
+    try:
+        return {
+            "listeners": len(removes),
+            "polls": notify(snapshots),
+            "all_changed": notify([snapshots[-1], changed] * 2),
+        }
+    finally:
+        for remove in removes:
+            remove()
+
+
+async def async_run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every benchmark against a freshly started simulator."""
+    faults = FaultProfile(latency=args.latency) if args.latency else None
+    simulator = FuturaSimulator(
+        {SLAVE_ID: FuturaModel(zones=args.zones, seed=args.seed)}, faults, seed=args.seed
+    )
+    port = await simulator.start(port=0)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinator = JablotronFuturaCoordinator(
+            hass, ModbusEndpoint(TRANSPORT_TCP, "127.0.0.1", port), SLAVE_ID
+        )
+        try:
+            readers = TimedReaders(coordinator)
+            # Warm up: connect, learn the capabilities and settle the read plan
+            for _ in range(3):
+                coordinator.data = await coordinator._async_update_data()
+            readers.times.clear()
+
+            update, snapshots = await bench_update(coordinator, args.polls)
+            return {
+                "update": update,
+                "blocks": {key: summarize(times) for key, times in sorted(readers.times.items())},
+                "decode": bench_decode(coordinator, readers, args.min_time),
+                "listeners": bench_listeners(coordinator, snapshots, args.rounds),
+            }
+        finally:
+            await coordinator.async_close()
+            await simulator.stop()
+            await hass.async_stop(force=True)
+
+
+def flatten(result: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Return the timings and rates of a result by dotted path."""
+    values = {}
+    for key, value in result.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            values.update(flatten(value, f"{path}."))
+        elif key.endswith(("_ms", "_per_s", "us_per_call")):
+            values[path] = value
+    return values
+
+
+def compare(old: dict[str, Any], new: dict[str, Any]) -> None:
+    """Print the relative change of every metric present in both results."""
+    before, after = flatten(old["results"]), flatten(new["results"])
+    print(f"{'metric':<60} {'before':>12} {'after':>12} {'change':>8}")
+    for path in sorted(before.keys() & after.keys()):
+        change = (after[path] / before[path] - 1) * 100 if before[path] else 0.0
+        print(f"{path:<60} {before[path]:>12.3f} {after[path]:>12.3f} {change:>+7.1f}%")
+
+
+def main() -> None:
+    """Parse the command line, run the suite and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=50,
+                        help="full and steady poll cycles to time, each")
+    parser.add_argument("--rounds", type=int, default=20,
+                        help="times to replay the polls through the listeners")
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="seconds to run each decode measurement")
+    parser.add_argument("--zones", type=int, default=2, choices=range(9),
+                        help="VarioBreeze zones of the simulated unit")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="simulated reply delay in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="write the JSON result to a file")
+    parser.add_argument("--compare", type=Path, help="earlier JSON result to compare with")
+    args = parser.parse_args()
+
+    result = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "params": {
+                key: getattr(args, key)
+                for key in ("polls", "rounds", "min_time", "zones", "latency", "seed")
+            },
+        },
+        "results": asyncio.run(async_run(args)),
+    }
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), result)
+    elif not args.output:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,23 @@ import logging
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-
-from .const import DOMAIN, CONF_SLAVE_ID
-from .coordinator import JablotronFuturaCoordinator
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    DOMAIN,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SLAVE_ID,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+)
+from .cache import CACHED_REGISTERS, JablotronFuturaCache
+from .coordinator import JablotronFuturaCoordinator, unique_id_prefix
+from .services import async_setup_services, async_unload_services
+from .transport import ModbusEndpoint
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,28 +35,91 @@ PLATFORMS: list[Platform] = [
 ]
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry."""
+    if entry.version > 1:
+        return False
+
+    if entry.minor_version < 2:
+        # Unique IDs gained the slave ID, units behind one gateway collided
+        host = ModbusEndpoint.from_entry_data(entry.data).host
+        await er.async_migrate_entries(
+            hass,
+            entry.entry_id,
+            lambda entity_entry: migrate_unique_id(
+                entity_entry, host, entry.data[CONF_SLAVE_ID]
+            ),
+        )
+        hass.config_entries.async_update_entry(entry, minor_version=2)
+        _LOGGER.debug("Migrated %s to version 1.2", entry.title)
+
+    return True
+
+
+@callback
+def migrate_unique_id(
+    entity_entry: er.RegistryEntry, host: str, slave_id: int
+) -> dict[str, str] | None:
+    """Return the new unique ID of an entity from before version 1.2."""
+    prefix = unique_id_prefix(host, slave_id)
+    unique_id = entity_entry.unique_id
+    if unique_id.startswith(f"{prefix}_") or not unique_id.startswith(f"{host}_"):
+        return None
+    return {"new_unique_id": f"{prefix}_{unique_id[len(host) + 1:]}"}
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Jablotron Futura from a config entry."""
-    host = entry.data[CONF_HOST]
-    port = entry.data[CONF_PORT]
+    endpoint = ModbusEndpoint.from_entry_data(entry.data)
     slave_id = entry.data[CONF_SLAVE_ID]
 
     coordinator = JablotronFuturaCoordinator(
         hass=hass,
-        host=host,
-        port=port,
+        endpoint=endpoint,
         slave_id=slave_id,
+        min_interval=entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+        max_interval=entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
     )
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as ex:
-        _LOGGER.error("Unable to connect to Jablotron Futura: %s", ex)
-        raise ConfigEntryNotReady from ex
+    # With a cached identity the entities are set up right away and the first
+    # poll runs in the background
+    cache = JablotronFuturaCache(hass, entry.entry_id)
+    if (cached := await cache.async_load()) is not None:
+        coordinator.async_seed(cached)
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception as ex:
+            _LOGGER.error("Unable to connect to Jablotron Futura: %s", ex)
+            await coordinator.async_close()
+            raise ConfigEntryNotReady from ex
+
+    @callback
+    def async_revalidate_cache() -> None:
+        """Cache the identity and reload when the capabilities changed."""
+        if not coordinator.last_update_success or not cache.async_update(coordinator.data):
+            return
+        _LOGGER.info("Capabilities of %s changed, reloading", coordinator.endpoint)
+        cache.loaded = None
+        hass.async_create_task(_async_reload_with_cache(hass, entry, cache))
+
+    entry.async_on_unload(
+        coordinator.async_add_listener(async_revalidate_cache, frozenset(CACHED_REGISTERS))
+    )
+    # Cache what a cold start has just read
+    async_revalidate_cache()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    async_setup_services(hass)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if cached is not None:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+
+    # New poll interval bounds take effect on reload
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
@@ -53,12 +127,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_close()
+        async_unload_services(hass)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the cached identity of a removed unit."""
+    await JablotronFuturaCache(hass, entry.entry_id).async_remove()
+
+
+async def _async_reload_with_cache(
+    hass: HomeAssistant, entry: ConfigEntry, cache: JablotronFuturaCache
+) -> None:
+    """Write the changed capabilities and set the entities up again."""
+    await cache.async_save()
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
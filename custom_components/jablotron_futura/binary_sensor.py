@@ -26,6 +26,7 @@ from .const import (
     ZONE_BITS,
 )
 from .coordinator import JablotronFuturaCoordinator
+from .snapshot import SLOTS, STATUS_FLAGS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,10 +80,11 @@ class JablotronFuturaBaseBinarySensor(CoordinatorEntity, BinarySensorEntity):
         name: str,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset({sensor_key}))
         self._sensor_key = sensor_key
+        self._slot = SLOTS[sensor_key]
         
-        self._attr_unique_id = f"{coordinator.host}_{sensor_key}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{sensor_key}"
         self._attr_name = name
 
 
@@ -98,12 +100,13 @@ class JablotronFuturaModeBinarySensor(JablotronFuturaBaseBinarySensor):
         """Initialize the mode sensor."""
         super().__init__(coordinator, f"mode_{name}", f"Mode: {name.replace('_', ' ').title()}")
         self._bit = bit
+        self._flag = STATUS_FLAGS[self._sensor_key]
         self._attr_icon = "mdi:information"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the mode is active."""
-        return self.coordinator.data.get(f"mode_{MODE_BITS[self._bit]}", False)
+        return self.coordinator.data.bit(*self._flag)
 
 
 class JablotronFuturaErrorBinarySensor(JablotronFuturaBaseBinarySensor):
@@ -118,13 +121,14 @@ class JablotronFuturaErrorBinarySensor(JablotronFuturaBaseBinarySensor):
         """Initialize the error sensor."""
         super().__init__(coordinator, f"error_{name}", f"Error: {name.replace('_', ' ').title()}")
         self._bit = bit
+        self._flag = STATUS_FLAGS[self._sensor_key]
         self._attr_device_class = BinarySensorDeviceClass.PROBLEM
         self._attr_icon = "mdi:alert"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the error is active."""
-        return self.coordinator.data.get(f"error_{ERROR_BITS[self._bit]}", False)
+        return self.coordinator.data.bit(*self._flag)
 
 
 class JablotronFuturaWarningBinarySensor(JablotronFuturaBaseBinarySensor):
@@ -139,13 +143,14 @@ class JablotronFuturaWarningBinarySensor(JablotronFuturaBaseBinarySensor):
         """Initialize the warning sensor."""
         super().__init__(coordinator, f"warning_{name}", f"Warning: {name.replace('_', ' ').title()}")
         self._bit = bit
+        self._flag = STATUS_FLAGS[self._sensor_key]
         self._attr_device_class = BinarySensorDeviceClass.PROBLEM
         self._attr_icon = "mdi:alert-outline"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the warning is active."""
-        return self.coordinator.data.get(f"warning_{WARNING_BITS[self._bit]}", False)
+        return self.coordinator.data.bit(*self._flag)
 
 
 class JablotronFuturaConfigBinarySensor(JablotronFuturaBaseBinarySensor):
@@ -160,14 +165,14 @@ class JablotronFuturaConfigBinarySensor(JablotronFuturaBaseBinarySensor):
         """Initialize the config sensor."""
         super().__init__(coordinator, f"config_{name}", f"Capability: {name.replace('_', ' ').title()}")
         self._bit = bit
+        self._flag = STATUS_FLAGS[self._sensor_key]
         self._attr_icon = "mdi:feature-search"
         self._attr_entity_category = "diagnostic"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the capability is available."""
-        device_config = self.coordinator.data.get("device_config", 0)
-        return bool(device_config & (1 << self._bit)) if device_config is not None else None
+        return self.coordinator.data.bit(*self._flag)
 
 
 class JablotronFuturaZoneBinarySensor(JablotronFuturaBaseBinarySensor):
@@ -182,14 +187,14 @@ class JablotronFuturaZoneBinarySensor(JablotronFuturaBaseBinarySensor):
         """Initialize the zone sensor."""
         super().__init__(coordinator, f"zone_{name}", f"Zone: {name.replace('_', ' ').title()}")
         self._bit = bit
+        self._flag = STATUS_FLAGS[self._sensor_key]
         self._attr_icon = "mdi:home-outline"
         self._attr_entity_category = "diagnostic"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the zone is configured."""
-        zone_config = self.coordinator.data.get("vzv_identify", 0)
-        return bool(zone_config & (1 << self._bit)) if zone_config is not None else None
+        return self.coordinator.data.bit(*self._flag)
 
 
 class JablotronFuturaZoneButtonPresenceSensor(JablotronFuturaBaseBinarySensor):
@@ -209,7 +214,7 @@ class JablotronFuturaZoneButtonPresenceSensor(JablotronFuturaBaseBinarySensor):
     @property
     def is_on(self) -> bool | None:
         """Return true if the zone button is present."""
-        return bool(self.coordinator.data.get(f"zone_{self._zone}_button_present", False))
+        return bool(self.coordinator.data.value(self._slot))
 
 
 class JablotronFuturaZoneButtonActiveSensor(JablotronFuturaBaseBinarySensor):
@@ -228,7 +233,7 @@ class JablotronFuturaZoneButtonActiveSensor(JablotronFuturaBaseBinarySensor):
     @property
     def is_on(self) -> bool | None:
         """Return true if the zone button is active."""
-        return bool(self.coordinator.data.get(f"zone_{self._zone}_button_active", False))
+        return bool(self.coordinator.data.value(self._slot))
 
 
 class JablotronFuturaSensorPresenceSensor(JablotronFuturaBaseBinarySensor):
@@ -248,5 +253,5 @@ class JablotronFuturaSensorPresenceSensor(JablotronFuturaBaseBinarySensor):
     @property
     def is_on(self) -> bool | None:
         """Return true if the zone sensors are present."""
-        return bool(self.coordinator.data.get(f"zone_{self._zone}_sensors_present", False))
+        return bool(self.coordinator.data.value(self._slot))
 
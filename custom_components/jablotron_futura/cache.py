@@ -0,0 +1,97 @@
+"""Persisted identity and capabilities of Jablotron Futura units."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CACHE_SAVE_DELAY,
+    CACHE_STORAGE_VERSION,
+    DOMAIN,
+    HOLDING_REGISTERS,
+    INPUT_REGISTERS,
+    TIER_STATIC,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Identity (the static tier) and the registers platform setup decides on
+CACHED_REGISTERS = tuple(
+    name
+    for registers in (INPUT_REGISTERS, HOLDING_REGISTERS)
+    for name, config in registers.items()
+    if config.get("tier") == TIER_STATIC or name.endswith("_present")
+)
+# A change of these changes which entities exist
+CAPABILITY_REGISTERS = ("regmap_version", "device_variant", "device_config") + tuple(
+    name for name in CACHED_REGISTERS if name.endswith("_present")
+)
+REQUIRED_REGISTERS = ("serial_number", "regmap_version", "device_config")
+
+
+class JablotronFuturaCache:
+    """Identity and capabilities of a unit from its last successful polls.
+
+    Lets the entities be set up before the first poll. The cache is checked
+    against every poll; when the capabilities, or the register map version
+    they depend on, differ from those the entities were set up with, the
+    entities are out of date.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache of a config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, CACHE_STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self.values: dict[str, Any] | None = None
+        # The values the entities were set up with, None until they are known
+        self.loaded: dict[str, Any] | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the cached values, None if there are none or they are unusable."""
+        stored = await self._store.async_load()
+        registers = stored.get("registers") if isinstance(stored, dict) else None
+        if not isinstance(registers, dict):
+            return None
+        values = {name: registers.get(name) for name in CACHED_REGISTERS}
+        if any(values[name] is None for name in REQUIRED_REGISTERS):
+            _LOGGER.debug("Ignoring incomplete cached identity: %s", registers)
+            return None
+        self.values = self.loaded = values
+        return values
+
+    def async_update(self, data: Mapping[str, Any]) -> bool:
+        """Cache the values of a poll.
+
+        Returns True if the capabilities differ from those the entities were
+        set up with: the cached ones, or after a cold start those of the
+        first complete poll.
+        """
+        values = {name: data.get(name) for name in CACHED_REGISTERS}
+        if any(values[name] is None for name in REQUIRED_REGISTERS):
+            # The identity block was not read yet
+            return False
+        if values != self.values:
+            self.values = values
+            self._store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+        if self.loaded is None:
+            self.loaded = values
+            return False
+        return any(self.loaded[name] != values[name] for name in CAPABILITY_REGISTERS)
+
+    async def async_save(self) -> None:
+        """Write the cached values now."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the cache."""
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"registers": self.values}
+
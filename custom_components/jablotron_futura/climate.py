@@ -6,6 +6,7 @@
 """Support for Jablotron Futura climate entity."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -51,9 +52,19 @@ class JablotronFuturaClimate(CoordinatorEntity, ClimateEntity):
 
     def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            frozenset({
+                "temp_fresh",
+                "temp_setpoint",
+                "ventilation_level",
+                "heating_enable",
+                "cooling_enable",
+                "mode_device_on",
+            }),
+        )
         
-        self._attr_unique_id = f"{coordinator.host}_climate"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_climate"
         self._attr_name = "Futura Climate"
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_icon = "mdi:thermostat"
@@ -193,8 +204,11 @@ class JablotronFuturaClimate(CoordinatorEntity, ClimateEntity):
         heating_addr = HOLDING_REGISTERS["heating_enable"]["address"]
         cooling_addr = HOLDING_REGISTERS["cooling_enable"]["address"]
         
-        await self.coordinator.async_write_register(heating_addr, int(heating))
-        await self.coordinator.async_write_register(cooling_addr, int(cooling))
+        # Issued together so the write buffer sends both in one transaction
+        await asyncio.gather(
+            self.coordinator.async_write_register(heating_addr, int(heating)),
+            self.coordinator.async_write_register(cooling_addr, int(cooling)),
+        )
 
 
 class JablotronFuturaCoolBreezeClimate(CoordinatorEntity, ClimateEntity):
@@ -202,9 +216,20 @@ class JablotronFuturaCoolBreezeClimate(CoordinatorEntity, ClimateEntity):
 
     def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
         """Initialize the CoolBreeze climate entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            frozenset({
+                "config_coolbreeze_supported",
+                "error_coolbreeze_comm_error",
+                "temp_fresh",
+                "temp_setpoint",
+                "heating_enable",
+                "cooling_enable",
+                "mode_device_on",
+            }),
+        )
         
-        self._attr_unique_id = f"{coordinator.host}_coolbreeze_climate"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_coolbreeze_climate"
         self._attr_name = "CoolBreeze Climate"
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_icon = "mdi:heat-pump"
@@ -304,8 +329,11 @@ class JablotronFuturaCoolBreezeClimate(CoordinatorEntity, ClimateEntity):
         heating_addr = HOLDING_REGISTERS["heating_enable"]["address"]
         cooling_addr = HOLDING_REGISTERS["cooling_enable"]["address"]
         
-        heating_success = await self.coordinator.async_write_register(heating_addr, int(heating))
-        cooling_success = await self.coordinator.async_write_register(cooling_addr, int(cooling))
+        # Issued together so the write buffer sends both in one transaction
+        heating_success, cooling_success = await asyncio.gather(
+            self.coordinator.async_write_register(heating_addr, int(heating)),
+            self.coordinator.async_write_register(cooling_addr, int(cooling)),
+        )
         
         if not heating_success:
             _LOGGER.error("Failed to set CoolBreeze heating to %s", heating)
@@ -5,20 +5,52 @@ import logging
 from typing import Any
 
 import voluptuous as vol
-from pymodbus.client import ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import CONF_SLAVE_ID, DEFAULT_NAME, DEFAULT_PORT, DEFAULT_SLAVE_ID, DOMAIN
+from .const import (
+    BAUDRATES,
+    CONF_BAUDRATE,
+    CONF_BYTESIZE,
+    CONF_DEVICE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PARITY,
+    CONF_SLAVE_ID,
+    CONF_STOPBITS,
+    CONF_TRANSPORT,
+    DEFAULT_BAUDRATE,
+    DEFAULT_BYTESIZE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_NAME,
+    DEFAULT_PARITY,
+    DEFAULT_PORT,
+    DEFAULT_SLAVE_ID,
+    DEFAULT_STOPBITS,
+    DOMAIN,
+    PARITIES,
+    TRANSPORT_RTU_OVER_TCP,
+    TRANSPORT_SERIAL,
+    TRANSPORT_TCP,
+    TRANSPORTS,
+)
+from .hub import (
+    async_conflicting_endpoint,
+    async_get_slave_session,
+    async_release_slave_session,
+)
+from .session import CONNECTION_ERRORS
+from .transport import ModbusEndpoint
 
 _LOGGER = logging.getLogger(__name__)
 
-STEP_USER_DATA_SCHEMA = vol.Schema(
+STEP_NETWORK_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
         vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
@@ -27,28 +59,44 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_SERIAL_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE): str,
+        vol.Required(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(BAUDRATES),
+        vol.Required(CONF_PARITY, default=DEFAULT_PARITY): vol.In(PARITIES),
+        vol.Required(CONF_STOPBITS, default=DEFAULT_STOPBITS): vol.In([1, 2]),
+        vol.Required(CONF_BYTESIZE, default=DEFAULT_BYTESIZE): vol.In([7, 8]),
+        vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): int,
+        vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
+    }
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
-    Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
+    Data has the keys from STEP_NETWORK_DATA_SCHEMA or STEP_SERIAL_DATA_SCHEMA
+    with values provided by the user, and the transport.
     """
-    host = data[CONF_HOST]
-    port = data[CONF_PORT]
+    endpoint = ModbusEndpoint.from_entry_data(data)
     slave_id = data[CONF_SLAVE_ID]
 
-    # Test the connection
-    client = ModbusTcpClient(host=host, port=port, timeout=10)
+    # Units behind one gateway or bus share its connection and its settings
+    if (existing := async_conflicting_endpoint(hass, endpoint)) is not None:
+        _LOGGER.error(
+            "Units on %s are already configured with other settings: %r",
+            endpoint.key,
+            existing,
+        )
+        raise EndpointConflict("Endpoint settings conflict with a configured unit")
+
+    # Test the connection through the hub, so units already running on the
+    # same gateway or bus are not disturbed by a second connection
+    unit = async_get_slave_session(hass, endpoint, slave_id)
     
     try:
-        connection = await hass.async_add_executor_job(client.connect)
-        if not connection:
-            raise CannotConnect("Unable to connect to Modbus TCP")
-        
         # Try to read device ID to verify it's a Jablotron Futura
-        result = await hass.async_add_executor_job(
-            client.read_input_registers, 0, 1, slave_id
-        )
+        result = await unit.async_read_input_registers(0, 1)
         
         if result.isError():
             raise CannotConnect("Unable to read from device")
@@ -58,25 +106,24 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
             _LOGGER.warning("Device ID %d doesn't match Jablotron Futura (39)", device_id)
         
         # Read serial number for unique ID
-        result = await hass.async_add_executor_job(
-            client.read_input_registers, 1, 2, slave_id
-        )
+        result = await unit.async_read_input_registers(1, 2)
         
         if result.isError():
             raise CannotConnect("Unable to read serial number")
             
         serial_number = (result.registers[0] << 16) | result.registers[1]
         
-    except ModbusException as ex:
+    except (ModbusException, *CONNECTION_ERRORS) as ex:
         _LOGGER.error("Error connecting to Jablotron Futura: %s", ex)
         raise CannotConnect("Connection error") from ex
     finally:
-        client.close()
+        async_release_slave_session(hass, unit)
 
     # Return info that you want to store in the config entry.
     return {
         "title": data[CONF_NAME],
         "serial_number": serial_number,
+        "endpoint": endpoint,
     }
 
 
@@ -84,39 +131,125 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Jablotron Futura."""
 
     VERSION = 1
+    MINOR_VERSION = 2
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Create the options flow."""
+        return OptionsFlowHandler(config_entry)
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=TRANSPORTS)
+
+    async def async_step_tcp(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a unit reached over Modbus TCP."""
+        return await self._async_step_transport(
+            TRANSPORT_TCP, STEP_NETWORK_DATA_SCHEMA, user_input
+        )
+
+    async def async_step_rtu_over_tcp(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a unit behind a transparent RTU to TCP converter."""
+        return await self._async_step_transport(
+            TRANSPORT_RTU_OVER_TCP, STEP_NETWORK_DATA_SCHEMA, user_input
+        )
+
+    async def async_step_serial(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a unit on an RS-485 adapter of this host."""
+        return await self._async_step_transport(
+            TRANSPORT_SERIAL, STEP_SERIAL_DATA_SCHEMA, user_input
+        )
+
+    async def _async_step_transport(
+        self,
+        transport: str,
+        schema: vol.Schema,
+        user_input: dict[str, Any] | None,
+    ) -> FlowResult:
+        """Validate and create an entry for one transport."""
         errors: dict[str, str] = {}
         
         if user_input is not None:
+            data = {CONF_TRANSPORT: transport, **user_input}
             try:
-                info = await validate_input(self.hass, user_input)
+                info = await validate_input(self.hass, data)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
+            except EndpointConflict:
+                errors["base"] = "endpoint_conflict"
             except InvalidAuth:
                 errors["base"] = "invalid_auth"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                # Create unique ID from host and serial number
-                unique_id = f"{user_input[CONF_HOST]}_{info['serial_number']}"
+                # Create unique ID from host (or serial device) and serial number
+                unique_id = f"{info['endpoint'].host}_{info['serial_number']}"
                 await self.async_set_unique_id(unique_id)
                 self._abort_if_unique_id_configured()
                 
-                return self.async_create_entry(title=info["title"], data=user_input)
+                return self.async_create_entry(title=info["title"], data=data)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id=transport,
+            data_schema=self.add_suggested_values_to_schema(schema, user_input),
+            errors=errors,
+        )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle the poll interval bounds of Jablotron Futura."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors["base"] = "invalid_interval_bounds"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+                ): vol.All(int, vol.Range(min=1, max=3600)),
+                vol.Required(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+                ): vol.All(int, vol.Range(min=1, max=3600)),
+            }
         )
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
 
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
 
+class EndpointConflict(HomeAssistantError):
+    """Error to indicate the endpoint is in use with other settings."""
+
+
 class InvalidAuth(HomeAssistantError):
     """Error to indicate there is invalid auth."""
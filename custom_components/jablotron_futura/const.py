@@ -9,18 +9,54 @@ DEFAULT_SLAVE_ID = 1
 
 # Configuration constants
 CONF_SLAVE_ID = "slave_id"
+CONF_TRANSPORT = "transport"
+CONF_DEVICE = "device"
+CONF_BAUDRATE = "baudrate"
+CONF_PARITY = "parity"
+CONF_STOPBITS = "stopbits"
+CONF_BYTESIZE = "bytesize"
+
+# Modbus transports; entries without CONF_TRANSPORT use Modbus TCP
+TRANSPORT_TCP = "tcp"
+TRANSPORT_RTU_OVER_TCP = "rtu_over_tcp"  # transparent RS-485 to Ethernet converter
+TRANSPORT_SERIAL = "serial"  # RS-485 adapter on this host
+TRANSPORTS = [TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP, TRANSPORT_SERIAL]
+
+DEFAULT_BAUDRATE = 19200
+DEFAULT_PARITY = "N"
+DEFAULT_STOPBITS = 1
+DEFAULT_BYTESIZE = 8
+BAUDRATES = [9600, 19200, 38400, 57600, 115200]
+PARITIES = ["N", "E", "O"]
+
+# hass.data[DOMAIN] key of the Modbus hubs, keyed by "host:port", next to the
+# coordinators keyed by config entry ID
+DATA_HUBS = "hubs"
+
+# Polling tiers, assigned per register with the "tier" key (default: fast)
+TIER_STATIC = "static"  # read once per Modbus session and every STATIC_SCAN_INTERVAL
+TIER_SLOW = "slow"  # read every SLOW_SCAN_INTERVAL
+TIER_FAST = "fast"  # read every SCAN_INTERVAL
+TIERS = (TIER_STATIC, TIER_SLOW, TIER_FAST)
+
+# Registers of optional hardware carry a "requires" key naming the capability
+# (config_*) or presence key that must be set for the register to be polled.
+# Timers the unit counts down by itself carry "countdown": True.
+# Jittery measurements carry a "deadband": the smallest change worth a new
+# state, optionally widened by "hysteresis" when the direction reverses. A
+# state is still published after "max_silence" seconds (DEFAULT_MAX_SILENCE).
 
 # Input Registry - Read Only
 INPUT_REGISTERS = {
     # Device info
-    "device_id": {"address": 0, "type": "uint16", "name": "Device ID"},
-    "serial_number": {"address": 1, "type": "uint32", "name": "Serial Number"},
-    "mac_address": {"address": 3, "type": "uint16", "count": 3, "name": "MAC Address"},
-    "hw_version": {"address": 6, "type": "uint32", "name": "Hardware Version"},
-    "fw_version": {"address": 8, "type": "uint32", "name": "Firmware Version"},
-    "regmap_version": {"address": 12, "type": "uint32", "name": "Register Map Version"},
-    "device_variant": {"address": 14, "type": "uint16", "name": "Device Variant"},
-    "device_config": {"address": 15, "type": "uint16", "name": "Device Configuration"},
+    "device_id": {"address": 0, "type": "uint16", "name": "Device ID", "tier": TIER_STATIC},
+    "serial_number": {"address": 1, "type": "uint32", "name": "Serial Number", "tier": TIER_STATIC},
+    "mac_address": {"address": 3, "type": "uint16", "count": 3, "name": "MAC Address", "tier": TIER_STATIC},
+    "hw_version": {"address": 6, "type": "uint32", "name": "Hardware Version", "tier": TIER_STATIC},
+    "fw_version": {"address": 8, "type": "uint32", "name": "Firmware Version", "tier": TIER_STATIC},
+    "regmap_version": {"address": 12, "type": "uint32", "name": "Register Map Version", "tier": TIER_STATIC},
+    "device_variant": {"address": 14, "type": "uint16", "name": "Device Variant", "tier": TIER_STATIC},
+    "device_config": {"address": 15, "type": "uint16", "name": "Device Configuration", "tier": TIER_STATIC},
     
     # Status and mode
     "current_mode": {"address": 16, "type": "uint32", "name": "Current Mode"},
@@ -28,39 +64,39 @@ INPUT_REGISTERS = {
     "warnings": {"address": 20, "type": "uint32", "name": "Warnings"},
     
     # Temperatures (0.1°C)
-    "temp_ambient": {"address": 30, "type": "int16", "scale": 0.1, "unit": "°C", "name": "Outdoor Air Temperature"},
-    "temp_fresh": {"address": 31, "type": "int16", "scale": 0.1, "unit": "°C", "name": "Supply Air Temperature"},
-    "temp_indoor": {"address": 32, "type": "int16", "scale": 0.1, "unit": "°C", "name": "Extract Air Temperature"},
-    "temp_waste": {"address": 33, "type": "int16", "scale": 0.1, "unit": "°C", "name": "Exhaust Air Temperature"},
-    "temp_external_ntc": {"address": 38, "type": "int16", "scale": 0.1, "unit": "°C", "name": "External NTC Temperature"},
+    "temp_ambient": {"address": 30, "type": "int16", "scale": 0.1, "unit": "°C", "name": "Outdoor Air Temperature", "deadband": 0.2, "hysteresis": 0.1},
+    "temp_fresh": {"address": 31, "type": "int16", "scale": 0.1, "unit": "°C", "name": "Supply Air Temperature", "deadband": 0.2, "hysteresis": 0.1},
+    "temp_indoor": {"address": 32, "type": "int16", "scale": 0.1, "unit": "°C", "name": "Extract Air Temperature", "deadband": 0.2, "hysteresis": 0.1},
+    "temp_waste": {"address": 33, "type": "int16", "scale": 0.1, "unit": "°C", "name": "Exhaust Air Temperature", "deadband": 0.2, "hysteresis": 0.1},
+    "temp_external_ntc": {"address": 38, "type": "int16", "scale": 0.1, "unit": "°C", "name": "External NTC Temperature", "deadband": 0.2, "hysteresis": 0.1},
     
     # Humidity (0.1%)
-    "humidity_ambient": {"address": 34, "type": "int16", "scale": 0.1, "unit": "%", "name": "Outdoor Air Humidity"},
-    "humidity_fresh": {"address": 35, "type": "int16", "scale": 0.1, "unit": "%", "name": "Supply Air Humidity"},
-    "humidity_indoor": {"address": 36, "type": "int16", "scale": 0.1, "unit": "%", "name": "Extract Air Humidity"},
-    "humidity_waste": {"address": 37, "type": "int16", "scale": 0.1, "unit": "%", "name": "Exhaust Air Humidity"},
+    "humidity_ambient": {"address": 34, "type": "int16", "scale": 0.1, "unit": "%", "name": "Outdoor Air Humidity", "deadband": 1.0, "hysteresis": 0.5},
+    "humidity_fresh": {"address": 35, "type": "int16", "scale": 0.1, "unit": "%", "name": "Supply Air Humidity", "deadband": 1.0, "hysteresis": 0.5},
+    "humidity_indoor": {"address": 36, "type": "int16", "scale": 0.1, "unit": "%", "name": "Extract Air Humidity", "deadband": 1.0, "hysteresis": 0.5},
+    "humidity_waste": {"address": 37, "type": "int16", "scale": 0.1, "unit": "%", "name": "Exhaust Air Humidity", "deadband": 1.0, "hysteresis": 0.5},
     
     # Performance
     "filter_wear_level": {"address": 40, "type": "uint16", "unit": "%", "name": "Filter Wear Level"},
-    "power_consumption": {"address": 41, "type": "uint16", "unit": "W", "name": "Power Consumption"},
-    "heat_recovery": {"address": 42, "type": "uint16", "unit": "W", "name": "Heat Recovery"},
-    "heating_power": {"address": 43, "type": "uint16", "unit": "W", "name": "Heating Power"},
-    "air_flow": {"address": 44, "type": "uint16", "unit": "m³/h", "name": "Air Flow"},
+    "power_consumption": {"address": 41, "type": "uint16", "unit": "W", "name": "Power Consumption", "deadband": 5},
+    "heat_recovery": {"address": 42, "type": "uint16", "unit": "W", "name": "Heat Recovery", "deadband": 10},
+    "heating_power": {"address": 43, "type": "uint16", "unit": "W", "name": "Heating Power", "deadband": 10},
+    "air_flow": {"address": 44, "type": "uint16", "unit": "m³/h", "name": "Air Flow", "deadband": 5},
     
     # Fans
     "fan_supply_pwm": {"address": 45, "type": "uint16", "unit": "%", "name": "Supply Fan PWM"},
     "fan_exhaust_pwm": {"address": 46, "type": "uint16", "unit": "%", "name": "Exhaust Fan PWM"},
-    "fan_supply_rpm": {"address": 47, "type": "uint16", "unit": "rpm", "name": "Supply Fan RPM"},
-    "fan_exhaust_rpm": {"address": 48, "type": "uint16", "unit": "rpm", "name": "Exhaust Fan RPM"},
+    "fan_supply_rpm": {"address": 47, "type": "uint16", "unit": "rpm", "name": "Supply Fan RPM", "deadband": 30, "hysteresis": 10},
+    "fan_exhaust_rpm": {"address": 48, "type": "uint16", "unit": "rpm", "name": "Exhaust Fan RPM", "deadband": 30, "hysteresis": 10},
     
     # Inputs
-    "voltage_uin1": {"address": 49, "type": "uint16", "scale": 0.001, "unit": "V", "name": "UIN1 Voltage"},
-    "voltage_uin2": {"address": 50, "type": "uint16", "scale": 0.001, "unit": "V", "name": "UIN2 Voltage"},
+    "voltage_uin1": {"address": 49, "type": "uint16", "scale": 0.001, "unit": "V", "name": "UIN1 Voltage", "deadband": 0.05},
+    "voltage_uin2": {"address": 50, "type": "uint16", "scale": 0.001, "unit": "V", "name": "UIN2 Voltage", "deadband": 0.05},
     "digital_inputs": {"address": 51, "type": "uint16", "name": "Digital Inputs"},
-    "battery_voltage": {"address": 52, "type": "uint16", "scale": 0.001, "unit": "V", "name": "RTC Battery Voltage"},
+    "battery_voltage": {"address": 52, "type": "uint16", "scale": 0.001, "unit": "V", "name": "RTC Battery Voltage", "deadband": 0.02},
     
     # Zone identification
-    "vzv_identify": {"address": 80, "type": "uint16", "name": "Zone Identification"},
+    "vzv_identify": {"address": 80, "type": "uint16", "name": "Zone Identification", "requires": "config_variobreeze_supported"},
 }
 
 # Holding Registry - Read/Write
@@ -69,19 +105,19 @@ HOLDING_REGISTERS = {
     "ventilation_level": {"address": 0, "type": "uint16", "name": "Ventilation Level", "min": 0, "max": 6},
     
     # Functions with timers (seconds)
-    "boost_time": {"address": 1, "type": "uint16", "unit": "s", "name": "Boost Time", "min": 0, "max": 7200},
-    "circulation_time": {"address": 2, "type": "uint16", "unit": "s", "name": "Circulation Time", "min": 0, "max": 7200},
-    "overpressure_time": {"address": 3, "type": "uint16", "unit": "s", "name": "Overpressure Time", "min": 0, "max": 7200},
-    "night_time": {"address": 4, "type": "uint16", "unit": "s", "name": "Night Mode Time", "min": 0, "max": 7200},
-    "party_time": {"address": 5, "type": "uint16", "unit": "s", "name": "Party Time", "min": 0, "max": 28800},
+    "boost_time": {"address": 1, "type": "uint16", "unit": "s", "name": "Boost Time", "min": 0, "max": 7200, "countdown": True},
+    "circulation_time": {"address": 2, "type": "uint16", "unit": "s", "name": "Circulation Time", "min": 0, "max": 7200, "countdown": True},
+    "overpressure_time": {"address": 3, "type": "uint16", "unit": "s", "name": "Overpressure Time", "min": 0, "max": 7200, "countdown": True},
+    "night_time": {"address": 4, "type": "uint16", "unit": "s", "name": "Night Mode Time", "min": 0, "max": 7200, "countdown": True},
+    "party_time": {"address": 5, "type": "uint16", "unit": "s", "name": "Party Time", "min": 0, "max": 28800, "countdown": True},
     
     # Holiday mode
-    "holiday_begin": {"address": 6, "type": "uint32", "name": "Holiday Begin", "timestamp": True},
-    "holiday_end": {"address": 8, "type": "uint32", "name": "Holiday End", "timestamp": True},
+    "holiday_begin": {"address": 6, "type": "uint32", "name": "Holiday Begin", "timestamp": True, "tier": TIER_SLOW},
+    "holiday_end": {"address": 8, "type": "uint32", "name": "Holiday End", "timestamp": True, "tier": TIER_SLOW},
     
     # Temperature and humidity settings
-    "temp_setpoint": {"address": 10, "type": "uint16", "scale": 0.1, "unit": "°C", "name": "Temperature Setpoint", "min": 10, "max": 30},
-    "humidity_setpoint": {"address": 11, "type": "uint16", "scale": 0.001, "unit": "%", "name": "Humidity Setpoint", "min": 25, "max": 75},
+    "temp_setpoint": {"address": 10, "type": "uint16", "scale": 0.1, "unit": "°C", "name": "Temperature Setpoint", "min": 10, "max": 30, "tier": TIER_SLOW},
+    "humidity_setpoint": {"address": 11, "type": "uint16", "scale": 0.001, "unit": "%", "name": "Humidity Setpoint", "min": 25, "max": 75, "tier": TIER_SLOW},
     
     # Control enables
     "time_program_enable": {"address": 12, "type": "uint16", "name": "Time Program Enable"},
@@ -92,34 +128,36 @@ HOLDING_REGISTERS = {
     "comfort_enable": {"address": 17, "type": "uint16", "name": "Comfort Control Enable"},
     
     # VarioBreeze control
-    "vb_coolbreeze_priority": {"address": 20, "type": "uint16", "name": "CoolBreeze Priority Control"},
-    "vb_kitchen_hood_normal": {"address": 21, "type": "uint16", "name": "Kitchen Hood Normally Open"},
-    "vb_boost_volume": {"address": 22, "type": "uint16", "unit": "m³/h", "name": "Zone Boost Volume", "min": 50, "max": 150},
-    "vb_kitchen_hood_volume": {"address": 23, "type": "uint16", "unit": "m³/h", "name": "Kitchen Hood Volume", "min": 50, "max": 150},
+    "vb_coolbreeze_priority": {"address": 20, "type": "uint16", "name": "CoolBreeze Priority Control", "tier": TIER_SLOW},
+    "vb_kitchen_hood_normal": {"address": 21, "type": "uint16", "name": "Kitchen Hood Normally Open", "tier": TIER_SLOW},
+    "vb_boost_volume": {"address": 22, "type": "uint16", "unit": "m³/h", "name": "Zone Boost Volume", "min": 50, "max": 150, "tier": TIER_SLOW},
+    "vb_kitchen_hood_volume": {"address": 23, "type": "uint16", "unit": "m³/h", "name": "Kitchen Hood Volume", "min": 50, "max": 150, "tier": TIER_SLOW},
 }
 
 # Zone External Sensors (Zones 1-8)
 ZONE_SENSOR_REGISTERS = {}
 for zone in range(1, 9):
     base_addr = 300 + (zone - 1) * 10
+    present = f"zone_{zone}_sensors_present"
     ZONE_SENSOR_REGISTERS.update({
-        f"zone_{zone}_sensors_present": {"address": base_addr, "type": "uint16", "name": f"Zone {zone} Sensors Present"},
-        f"zone_{zone}_sensors_invalidate": {"address": base_addr + 1, "type": "uint16", "name": f"Zone {zone} Sensors Invalidate"},
-        f"zone_{zone}_temperature": {"address": base_addr + 2, "type": "int16", "scale": 0.1, "unit": "°C", "name": f"Zone {zone} Temperature", "min": -20, "max": 100},
-        f"zone_{zone}_humidity": {"address": base_addr + 3, "type": "uint16", "unit": "%", "name": f"Zone {zone} Humidity", "min": 0, "max": 100},
-        f"zone_{zone}_co2": {"address": base_addr + 4, "type": "uint16", "unit": "ppm", "name": f"Zone {zone} CO2", "min": 0, "max": 10000},
-        f"zone_{zone}_floor_temperature": {"address": base_addr + 5, "type": "int16", "scale": 0.1, "unit": "°C", "name": f"Zone {zone} Floor Temperature", "min": -20, "max": 100},
+        present: {"address": base_addr, "type": "uint16", "name": f"Zone {zone} Sensors Present", "tier": TIER_SLOW, "requires": "config_variobreeze_supported"},
+        f"zone_{zone}_sensors_invalidate": {"address": base_addr + 1, "type": "uint16", "name": f"Zone {zone} Sensors Invalidate", "requires": present},
+        f"zone_{zone}_temperature": {"address": base_addr + 2, "type": "int16", "scale": 0.1, "unit": "°C", "name": f"Zone {zone} Temperature", "min": -20, "max": 100, "requires": present},
+        f"zone_{zone}_humidity": {"address": base_addr + 3, "type": "uint16", "unit": "%", "name": f"Zone {zone} Humidity", "min": 0, "max": 100, "requires": present},
+        f"zone_{zone}_co2": {"address": base_addr + 4, "type": "uint16", "unit": "ppm", "name": f"Zone {zone} CO2", "min": 0, "max": 10000, "requires": present},
+        f"zone_{zone}_floor_temperature": {"address": base_addr + 5, "type": "int16", "scale": 0.1, "unit": "°C", "name": f"Zone {zone} Floor Temperature", "min": -20, "max": 100, "requires": present},
     })
 
 # Zone External Buttons (Zones 1-8)  
 ZONE_BUTTON_REGISTERS = {}
 for zone in range(1, 9):
     base_addr = 400 + (zone - 1) * 10
+    present = f"zone_{zone}_button_present"
     ZONE_BUTTON_REGISTERS.update({
-        f"zone_{zone}_button_present": {"address": base_addr, "type": "uint16", "name": f"Zone {zone} Button Present"},
-        f"zone_{zone}_button_mode": {"address": base_addr + 1, "type": "uint16", "name": f"Zone {zone} Button Mode"},
-        f"zone_{zone}_button_timer": {"address": base_addr + 2, "type": "uint16", "unit": "s", "name": f"Zone {zone} Button Timer", "min": 0, "max": 10800},
-        f"zone_{zone}_button_active": {"address": base_addr + 3, "type": "uint16", "name": f"Zone {zone} Button Active"},
+        present: {"address": base_addr, "type": "uint16", "name": f"Zone {zone} Button Present", "tier": TIER_SLOW, "requires": "config_variobreeze_supported"},
+        f"zone_{zone}_button_mode": {"address": base_addr + 1, "type": "uint16", "name": f"Zone {zone} Button Mode", "tier": TIER_SLOW, "requires": present},
+        f"zone_{zone}_button_timer": {"address": base_addr + 2, "type": "uint16", "unit": "s", "name": f"Zone {zone} Button Timer", "min": 0, "max": 10800, "countdown": True, "requires": present},
+        f"zone_{zone}_button_active": {"address": base_addr + 3, "type": "uint16", "name": f"Zone {zone} Button Active", "requires": present},
     })
 
 # Combine all holding registers
@@ -251,3 +289,115 @@ DEVICE_VARIANTS = {
 }
 
 SCAN_INTERVAL = 30  # seconds
+SLOW_SCAN_INTERVAL = 300  # seconds
+# Catches modules (device_config) added while the session stays up
+STATIC_SCAN_INTERVAL = 3600  # seconds
+
+# Deadband filtering: longest time a suppressed change may stay unpublished
+DEFAULT_MAX_SILENCE = 900  # seconds
+
+# Adaptive poll interval, bounds configurable in the options flow
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL = 5  # seconds
+DEFAULT_MAX_SCAN_INTERVAL = 120  # seconds
+SCAN_INTERVAL_RELAX_FACTOR = 1.5  # growth per stable poll
+SCAN_INTERVAL_TIGHTEN_FACTOR = 0.5  # shrink per volatile poll
+# Modes during which the unit changes quickly
+ACTIVE_MODE_FLAGS = (
+    "mode_boost_active",
+    "mode_circulation_active",
+    "mode_overpressure_active",
+    "mode_party_active",
+    "mode_starting",
+    "mode_zone_boost",
+    "mode_pressure_loss_measurement",
+)
+# Change per minute above which a value counts as fast-moving, measured over
+# at least VOLATILITY_WINDOW so that sensor noise at short intervals does not
+# look like movement
+VOLATILITY_WINDOW = 60  # seconds
+VOLATILITY_THRESHOLDS = {
+    "temp_fresh": 0.5,
+    "temp_indoor": 0.5,
+    "humidity_indoor": 2.0,
+    **{f"zone_{zone}_temperature": 0.5 for zone in range(1, 9)},
+    **{f"zone_{zone}_co2": 50 for zone in range(1, 9)},
+}
+
+# Persistent Modbus session
+KEEPALIVE_IDLE = 60  # idle seconds before a request that cannot be resent probes first
+RECONNECT_BACKOFF_MIN = 1  # seconds
+RECONNECT_BACKOFF_MAX = 300  # seconds
+# Resends of a transaction that got no answer, each on a fresh connection
+MODBUS_RETRIES = 2
+
+# Upper bounds of the transaction latency histogram buckets, in milliseconds.
+# Roughly 25 % apart, so percentiles are estimated within that error.
+LATENCY_BUCKETS = tuple(round(0.5 * 1.25**index, 2) for index in range(48))
+
+# Writes issued within this many seconds are merged into as few PDUs as possible
+WRITE_COALESCE_WINDOW = 0.05
+# A full refresh after a burst of writes runs at most once per this many seconds
+WRITE_REFRESH_COOLDOWN = 10
+# An optimistic value no read has confirmed by then is rolled back
+WRITE_CONFIRM_TIMEOUT = 120  # seconds
+
+# Fired when an optimistically shown write is rolled back
+EVENT_WRITE_REJECTED = f"{DOMAIN}_write_rejected"
+
+# Persisted identity and capabilities, written at most this often
+CACHE_STORAGE_VERSION = 1
+CACHE_SAVE_DELAY = 10  # seconds
+
+# Poll cycles whose timing breakdown is kept for diagnostics
+POLL_TIMING_SIZE = 20
+
+# Read planning
+MAX_READ_REGISTERS = 125  # Modbus PDU limit for a single read request
+READ_GAP_THRESHOLD = 10  # unused registers bridged rather than issuing another request
+
+# Request planning and timing per transport. Over RTU every extra request
+# costs ~13 bytes of framing, two 3.5 character silences and the unit's
+# turnaround, about as long as two dozen more registers at 19200 baud, so
+# wider gaps are bridged. A corrupted frame on a noisy RS-485 line costs the
+# whole block, so serial blocks are kept shorter. frame_gap is the idle time
+# enforced between two frames (None: 3.5 characters at the baud rate), which
+# transparent converters need to tell frames apart.
+TRANSPORT_PROFILES = {
+    TRANSPORT_TCP: {
+        "timeout": 10,
+        "max_read_registers": MAX_READ_REGISTERS,
+        "read_gap": READ_GAP_THRESHOLD,
+        "frame_gap": 0.0,
+    },
+    TRANSPORT_RTU_OVER_TCP: {
+        "timeout": 3,
+        "max_read_registers": MAX_READ_REGISTERS,
+        "read_gap": 24,
+        "frame_gap": 0.02,
+    },
+    TRANSPORT_SERIAL: {
+        "timeout": 2,
+        "max_read_registers": 64,
+        "read_gap": 24,
+        "frame_gap": None,
+    },
+}
+RTU_MIN_FRAME_GAP = 0.00175  # seconds, fixed silence above 19200 baud
+
+# In-memory register history: 2880 samples cover 4 h at the minimum poll
+# interval. Per register that is 5.6 KiB for 16-bit values, plus 22.5 KiB of
+# timestamps shared by all registers.
+HISTORY_SIZE = 2880
+HISTORY_REGISTERS = tuple(
+    name
+    for name, config in INPUT_REGISTERS.items()
+    if "unit" in config
+) + tuple(
+    f"zone_{zone}_{field}"
+    for zone in range(1, 9)
+    for field in ("temperature", "humidity", "co2", "floor_temperature")
+)
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_PROFILE_POLL = "profile_poll"
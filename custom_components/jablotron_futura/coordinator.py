@@ -2,187 +2,469 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import logging
+import time
+from dataclasses import dataclass
+from collections.abc import Callable, Container, Mapping
 from datetime import timedelta
 from typing import Any
 
-from pymodbus.client import ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN,
-    SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     INPUT_REGISTERS,
+    MAX_READ_REGISTERS,
+    POLL_TIMING_SIZE,
+    SLOW_SCAN_INTERVAL,
+    STATIC_SCAN_INTERVAL,
+    READ_GAP_THRESHOLD,
+    TIER_FAST,
+    TIER_SLOW,
+    TIER_STATIC,
+    TIERS,
+    WRITE_CONFIRM_TIMEOUT,
+    WRITE_REFRESH_COOLDOWN,
+    EVENT_WRITE_REJECTED,
     HOLDING_REGISTERS,
-    MODE_BITS,
-    ERROR_BITS,
-    WARNING_BITS,
     CONFIG_BITS,
-    ZONE_BITS,
 )
+from .history import JablotronFuturaHistory
+from .interval import AdaptivePollInterval
+from .metrics import TransactionMetrics
+from .planner import (
+    READ_PLAN,
+    ReadBlock,
+    build_read_plan,
+    build_tiered_plan,
+    format_plan,
+    plan_keys,
+    plan_spans,
+    register_width,
+)
+from .hub import async_get_slave_session, async_release_slave_session
+from .session import CONNECTION_ERRORS
+from .snapshot import SLOTS, STATUS_BITFIELDS, Snapshot
+from .timing import PollTiming
+from .transport import ModbusEndpoint
+from .write_buffer import JablotronFuturaWriteBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
+# Optional-hardware registers and the key they require, capability bits first
+# so that presence flags are resolved before the registers that depend on them.
+REGISTER_REQUIREMENTS = dict(
+    sorted(
+        (
+            (name, config["requires"])
+            for registers in (INPUT_REGISTERS, HOLDING_REGISTERS)
+            for name, config in registers.items()
+            if "requires" in config
+        ),
+        key=lambda item: not item[1].startswith("config_"),
+    )
+)
+REGISTER_TIERS = {
+    name: config.get("tier", TIER_FAST)
+    for registers in (INPUT_REGISTERS, HOLDING_REGISTERS)
+    for name, config in registers.items()
+}
+KEY_BY_HOLDING_ADDRESS = {
+    config["address"]: name for name, config in HOLDING_REGISTERS.items()
+}
+CONFIG_BIT_BY_KEY = {f"config_{name}": bit for bit, name in CONFIG_BITS.items()}
+
+
+@dataclass
+class PendingWrite:
+    """Optimistic value of a written register awaiting confirmation."""
+
+    expected: Any
+    previous: Any
+    written_at: float
+    acked_at: float | None = None
+
+
+def unique_id_prefix(host: str, slave_id: int) -> str:
+    """Return the prefix of the unique IDs of a unit's entities.
+
+    Units behind one gateway share the host, so the slave ID is part of it.
+    """
+    return f"{host}_{slave_id}"
+
 
-class JablotronFuturaCoordinator(DataUpdateCoordinator):
+class JablotronFuturaCoordinator(DataUpdateCoordinator[Snapshot]):
     """Class to manage fetching data from the Jablotron Futura."""
 
     def __init__(
         self,
         hass: HomeAssistant,
-        host: str,
-        port: int,
+        endpoint: ModbusEndpoint,
         slave_id: int,
+        max_gap: int | None = None,
+        min_interval: float = DEFAULT_MIN_SCAN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_SCAN_INTERVAL,
     ) -> None:
         """Initialize."""
-        self.host = host
-        self.port = port
+        self.endpoint = endpoint
+        self.host = endpoint.host
         self.slave_id = slave_id
-        self._client = ModbusTcpClient(host=host, port=port, timeout=10)
-        
+        self.unique_id_prefix = unique_id_prefix(endpoint.host, slave_id)
+        # Units behind the same gateway or on the same bus share one connection
+        self._session = async_get_slave_session(hass, endpoint, slave_id)
+
+        # Poll interval adapted to device activity after every successful read
+        self.poll_interval = AdaptivePollInterval(min_interval, max_interval)
+        self._last_read_at: float | None = None
+
+        # Short-horizon history of numeric registers, one sample per poll
+        self.history = JablotronFuturaHistory()
+
+        # Minimal set of requests covering the register map, per polling tier,
+        # sized for the transport. Until the capabilities are known every
+        # register is read.
+        self._max_gap = endpoint.profile["read_gap"] if max_gap is None else max_gap
+        self._max_count = endpoint.profile["max_read_registers"]
+        if (self._max_gap, self._max_count) == (READ_GAP_THRESHOLD, MAX_READ_REGISTERS):
+            self.read_plan = READ_PLAN
+        else:
+            self.read_plan = build_tiered_plan(self._max_gap, self._max_count)
+        self._tier_keys = plan_keys(self.read_plan)
+        self._skipped_registers: frozenset[str] | None = None
+        # Raw words of every block as last read, by block name
+        self.raw_blocks: dict[str, list[int]] = {}
+        # Timing breakdown of the last successful poll cycles; the newest is
+        # completed by the listener dispatch that follows it
+        self.poll_timings: deque[PollTiming] = deque(maxlen=POLL_TIMING_SIZE)
+        self._pending_timing: PollTiming | None = None
+
+        self._readers = {
+            "input": self._session.async_read_input_registers,
+            "holding": self._session.async_read_holding_registers,
+        }
+        # When each tier was last read completely (None = due)
+        self._tier_read_at: dict[str, float | None] = {TIER_STATIC: None, TIER_SLOW: None}
+        self._static_session: int | None = None
+
+        # Each batch of writes is verified by reading back only the blocks it
+        # touched, the full refresh after a burst of writes is debounced
+        self._write_buffer = JablotronFuturaWriteBuffer(
+            hass, self._async_write_run, self._async_verify_writes
+        )
+        # Optimistic values shown until a read-back confirms them
+        self._pending_writes: dict[str, PendingWrite] = {}
+        self.write_confirmation_delay: float | None = None
+        self.write_confirmations = 0
+        self.write_rollbacks = 0
+
+        self._write_refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=WRITE_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+        # Listeners subscribed to data slots, and listeners that want every update
+        self._slot_listeners: dict[int, set[CALLBACK_TYPE]] = {}
+        self._unkeyed_listeners: set[CALLBACK_TYPE] = set()
+        self._notified_data: Snapshot | None = None
+        self._notified_success: bool | None = None
+        self.listeners_notified = 0
+        self.listeners_skipped = 0
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=SCAN_INTERVAL),
+            update_interval=timedelta(seconds=self.poll_interval.interval),
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates.
+
+        An entity passing a frozenset of data keys as its context is only
+        called back when one of those keys changes.
+        """
+        remove = super().async_add_listener(update_callback, context)
+        slots = [SLOTS[key] for key in context] if isinstance(context, frozenset) else []
+        for slot in slots:
+            self._slot_listeners.setdefault(slot, set()).add(remove)
+        if not slots:
+            self._unkeyed_listeners.add(remove)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove update listener."""
+            remove()
+            self._unkeyed_listeners.discard(remove)
+            for slot in slots:
+                self._slot_listeners[slot].discard(remove)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose data keys changed since the last update."""
+        timing, self._pending_timing = self._pending_timing, None
+        started = time.perf_counter()
+        self._async_notify_listeners()
+        if timing is not None:
+            timing.dispatch = time.perf_counter() - started
+
+    @callback
+    def _async_notify_listeners(self) -> None:
+        """Call back the listeners whose data keys changed."""
+        data, previous = self.data, self._notified_data
+        success_changed = self.last_update_success != self._notified_success
+        self._notified_data = data
+        self._notified_success = self.last_update_success
+
+        if data is None or previous is None or success_changed:
+            # Availability may have changed for everyone
+            self.listeners_notified += len(self._listeners)
+            super().async_update_listeners()
+            return
+
+        notify = set(self._unkeyed_listeners)
+        values, previous_values = data.values, previous.values
+        for slot, listeners in self._slot_listeners.items():
+            if listeners and values[slot] != previous_values[slot]:
+                notify |= listeners
+
+        self.listeners_notified += len(notify)
+        self.listeners_skipped += len(self._listeners) - len(notify)
+        for remove, (update_callback, _) in list(self._listeners.items()):
+            if remove in notify:
+                update_callback()
+
+    async def _async_update_data(self) -> Snapshot:
         """Update data via library."""
         try:
             return await self._async_read_all_registers()
+        except UpdateFailed:
+            raise
         except Exception as exception:
             raise UpdateFailed(f"Error communicating with API: {exception}") from exception
 
-    async def _async_read_all_registers(self) -> dict[str, Any]:
-        """Read all registers from the device."""
-        data = {}
-        
-        # Connect to device
-        connection = await self.hass.async_add_executor_job(self._client.connect)
-        if not connection:
-            raise UpdateFailed("Unable to connect to device")
-            
-        try:
-            # Read input registers in chunks for efficiency
-            input_data = await self._async_read_input_registers()
-            holding_data = await self._async_read_holding_registers()
-            
-            data.update(input_data)
-            data.update(holding_data)
-            
-            # Process special registers
-            data.update(self._process_status_registers(data))
-            
-        finally:
-            self._client.close()
-            
+    async def _async_read_all_registers(self) -> Snapshot:
+        """Read the registers of every due polling tier from the device."""
+        # Registers of tiers that are not due keep their last known value
+        data = self.data.copy() if self.data is not None else Snapshot()
+        read_started = time.monotonic()
+        read_keys: set[str] = set()
+        timing = PollTiming(time.time())
+        started = time.perf_counter()
+
+        # Connect to device (reuses the open session when possible)
+        await self._session.async_connect()
+        timing.connect = time.perf_counter() - started
+
+        due = [tier for tier in TIERS if self._tier_due(tier)]
+        for tier in due:
+            plan = self.read_plan[tier]
+            read = await self._async_read_blocks(plan, data, read_keys, timing, due)
+            if tier == TIER_FAST and plan and not read:
+                raise UpdateFailed(f"No registers could be read from {self.host}")
+            # Capabilities and presence flags may have changed the plan of the
+            # tiers that follow
+            self._update_read_plan(data)
+        for tier in due:
+            # Some registers of a tier may ride along in the blocks of another
+            if self._tier_keys[tier] <= read_keys:
+                self._mark_tier_read(tier)
+
+        self._reconcile_pending_writes(data, read_started, read_keys)
+
+        # Process special registers
+        status_started = time.perf_counter()
+        data.update(self._process_status_registers(data, self.data))
+        timing.status = time.perf_counter() - status_started
+
+        self._adapt_poll_interval(data, read_started)
+        self.history.append(time.time(), data)
+        timing.update = time.perf_counter() - started
+        self.poll_timings.append(timing)
+        self._pending_timing = timing
         return data
 
-    async def _async_read_input_registers(self) -> dict[str, Any]:
-        """Read input registers."""
-        data = {}
-        
-        # Read registers in chunks
-        chunks = [
-            (0, 80),    # Device info, status, temperatures, performance
-            (100, 20),  # UI controllers data
-            (115, 40),  # Sensors data  
-            (160, 80),  # ALFA controllers data
-        ]
-        
-        for start_addr, count in chunks:
+    @callback
+    def async_seed(self, values: Mapping[str, Any]) -> None:
+        """Start from cached identity and capabilities until the first poll.
+
+        The status flags of the cached words are expanded here: the first
+        poll only expands words that differ from the data it starts from.
+        """
+        data = Snapshot()
+        for key, value in values.items():
+            data[key] = value
+        data.update(self._process_status_registers(data))
+        self._update_read_plan(data)
+        self.data = data
+
+    def _adapt_poll_interval(self, data: Snapshot, read_at: float) -> None:
+        """Choose when to poll next from the data just read."""
+        elapsed = read_at - self._last_read_at if self._last_read_at is not None else 0.0
+        self._last_read_at = read_at
+        interval = self.poll_interval.update(data, elapsed)
+        if interval != self.update_interval.total_seconds():
+            _LOGGER.debug(
+                "Polling every %.1f s (%s)", interval, self.poll_interval.reason
+            )
+            self.update_interval = timedelta(seconds=interval)
+
+    def _update_read_plan(self, data: Snapshot) -> None:
+        """Drop the blocks of hardware that is not installed from the read plan."""
+        if "device_config" not in data:
+            return
+
+        skipped = set()
+        for name, requirement in REGISTER_REQUIREMENTS.items():
+            if requirement in skipped:
+                skipped.add(name)
+            elif requirement not in CONFIG_BIT_BY_KEY and data.get(requirement) is None:
+                # Not read (yet), keep the earlier decision
+                if self._skipped_registers is None or name in self._skipped_registers:
+                    skipped.add(name)
+            elif not self._requirement_met(requirement, data):
+                skipped.add(name)
+        if skipped == self._skipped_registers:
+            return
+
+        if self._skipped_registers is not None and any(
+            REGISTER_TIERS[name] == TIER_SLOW for name in self._skipped_registers - skipped
+        ):
+            # Newly detected hardware, read its slow registers right away
+            self._tier_read_at[TIER_SLOW] = None
+        self._skipped_registers = frozenset(skipped)
+        self.read_plan = build_tiered_plan(
+            self._max_gap, self._max_count, exclude=self._skipped_registers
+        )
+        self._tier_keys = plan_keys(self.read_plan)
+        for name in skipped:
+            data.pop(name, None)
+        for tier, blocks in self.read_plan.items():
+            _LOGGER.debug("%s", format_plan(f"{tier} tier read plan", plan_spans(blocks)))
+
+    @staticmethod
+    def _requirement_met(requirement: str, data: Snapshot) -> bool:
+        """Return true if a capability bit or presence flag is set."""
+        if requirement in CONFIG_BIT_BY_KEY:
+            device_config = data.get("device_config") or 0
+            return bool(device_config & (1 << CONFIG_BIT_BY_KEY[requirement]))
+        return bool(data.get(requirement))
+
+    def _tier_due(self, tier: str) -> bool:
+        """Return true if a polling tier has to be read this cycle."""
+        if tier == TIER_STATIC:
+            if self._static_session != self._session.connections_established:
+                return True
+            last_read = self._tier_read_at[TIER_STATIC]
+            return last_read is None or time.monotonic() - last_read >= STATIC_SCAN_INTERVAL
+        if tier == TIER_SLOW:
+            last_read = self._tier_read_at[TIER_SLOW]
+            return last_read is None or time.monotonic() - last_read >= SLOW_SCAN_INTERVAL
+        return True
+
+    def _mark_tier_read(self, tier: str) -> None:
+        """Record that all blocks of a tier were read."""
+        if tier == TIER_STATIC:
+            self._static_session = self._session.connections_established
+        self._tier_read_at[tier] = time.monotonic()
+
+    def _invalidate_address(self, address: int) -> None:
+        """Make the tier holding a written register due on the next refresh."""
+        key = KEY_BY_HOLDING_ADDRESS.get(address)
+        tier = REGISTER_TIERS[key] if key is not None else TIER_FAST
+        if tier == TIER_STATIC:
+            self._static_session = None
+        elif tier == TIER_SLOW:
+            self._tier_read_at[TIER_SLOW] = None
+
+    async def _async_read_blocks(
+        self,
+        plan: list[ReadBlock],
+        data: Snapshot,
+        read_keys: set[str] | None = None,
+        timing: PollTiming | None = None,
+        tiers: Container[str] | None = None,
+    ) -> int:
+        """Read the blocks of a read plan and decode them into data.
+
+        Registers of other tiers riding along in a block are decoded if their
+        tier is in tiers, or always if tiers is None. The keys decoded are
+        added to read_keys and the time of every read to timing. The keys of
+        a block that cannot be read are removed from data rather than left at
+        stale values. Returns the number of blocks read; a connection failure
+        ends the reads.
+        """
+        blocks_read = 0
+
+        for block in plan:
             try:
-                result = await self.hass.async_add_executor_job(
-                    self._client.read_input_registers,
-                    start_addr,
-                    count,
-                    self.slave_id
-                )
-                
+                started = time.perf_counter()
+                result = await self._readers[block.kind](block.start, block.count)
+                read = time.perf_counter() - started
+
                 if result.isError():
-                    _LOGGER.warning("Error reading input registers %d-%d: %s", 
-                                   start_addr, start_addr + count - 1, result)
+                    _LOGGER.warning("Error reading %s registers %d-%d: %s",
+                                   block.kind, block.start, block.start + block.count - 1, result)
+                    self._drop_block(block, data, tiers)
+                    if timing is not None:
+                        timing.reads.append((block.name, read, None))
                     continue
-                    
-                # Process registers
-                for name, config in INPUT_REGISTERS.items():
-                    addr = config["address"]
-                    if start_addr <= addr < start_addr + count:
-                        data[name] = self._extract_register_value(result.registers, addr - start_addr, config)
-                        
-            except ModbusException as ex:
-                _LOGGER.warning("Modbus error reading input registers %d-%d: %s", 
-                               start_addr, start_addr + count - 1, ex)
-                
-        return data
 
-    async def _async_read_holding_registers(self) -> dict[str, Any]:
-        """Read holding registers."""
-        data = {}
-        
-        # Read main holding registers (0-24)
-        try:
-            result = await self.hass.async_add_executor_job(
-                self._client.read_holding_registers,
-                0,
-                25,
-                self.slave_id
-            )
-            
-            if not result.isError():
-                for name, config in HOLDING_REGISTERS.items():
-                    addr = config["address"]
-                    if addr < 25:
-                        data[name] = self._extract_register_value(result.registers, addr, config)
-                        
-        except ModbusException as ex:
-            _LOGGER.warning("Modbus error reading holding registers 0-24: %s", ex)
+                for decoder in block.decoders(tiers):
+                    if len(result.registers) == block.count:
+                        decoder.decode_into(result.registers, data)
+                    else:
+                        # Short response, decode what is there register by register
+                        for offset, name, config in block.registers:
+                            if name in decoder.keys:
+                                data[name] = self._extract_register_value(
+                                    result.registers, offset, config
+                                )
+                    if read_keys is not None:
+                        read_keys.update(decoder.keys)
+                self.raw_blocks[block.name] = result.registers
+                blocks_read += 1
+                if timing is not None:
+                    timing.reads.append((block.name, read, time.perf_counter() - started - read))
 
-        # Read zone sensor registers (300-374)
-        try:
-            result = await self.hass.async_add_executor_job(
-                self._client.read_holding_registers,
-                300,
-                75,  # 8 zones * 10 registers per zone - 5 (we only read 5 registers per zone)
-                self.slave_id
-            )
-            
-            if not result.isError():
-                for name, config in HOLDING_REGISTERS.items():
-                    addr = config["address"]
-                    if 300 <= addr < 375:
-                        offset = addr - 300
-                        if offset < len(result.registers):
-                            data[name] = self._extract_register_value(result.registers, offset, config)
-                        
-        except ModbusException as ex:
-            _LOGGER.warning("Modbus error reading zone sensor registers: %s", ex)
+            except CONNECTION_ERRORS:
+                # The session has retried already; the unit or the line is
+                # down, so stop rather than hold the shared connection for
+                # the timeouts of every remaining block
+                raise
+            except ModbusException as ex:
+                _LOGGER.warning("Modbus error reading %s registers %d-%d: %s",
+                               block.kind, block.start, block.start + block.count - 1, ex)
+                self._drop_block(block, data, tiers)
 
-        # Read zone button registers (400-473)
-        try:
-            result = await self.hass.async_add_executor_job(
-                self._client.read_holding_registers,
-                400,
-                74,  # 8 zones * 4 registers per zone + some extra
-                self.slave_id
-            )
-            
-            if not result.isError():
-                for name, config in HOLDING_REGISTERS.items():
-                    addr = config["address"]
-                    if 400 <= addr < 474:
-                        offset = addr - 400
-                        if offset < len(result.registers):
-                            data[name] = self._extract_register_value(result.registers, offset, config)
-                        
-        except ModbusException as ex:
-            _LOGGER.warning("Modbus error reading zone button registers: %s", ex)
-            
-        return data
+        return blocks_read
+
+    @staticmethod
+    def _drop_block(
+        block: ReadBlock, data: Snapshot, tiers: Container[str] | None
+    ) -> None:
+        """Remove the values of a block that could not be read from data."""
+        for decoder in block.decoders(tiers):
+            for key in decoder.keys:
+                data[key] = None
+            for bitfield in STATUS_BITFIELDS:
+                if bitfield.source in decoder.keys:
+                    for key in bitfield.keys:
+                        data[key] = None
 
     def _extract_register_value(self, registers: list[int], offset: int, config: dict) -> Any:
         """Extract value from register data based on configuration."""
@@ -214,96 +496,252 @@ class JablotronFuturaCoordinator(DataUpdateCoordinator):
             _LOGGER.warning("Error extracting register value for %s: %s", config.get("name", "unknown"), ex)
             return None
 
-    def _process_status_registers(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Process status registers into individual binary sensors."""
-        status_data = {}
-        
-        # Process mode bits
-        current_mode = data.get("current_mode", 0)
-        if current_mode is not None:
-            for bit, name in MODE_BITS.items():
-                status_data[f"mode_{name}"] = bool(current_mode & (1 << bit))
-                
-        # Process error bits
-        errors = data.get("errors", 0)
-        if errors is not None:
-            for bit, name in ERROR_BITS.items():
-                status_data[f"error_{name}"] = bool(errors & (1 << bit))
-                
-        # Process warning bits
-        warnings = data.get("warnings", 0)
-        if warnings is not None:
-            for bit, name in WARNING_BITS.items():
-                status_data[f"warning_{name}"] = bool(warnings & (1 << bit))
-
-        # Process config bits (device capabilities)
-        device_config = data.get("device_config", 0)
-        if device_config is not None:
-            for bit, name in CONFIG_BITS.items():
-                status_data[f"config_{name}"] = bool(device_config & (1 << bit))
-
-        # Process zone identification bits
-        zone_config = data.get("vzv_identify", 0)
-        if zone_config is not None:
-            for bit, name in ZONE_BITS.items():
-                status_data[f"zone_{name}"] = bool(zone_config & (1 << bit))
-                
+    @staticmethod
+    def _process_status_registers(
+        data: Snapshot, previous: Snapshot | None = None
+    ) -> dict[str, Any]:
+        """Process status registers into individual binary sensors.
+
+        Words equal to their value in previous, whose flags data already
+        carries, are not expanded again.
+        """
+        status_data: dict[str, Any] = {}
+        for bitfield in STATUS_BITFIELDS:
+            word = data.get(bitfield.source)
+            if word is None:
+                continue
+            if previous is not None and previous.get(bitfield.source) == word:
+                continue
+            status_data.update(bitfield.expand(word))
         return status_data
 
     async def async_write_register(self, address: int, value: int) -> bool:
-        """Write a single holding register."""
-        try:
-            connection = await self.hass.async_add_executor_job(self._client.connect)
-            if not connection:
-                return False
-                
-            result = await self.hass.async_add_executor_job(
-                self._client.write_register,
-                address,
-                value,
-                self.slave_id
-            )
-            
-            success = not result.isError()
-            if success:
-                # Trigger immediate data refresh
-                await self.async_request_refresh()
+        """Write a single holding register.
+
+        The written value is shown optimistically right away. Writes issued
+        within WRITE_COALESCE_WINDOW are merged with their neighbours into one
+        transaction.
+        """
+        self._set_optimistic(address, [value])
+        return await self._write_buffer.async_write(address, value)
+
+    def _set_optimistic(self, address: int, words: list[int]) -> None:
+        """Show the value of a register being written before it is confirmed.
+
+        words are the values written from address on; a register wider than
+        them is left alone, as its new value is not known.
+        """
+        key = KEY_BY_HOLDING_ADDRESS.get(address)
+        if key is None or self.data is None:
+            return
+        config = HOLDING_REGISTERS[key]
+        if len(words) < register_width(config):
+            return
+
+        expected = self._extract_register_value(words, 0, config)
+        if key in self._pending_writes:
+            # Roll back past an unconfirmed earlier write, not onto it
+            previous = self._pending_writes[key].previous
+        else:
+            previous = self.data.get(key)
+        self._pending_writes[key] = PendingWrite(expected, previous, time.monotonic())
+        data = self.data.copy()
+        data[key] = expected
+        self.data = data
+        self.async_update_listeners()
+
+    def _acknowledge_write(self, address: int, success: bool) -> None:
+        """Record the device's answer to the write of an optimistic value."""
+        key = KEY_BY_HOLDING_ADDRESS.get(address)
+        if (pending := self._pending_writes.get(key)) is None:
+            return
+        if success:
+            pending.acked_at = time.monotonic()
+            return
+
+        # The write never reached the device, go back to the last known value
+        del self._pending_writes[key]
+        self._reject_write(key, pending, pending.previous, "write_failed")
+        if self.data is not None:
+            data = self.data.copy()
+            data[key] = pending.previous
+            self.data = data
+            self.async_update_listeners()
+
+    def _reconcile_pending_writes(
+        self, data: Snapshot, read_started: float, read_keys: set[str]
+    ) -> None:
+        """Confirm or roll back optimistic values against freshly read data.
+
+        A value no read could confirm within WRITE_CONFIRM_TIMEOUT is rolled
+        back to the last known value.
+        """
+        now = time.monotonic()
+        for key, pending in list(self._pending_writes.items()):
+            if (
+                pending.acked_at is None
+                or pending.acked_at > read_started
+                or key not in read_keys
+            ):
+                if now - pending.written_at < WRITE_CONFIRM_TIMEOUT:
+                    # This read cannot tell yet, keep showing the written value
+                    data[key] = pending.expected
+                    continue
+                del self._pending_writes[key]
+                if key not in read_keys:
+                    data[key] = pending.previous
+                self._reject_write(key, pending, data.get(key), "unconfirmed")
+                continue
+
+            del self._pending_writes[key]
+            if self._write_confirmed(key, pending, data.get(key)):
+                self.write_confirmations += 1
+                self.write_confirmation_delay = time.monotonic() - pending.written_at
             else:
-                _LOGGER.error("Error writing register %d: %s", address, result)
-                
-            return success
-            
-        except ModbusException as ex:
-            _LOGGER.error("Modbus error writing register %d: %s", address, ex)
-            return False
-        finally:
-            self._client.close()
+                # The device disagrees, its value is already in data
+                self._reject_write(key, pending, data.get(key), "device_mismatch")
+
+    @staticmethod
+    def _write_confirmed(key: str, pending: PendingWrite, actual: Any) -> bool:
+        """Return true if a read-back value agrees with the value written."""
+        if actual == pending.expected:
+            return True
+        if HOLDING_REGISTERS[key].get("countdown") and isinstance(actual, int):
+            # The unit has been counting the timer down since it was written
+            elapsed = time.monotonic() - pending.written_at
+            return pending.expected - elapsed - 1 <= actual <= pending.expected
+        return False
+
+    def _reject_write(
+        self, key: str, pending: PendingWrite, actual: Any, reason: str
+    ) -> None:
+        """Report an optimistic value that had to be rolled back."""
+        self.write_rollbacks += 1
+        _LOGGER.warning(
+            "Write of %s = %s was not applied (%s), device reports %s",
+            key, pending.expected, reason, actual,
+        )
+        self.hass.bus.async_fire(
+            EVENT_WRITE_REJECTED,
+            {
+                "host": self.host,
+                "key": key,
+                "expected": pending.expected,
+                "actual": actual,
+                "reason": reason,
+            },
+        )
 
     async def async_write_registers(self, address: int, values: list[int]) -> bool:
         """Write multiple holding registers."""
-        try:
-            connection = await self.hass.async_add_executor_job(self._client.connect)
-            if not connection:
-                return False
-                
-            result = await self.hass.async_add_executor_job(
-                self._client.write_registers,
-                address,
-                values,
-                self.slave_id
+        for offset in range(len(values)):
+            self._set_optimistic(address + offset, values[offset:])
+        results = await asyncio.gather(
+            *(
+                self._write_buffer.async_write(address + offset, value)
+                for offset, value in enumerate(values)
             )
-            
+        )
+        return all(results)
+
+    async def _async_write_run(self, address: int, values: list[int]) -> bool:
+        """Write one run of contiguous holding registers."""
+        success = False
+        try:
+            if len(values) == 1:
+                result = await self._session.async_write_register(address, values[0])
+            else:
+                result = await self._session.async_write_registers(address, values)
+
             success = not result.isError()
             if success:
-                # Trigger immediate data refresh
-                await self.async_request_refresh()
+                for offset in range(len(values)):
+                    self._invalidate_address(address + offset)
             else:
-                _LOGGER.error("Error writing registers %d: %s", address, result)
-                
-            return success
-            
+                _LOGGER.error("Error writing registers %d-%d: %s",
+                              address, address + len(values) - 1, result)
+
         except ModbusException as ex:
-            _LOGGER.error("Modbus error writing registers %d: %s", address, ex)
-            return False
+            _LOGGER.error("Modbus error writing registers %d-%d: %s",
+                          address, address + len(values) - 1, ex)
+
         finally:
-            self._client.close()
+            for offset in range(len(values)):
+                self._acknowledge_write(address + offset, success)
+
+        return success
+
+    async def _async_verify_writes(self, addresses: list[int]) -> None:
+        """Read back the blocks holding written registers and patch the data.
+
+        Written registers outside the read plan are read on their own.
+        """
+        if self.data is not None:
+            blocks = [
+                block
+                for tier_blocks in self.read_plan.values()
+                for block in tier_blocks
+                if block.kind == "holding"
+                and any(block.start <= address < block.start + block.count for address in addresses)
+            ]
+            planned = {name for block in blocks for _, name, _ in block.registers}
+            unplanned = {
+                key: HOLDING_REGISTERS[key]
+                for address in addresses
+                if (key := KEY_BY_HOLDING_ADDRESS.get(address)) is not None
+                and key not in planned
+            }
+            if unplanned:
+                blocks += build_read_plan("holding", unplanned, self._max_gap, self._max_count)
+            data = self.data.copy()
+            read_started = time.monotonic()
+            read_keys: set[str] = set()
+            await self._async_read_blocks(blocks, data, read_keys)
+            self._reconcile_pending_writes(data, read_started, read_keys)
+            data.update(self._process_status_registers(data, self.data))
+            self.data = data
+            self.async_update_listeners()
+
+        # Side effects of the write (modes, fan speeds) show up in a full refresh
+        await self._write_refresh.async_call()
+
+    @property
+    def session_statistics(self) -> dict[str, Any]:
+        """Return connection and request scheduling counters."""
+        return self._session.statistics
+
+    @property
+    def write_statistics(self) -> dict[str, Any]:
+        """Return write coalescing and confirmation counters."""
+        return {
+            "writes_requested": self._write_buffer.writes_requested,
+            "pdus_sent": self._write_buffer.pdus_sent,
+            "pdus_saved": self._write_buffer.pdus_saved,
+            "batches": self._write_buffer.batches,
+            "confirmations": self.write_confirmations,
+            "rollbacks": self.write_rollbacks,
+        }
+
+    @property
+    def listener_statistics(self) -> dict[str, int]:
+        """Return how many listener callbacks updates made and saved."""
+        return {
+            "notified": self.listeners_notified,
+            "skipped": self.listeners_skipped,
+        }
+
+    @property
+    def skipped_registers(self) -> frozenset[str]:
+        """Return the registers left out of the read plan as not installed."""
+        return self._skipped_registers or frozenset()
+
+    @property
+    def transaction_metrics(self) -> TransactionMetrics:
+        """Return latency and error statistics of this unit's transactions."""
+        return self._session.metrics
+
+    async def async_close(self) -> None:
+        """Stop pending writes and release the Modbus session."""
+        self._write_refresh.async_cancel()
+        self._write_buffer.async_cancel()
+        async_release_slave_session(self.hass, self._session)
@@ -0,0 +1,71 @@
+"""Significant-change filtering of Jablotron Futura sensor states."""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import DEFAULT_MAX_SILENCE
+
+# Absorbs float error of scaled values, e.g. 21.7 - 21.5 < 0.2
+EPSILON = 1e-9
+
+
+class DeadbandFilter:
+    """Decide whether a new sensor value is worth publishing.
+
+    A value is significant when it differs from the last published one by at
+    least the deadband, widened by the hysteresis when it moves against the
+    direction of the last published change. Values appearing, disappearing and
+    anything after max_silence seconds without a publish are always significant.
+    """
+
+    __slots__ = ("deadband", "hysteresis", "max_silence", "value", "published_at", "direction")
+
+    def __init__(
+        self,
+        deadband: float,
+        hysteresis: float = 0.0,
+        max_silence: float = DEFAULT_MAX_SILENCE,
+    ) -> None:
+        """Initialize the filter with nothing published yet."""
+        self.deadband = deadband
+        self.hysteresis = hysteresis
+        self.max_silence = max_silence
+        self.value: Any = None
+        self.published_at: float | None = None
+        self.direction = 0
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> DeadbandFilter | None:
+        """Return a filter for a register definition, or None without a deadband."""
+        if "deadband" not in config:
+            return None
+        return cls(
+            config["deadband"],
+            config.get("hysteresis", 0.0),
+            config.get("max_silence", DEFAULT_MAX_SILENCE),
+        )
+
+    def significant(self, value: Any, now: float) -> bool:
+        """Return true if value should be published at time now."""
+        if self.published_at is None or value is None or self.value is None:
+            return value != self.value or self.published_at is None
+        if now - self.published_at >= self.max_silence:
+            return value != self.value
+        delta = value - self.value
+        threshold = self.deadband
+        if delta * self.direction < 0:
+            threshold += self.hysteresis
+        return abs(delta) + EPSILON >= threshold
+
+    def publish(self, value: Any, now: float) -> None:
+        """Record value as published at time now."""
+        if value is not None and self.value is not None and value != self.value:
+            self.direction = 1 if value > self.value else -1
+        self.value = value
+        self.published_at = now
+
+    def silence_remaining(self, now: float) -> float:
+        """Return the seconds until max_silence forces a publish."""
+        if self.published_at is None:
+            return 0.0
+        return max(0.0, self.published_at + self.max_silence - now)
@@ -0,0 +1,108 @@
+"""Batch register decoding for Jablotron Futura."""
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .snapshot import Snapshot
+
+# struct codes for the register types in const.py (big-endian, high word first)
+TYPE_CODES = {
+    "uint16": ("H", 1),
+    "int16": ("h", 1),
+    "uint32": ("I", 2),
+    "int32": ("i", 2),
+}
+
+
+class BlockDecoder:
+    """Decode all registers of one read block with a single struct call."""
+
+    __slots__ = ("count", "keys", "slots", "scaled", "_target", "_pack", "_unpack")
+
+    def __init__(
+        self,
+        count: int,
+        entries: tuple[tuple[int, str, dict[str, Any]], ...],
+        slots: tuple[int, ...],
+    ) -> None:
+        """Precompile the struct formats for a block of count words.
+
+        slots are the snapshot slots of the entries, in the same order.
+        """
+        fmt = [">"]
+        position = 0
+        keys = []
+        scaled = []
+        for offset, name, config in entries:
+            if offset < position:
+                raise ValueError(f"Register {name} overlaps the previous register")
+            code, width = TYPE_CODES.get(config["type"], ("H", 1))
+            if offset > position:
+                fmt.append(f"{2 * (offset - position)}x")
+            fmt.append(code)
+            position = offset + width
+            # Extra words of a multi-word uint16 (e.g. the MAC address) are
+            # covered by the block but only the first word is decoded.
+            extra = config.get("count", width) - width
+            if extra > 0:
+                fmt.append(f"{2 * extra}x")
+                position += extra
+            if "scale" in config:
+                scaled.append((len(keys), config["scale"]))
+            keys.append(name)
+
+        self.count = count
+        self.keys = tuple(keys)
+        self.slots = slots
+        self.scaled = tuple(scaled)
+        # Store with one slice assignment when the slots are consecutive
+        if slots and list(slots) == list(range(slots[0], slots[0] + len(slots))):
+            self._target: slice | None = slice(slots[0], slots[0] + len(slots))
+        else:
+            self._target = None
+        self._pack = struct.Struct(f">{count}H").pack
+        self._unpack = struct.Struct("".join(fmt)).unpack_from
+
+    def unpack(self, registers: list[int]) -> tuple[int, ...]:
+        """Return the raw (unscaled) values of a block's words."""
+        return self._unpack(self._pack(*registers))
+
+    def decode_into(self, registers: list[int], data: Snapshot) -> None:
+        """Decode a block's raw words and store the scaled values in data."""
+        values = self._unpack(self._pack(*registers))
+        store = data.values
+        if self._target is not None:
+            store[self._target] = values
+        else:
+            for slot, value in zip(self.slots, values):
+                store[slot] = value
+        slots = self.slots
+        for index, scale in self.scaled:
+            store[slots[index]] = values[index] * scale
+
+
+class BitfieldExpander:
+    """Expand a status word into named booleans, cached by raw word value."""
+
+    __slots__ = ("source", "keys", "masks", "_cache")
+
+    def __init__(self, source: str, prefix: str, bits: dict[int, str]) -> None:
+        """Prepare the flag keys and masks of a bitfield register."""
+        self.source = source
+        self.keys = tuple(f"{prefix}_{name}" for name in bits.values())
+        self.masks = tuple(1 << bit for bit in bits)
+        self._cache: dict[int, dict[str, bool]] = {}
+
+    def expand(self, word: int) -> dict[str, bool]:
+        """Return the flags of a raw word, shared between equal words."""
+        flags = self._cache.get(word)
+        if flags is None:
+            # Status words take few distinct values; bound the cache anyway
+            if len(self._cache) >= 64:
+                self._cache.clear()
+            flags = self._cache[word] = {
+                key: bool(word & mask) for key, mask in zip(self.keys, self.masks)
+            }
+        return flags
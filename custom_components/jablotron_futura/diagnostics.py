@@ -0,0 +1,61 @@
+"""Diagnostics support for Jablotron Futura."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import JablotronFuturaCoordinator
+from .planner import ReadBlock, register_width
+
+TO_REDACT = {CONF_HOST, "serial_number", "mac_address"}
+
+
+def _block_words(block: ReadBlock, words: list[int]) -> list[int | str]:
+    """Return the raw words of a block with the redacted registers masked."""
+    masked: list[int | str] = list(words)
+    for offset, name, config in block.registers:
+        if name in TO_REDACT:
+            for index in range(offset, min(offset + register_width(config), len(masked))):
+                masked[index] = REDACTED
+    return masked
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: JablotronFuturaCoordinator = hass.data[DOMAIN][entry.entry_id]
+    blocks = {
+        block.name: block for tier in coordinator.read_plan.values() for block in tier
+    }
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "data": async_redact_data(dict(coordinator.data or {}), TO_REDACT),
+        # Blocks of an earlier plan are left out, which registers they hold is unknown
+        "raw_blocks": {
+            name: _block_words(blocks[name], words)
+            for name, words in sorted(coordinator.raw_blocks.items())
+            if name in blocks
+        },
+        "read_plan": {
+            tier: [
+                {"block": block.name, "registers": [name for _, name, _ in block.registers]}
+                for block in plan
+            ]
+            for tier, plan in coordinator.read_plan.items()
+        },
+        "skipped_registers": sorted(coordinator.skipped_registers),
+        "poll_timings": [timing.as_dict() for timing in coordinator.poll_timings],
+        "session": coordinator.session_statistics,
+        "writes": coordinator.write_statistics,
+        "listeners": coordinator.listener_statistics,
+        "transactions": coordinator.transaction_metrics.as_dict(),
+    }
@@ -0,0 +1,143 @@
+"""Short-horizon register history for Jablotron Futura."""
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+from .const import HISTORY_REGISTERS, HISTORY_SIZE, HOLDING_REGISTERS, INPUT_REGISTERS
+from .snapshot import SLOTS, Snapshot
+
+# array typecode and "no value" sentinel per register type; raw register words
+# are stored and scaled on the way out
+TYPECODES = {
+    "int16": ("h", -0x8000),
+    "uint16": ("H", 0xFFFF),
+    "int32": ("i", -0x80000000),
+    "uint32": ("I", 0xFFFFFFFF),
+}
+
+
+class RegisterHistory:
+    """Ring of raw values of one register, aligned with the shared timestamps."""
+
+    __slots__ = ("key", "slot", "scale", "sentinel", "values")
+
+    def __init__(self, key: str, size: int) -> None:
+        """Allocate the ring, filled with the sentinel."""
+        config = INPUT_REGISTERS.get(key) or HOLDING_REGISTERS[key]
+        typecode, self.sentinel = TYPECODES[config["type"]]
+        self.key = key
+        self.slot = SLOTS[key]
+        self.scale = config.get("scale")
+        self.values = array(typecode, [self.sentinel]) * size
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the ring's values."""
+        return self.values.itemsize * len(self.values)
+
+    def raw(self, value: Any) -> int:
+        """Return the raw register word of a decoded value."""
+        if value is None:
+            return self.sentinel
+        if self.scale:
+            return round(value / self.scale)
+        return value
+
+    def decoded(self, raw: int) -> float | int | None:
+        """Return the decoded value of a raw register word."""
+        if raw == self.sentinel:
+            return None
+        if self.scale:
+            return round(raw * self.scale, 3)
+        return raw
+
+
+class JablotronFuturaHistory:
+    """Fixed-size in-memory history of numeric registers at poll resolution.
+
+    Memory is bounded: size timestamps (8 bytes each) plus size values per
+    register (2 bytes for 16-bit and 4 bytes for 32-bit registers). A
+    register gets its ring on the first poll that yields a value for it.
+    """
+
+    def __init__(
+        self, keys: tuple[str, ...] = HISTORY_REGISTERS, size: int = HISTORY_SIZE
+    ) -> None:
+        """Initialize an empty history."""
+        self.size = size
+        self.keys = keys
+        self.timestamps = array("d", bytes(8 * size))
+        self.registers: dict[str, RegisterHistory] = {}
+        self._head = 0  # index of the next sample
+        self._count = 0
+
+    def append(self, timestamp: float, data: Snapshot) -> None:
+        """Record the values of one poll."""
+        head = self._head
+        self.timestamps[head] = timestamp
+        values = data.values
+        registers = self.registers
+        for key in self.keys:
+            register = registers.get(key)
+            if register is None:
+                if values[SLOTS[key]] is None:
+                    continue
+                register = registers[key] = RegisterHistory(key, self.size)
+            register.values[head] = register.raw(values[register.slot])
+        self._head = (head + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+    def _indices(self, start: float, end: float) -> list[int]:
+        """Return the ring indices of samples within [start, end], oldest first."""
+        first = (self._head - self._count) % self.size
+        timestamps = self.timestamps
+        return [
+            index
+            for index in ((first + offset) % self.size for offset in range(self._count))
+            if start <= timestamps[index] <= end
+        ]
+
+    def query(
+        self,
+        start: float,
+        end: float,
+        keys: list[str] | None = None,
+        resolution: float | None = None,
+    ) -> dict[str, list[tuple[float, float | int | None]]]:
+        """Return (timestamp, value) samples per register within a time window.
+
+        With resolution (seconds) the samples are averaged into buckets of
+        that width, stamped with the bucket start.
+        """
+        indices = self._indices(start, end)
+        timestamps = self.timestamps
+        result: dict[str, list[tuple[float, float | int | None]]] = {}
+        for key in keys or self.keys:
+            register = self.registers.get(key)
+            if register is None:
+                continue
+            samples = [(timestamps[i], register.decoded(register.values[i])) for i in indices]
+            result[key] = downsample(samples, start, resolution) if resolution else samples
+        return result
+
+    def memory_usage(self) -> dict[str, int]:
+        """Return the bytes held per register, and by the shared timestamps."""
+        usage = {key: register.nbytes for key, register in self.registers.items()}
+        usage["timestamps"] = self.timestamps.itemsize * len(self.timestamps)
+        return usage
+
+
+def downsample(
+    samples: list[tuple[float, float | int | None]], start: float, resolution: float
+) -> list[tuple[float, float | None]]:
+    """Average samples into buckets of resolution seconds, skipping gaps."""
+    buckets: dict[int, list[float]] = {}
+    for timestamp, value in samples:
+        bucket = buckets.setdefault(int((timestamp - start) // resolution), [])
+        if value is not None:
+            bucket.append(value)
+    return [
+        (start + bucket * resolution, round(sum(values) / len(values), 3) if values else None)
+        for bucket, values in buckets.items()
+    ]
@@ -0,0 +1,94 @@
+"""Modbus hubs shared by Jablotron Futura units on one endpoint."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_HUBS, DOMAIN
+from .session import JablotronFuturaSession, SlaveSession
+from .transport import ModbusEndpoint
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class JablotronFuturaHub:
+    """Units behind one Modbus endpoint, multiplexed over one session.
+
+    The endpoint is a gateway or converter (host:port) or an RS-485 bus
+    (serial device).
+    """
+
+    def __init__(self, endpoint: ModbusEndpoint) -> None:
+        """Initialize the hub with no units attached."""
+        self.endpoint = endpoint
+        self.session = JablotronFuturaSession(endpoint)
+        self.units: list[SlaveSession] = []
+
+    @property
+    def slave_ids(self) -> list[int]:
+        """Return the slave IDs of the attached units."""
+        return sorted({unit.slave_id for unit in self.units})
+
+    def attach(self, slave_id: int) -> SlaveSession:
+        """Return a view of the session for a unit."""
+        unit = SlaveSession(self.session, slave_id)
+        self.units.append(unit)
+        return unit
+
+    def detach(self, unit: SlaveSession) -> None:
+        """Forget a unit, closing the connection after the last one."""
+        self.units.remove(unit)
+        if not self.units:
+            self.session.close()
+
+
+@callback
+def async_get_slave_session(
+    hass: HomeAssistant, endpoint: ModbusEndpoint, slave_id: int
+) -> SlaveSession:
+    """Attach a unit to the hub of its endpoint, creating the hub if needed."""
+    hubs: dict[str, JablotronFuturaHub] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_HUBS, {}
+    )
+    key = endpoint.key
+    if (hub := hubs.get(key)) is None:
+        hub = hubs[key] = JablotronFuturaHub(endpoint)
+    elif hub.endpoint != endpoint:
+        _LOGGER.warning(
+            "Units on %s are configured with different transport settings, "
+            "keeping those of the first unit: %r",
+            key,
+            hub.endpoint,
+        )
+    elif slave_id in hub.slave_ids:
+        _LOGGER.warning("Slave ID %s on %s is configured more than once", slave_id, key)
+    unit = hub.attach(slave_id)
+    _LOGGER.debug("Units %s share the Modbus connection to %s", hub.slave_ids, key)
+    return unit
+
+
+@callback
+def async_conflicting_endpoint(
+    hass: HomeAssistant, endpoint: ModbusEndpoint
+) -> ModbusEndpoint | None:
+    """Return the settings of a running hub on the endpoint if they differ."""
+    hubs: dict[str, JablotronFuturaHub] = hass.data.get(DOMAIN, {}).get(DATA_HUBS, {})
+    if (hub := hubs.get(endpoint.key)) is None or hub.endpoint == endpoint:
+        return None
+    return hub.endpoint
+
+
+@callback
+def async_release_slave_session(hass: HomeAssistant, unit: SlaveSession) -> None:
+    """Detach a unit from its hub, dropping the hub after the last unit."""
+    domain_data = hass.data.get(DOMAIN, {})
+    hubs: dict[str, JablotronFuturaHub] = domain_data.get(DATA_HUBS, {})
+    key = unit.session.endpoint.key
+    if (hub := hubs.get(key)) is None or unit not in hub.units:
+        return
+    hub.detach(unit)
+    if not hub.units:
+        del hubs[key]
+        if not hubs:
+            del domain_data[DATA_HUBS]
@@ -0,0 +1,93 @@
+"""Adaptive poll interval for Jablotron Futura."""
+from __future__ import annotations
+
+from .const import (
+    ACTIVE_MODE_FLAGS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    SCAN_INTERVAL,
+    SCAN_INTERVAL_RELAX_FACTOR,
+    SCAN_INTERVAL_TIGHTEN_FACTOR,
+    VOLATILITY_THRESHOLDS,
+    VOLATILITY_WINDOW,
+)
+from .snapshot import SLOTS, ZONE_SLOTS, Snapshot
+
+ACTIVE_SLOTS = tuple(SLOTS[key] for key in ACTIVE_MODE_FLAGS) + tuple(
+    slots.button_active for slots in ZONE_SLOTS.values()
+)
+VOLATILITY_SLOTS = tuple(
+    (SLOTS[key], threshold) for key, threshold in VOLATILITY_THRESHOLDS.items()
+)
+
+REASON_INITIAL = "initial"
+REASON_ACTIVE = "active"
+REASON_STANDBY = "standby"
+REASON_VOLATILE = "volatile"
+REASON_STABLE = "stable"
+
+
+class AdaptivePollInterval:
+    """Choose the next poll interval from device activity and value volatility.
+
+    Active modes and zone buttons poll at the minimum, a unit that is off or in
+    standby at the maximum. In between the interval shrinks while watched
+    values move fast and grows again while they are stable.
+    """
+
+    def __init__(
+        self,
+        minimum: float = DEFAULT_MIN_SCAN_INTERVAL,
+        maximum: float = DEFAULT_MAX_SCAN_INTERVAL,
+        initial: float = SCAN_INTERVAL,
+    ) -> None:
+        """Initialize the controller."""
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.interval = self._clamp(initial)
+        self.reason = REASON_INITIAL
+        self.volatile = False
+        # Snapshot the volatility window started from, and its age
+        self._reference: Snapshot | None = None
+        self._window = 0.0
+
+    def _clamp(self, interval: float) -> float:
+        """Keep an interval within the configured bounds."""
+        return min(self.maximum, max(self.minimum, interval))
+
+    def update(self, data: Snapshot, elapsed: float) -> float:
+        """Return the interval until the next poll after reading data.
+
+        elapsed is the time in seconds since the previous update. Snapshots
+        are never modified once published, so data is kept as a reference
+        without copying.
+        """
+        self._window += elapsed
+        if self._reference is None:
+            self._reference, self._window = data, 0.0
+        elif self._window >= VOLATILITY_WINDOW:
+            self.volatile = self._moved(data.values, self._reference.values, self._window)
+            self._reference, self._window = data, 0.0
+
+        values = data.values
+        if any(values[slot] for slot in ACTIVE_SLOTS):
+            self.interval, self.reason = self.minimum, REASON_ACTIVE
+        elif not data.get("mode_device_on") or data.get("mode_standby"):
+            self.interval, self.reason = self.maximum, REASON_STANDBY
+        elif self.volatile:
+            self.interval = self._clamp(self.interval * SCAN_INTERVAL_TIGHTEN_FACTOR)
+            self.reason = REASON_VOLATILE
+        else:
+            self.interval = self._clamp(self.interval * SCAN_INTERVAL_RELAX_FACTOR)
+            self.reason = REASON_STABLE
+        return self.interval
+
+    @staticmethod
+    def _moved(values: list, reference: list, elapsed: float) -> bool:
+        """Return true if a watched value moved faster than its threshold."""
+        minutes = elapsed / 60
+        for slot, threshold in VOLATILITY_SLOTS:
+            value, last = values[slot], reference[slot]
+            if value is not None and last is not None and abs(value - last) >= threshold * minutes:
+                return True
+        return False
@@ -0,0 +1,199 @@
+"""Modbus transaction metrics for Jablotron Futura units."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any
+
+from .const import LATENCY_BUCKETS
+
+READ_HOLDING_REGISTERS = 0x03
+READ_INPUT_REGISTERS = 0x04
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+FUNCTION_NAMES = {
+    READ_HOLDING_REGISTERS: "read_holding_registers",
+    READ_INPUT_REGISTERS: "read_input_registers",
+    WRITE_SINGLE_REGISTER: "write_register",
+    WRITE_MULTIPLE_REGISTERS: "write_registers",
+}
+
+# Size of an exception response PDU: function code and exception code
+EXCEPTION_PDU_SIZE = 2
+
+
+@dataclass(frozen=True, slots=True)
+class Transaction:
+    """What one Modbus request does, for accounting."""
+
+    function_code: int
+    block: str
+    request_size: int  # PDU bytes
+    response_size: int  # PDU bytes of a normal response
+
+    @classmethod
+    def read(cls, function_code: int, kind: str, address: int, count: int) -> Transaction:
+        """Describe a read of count registers."""
+        return cls(function_code, f"{kind} {address}-{address + count - 1}", 5, 2 + 2 * count)
+
+    @classmethod
+    def write(cls, address: int, count: int) -> Transaction:
+        """Describe a write of one or more holding registers."""
+        if count == 1:
+            return cls(WRITE_SINGLE_REGISTER, f"holding {address}", 5, 5)
+        return cls(
+            WRITE_MULTIPLE_REGISTERS,
+            f"holding {address}-{address + count - 1}",
+            6 + 2 * count,
+            5,
+        )
+
+
+class LatencyHistogram:
+    """Latency distribution in fixed buckets, bounded in memory."""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize empty buckets, the last one catching everything above."""
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record one latency, in seconds."""
+        milliseconds = duration * 1000
+        self.buckets[bisect_left(LATENCY_BUCKETS, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+        self.max = max(self.max, milliseconds)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return an estimate of a percentile in milliseconds.
+
+        Interpolates linearly within the bucket holding the percentile.
+        """
+        if not self.count:
+            return None
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            if count and seen + count >= rank:
+                lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+                upper = LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max
+                estimate = lower + (upper - lower) * (rank - seen) / count
+                return round(min(estimate, self.max), 2)
+            seen += count
+        return round(self.max, 2)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the count, average, percentiles and maximum."""
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count, 2) if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max, 2),
+        }
+
+
+class TransactionStatistics:
+    """Latency and outcome counters of one block or function code."""
+
+    __slots__ = (
+        "latency",
+        "transactions",
+        "timeouts",
+        "exceptions",
+        "errors",
+        "retries",
+        "bytes_sent",
+        "bytes_received",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.latency = LatencyHistogram()
+        self.transactions = 0
+        self.timeouts = 0
+        self.exceptions = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the latency distribution and the counters."""
+        return {
+            "latency": self.latency.as_dict(),
+            "transactions": self.transactions,
+            "timeouts": self.timeouts,
+            "exceptions": self.exceptions,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+        }
+
+
+class TransactionMetrics:
+    """Transaction statistics of one unit, in total, per block and per function code.
+
+    Counted per attempt: timeouts (no answer), exceptions (exception
+    responses from the unit), errors (connection failures) and retries.
+    Bytes include the transport framing.
+    """
+
+    def __init__(self, frame_overhead: int) -> None:
+        """Initialize for a transport adding frame_overhead bytes per frame."""
+        self.frame_overhead = frame_overhead
+        self.total = TransactionStatistics()
+        self.blocks: dict[str, TransactionStatistics] = {}
+        self.functions: dict[int, TransactionStatistics] = {}
+
+    def _targets(self, transaction: Transaction) -> tuple[TransactionStatistics, ...]:
+        """Return the statistics a transaction counts towards."""
+        if (block := self.blocks.get(transaction.block)) is None:
+            block = self.blocks[transaction.block] = TransactionStatistics()
+        if (function := self.functions.get(transaction.function_code)) is None:
+            function = self.functions[transaction.function_code] = TransactionStatistics()
+        return self.total, block, function
+
+    def record_sent(self, transaction: Transaction, retry: bool) -> None:
+        """Record a request put on the wire."""
+        for stats in self._targets(transaction):
+            stats.bytes_sent += transaction.request_size + self.frame_overhead
+            if retry:
+                stats.retries += 1
+            else:
+                stats.transactions += 1
+
+    def record_response(self, transaction: Transaction, duration: float, error: bool) -> None:
+        """Record a response, normal or exception, after duration seconds."""
+        size = EXCEPTION_PDU_SIZE if error else transaction.response_size
+        for stats in self._targets(transaction):
+            stats.latency.record(duration)
+            stats.bytes_received += size + self.frame_overhead
+            if error:
+                stats.exceptions += 1
+
+    def record_failure(self, transaction: Transaction, timeout: bool) -> None:
+        """Record a request that got no usable response."""
+        for stats in self._targets(transaction):
+            if timeout:
+                stats.timeouts += 1
+            else:
+                stats.errors += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all statistics."""
+        return {
+            "total": self.total.as_dict(),
+            "blocks": {block: stats.as_dict() for block, stats in sorted(self.blocks.items())},
+            "functions": {
+                FUNCTION_NAMES.get(code, f"0x{code:02x}"): stats.as_dict()
+                for code, stats in sorted(self.functions.items())
+            },
+        }
@@ -17,6 +17,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, HOLDING_REGISTERS
 from .coordinator import JablotronFuturaCoordinator
+from .snapshot import SLOTS, ZONE_SLOTS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,13 +61,18 @@ class JablotronFuturaBaseNumber(CoordinatorEntity, NumberEntity):
         self,
         coordinator: JablotronFuturaCoordinator,
         register_key: str,
+        keys: frozenset[str] = frozenset(),
     ) -> None:
-        """Initialize the number."""
-        super().__init__(coordinator)
+        """Initialize the number.
+
+        keys are data keys the entity depends on besides register_key.
+        """
+        super().__init__(coordinator, keys | {register_key})
         self._register_key = register_key
+        self._slot = SLOTS[register_key]
         self._config = HOLDING_REGISTERS.get(register_key, {})
         
-        self._attr_unique_id = f"{coordinator.host}_{register_key}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{register_key}"
         self._attr_name = self._config.get("name", register_key)
         self._attr_mode = NumberMode.BOX
 
@@ -105,7 +111,7 @@ class JablotronFuturaTimeNumber(JablotronFuturaBaseNumber):
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        value = self.coordinator.data.get(self._register_key)
+        value = self.coordinator.data.value(self._slot)
         return float(value) if value is not None else None
 
     async def async_set_native_value(self, value: float) -> None:
@@ -126,8 +132,13 @@ class JablotronFuturaZoneButtonTimerNumber(JablotronFuturaBaseNumber):
         zone: int
     ) -> None:
         """Initialize the zone button timer number."""
-        super().__init__(coordinator, f"zone_{zone}_button_timer")
+        super().__init__(
+            coordinator,
+            f"zone_{zone}_button_timer",
+            frozenset({f"zone_{zone}_button_present"}),
+        )
         self._zone = zone
+        self._present_slot = ZONE_SLOTS[zone].button_present
         self._attr_name = f"Zone {zone} Button Timer"
         
         self._attr_native_min_value = 0
@@ -139,7 +150,7 @@ class JablotronFuturaZoneButtonTimerNumber(JablotronFuturaBaseNumber):
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        value = self.coordinator.data.get(f"zone_{self._zone}_button_timer")
+        value = self.coordinator.data.value(self._slot)
         return float(value) if value is not None else None
 
     @property
@@ -147,7 +158,7 @@ class JablotronFuturaZoneButtonTimerNumber(JablotronFuturaBaseNumber):
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get(f"zone_{self._zone}_button_present", False)
+            and bool(self.coordinator.data.value(self._present_slot))
         )
 
     async def async_set_native_value(self, value: float) -> None:
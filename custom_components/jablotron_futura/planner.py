@@ -0,0 +1,281 @@
+"""Modbus read planning for Jablotron Futura."""
+from __future__ import annotations
+
+from collections.abc import Container, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import (
+    HOLDING_REGISTERS,
+    INPUT_REGISTERS,
+    MAX_READ_REGISTERS,
+    READ_GAP_THRESHOLD,
+    TIER_FAST,
+    TIERS,
+)
+from .decoder import BlockDecoder
+from .snapshot import SLOTS
+
+# Modbus TCP framing: MBAP header (7) + function code (1) + address (2) + count (2)
+# for the request, MBAP header + function code + byte count (1) for the response.
+REQUEST_BYTES = 12
+RESPONSE_HEADER_BYTES = 9
+
+
+@dataclass(frozen=True)
+class ReadBlock:
+    """One planned read request and the registers decoded from it.
+
+    A block may carry registers of a slower tier that it covers anyway
+    (riders); those are only decoded when their own tier is due.
+    """
+
+    kind: str
+    tier: str
+    start: int
+    count: int
+    # (offset into the block, data key, register definition), sorted by offset
+    registers: tuple[tuple[int, str, dict[str, Any]], ...]
+    decoder: BlockDecoder = field(init=False, repr=False, compare=False)
+    riders: tuple[tuple[str, BlockDecoder], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Precompile a decoder for the registers of each tier."""
+        by_tier: dict[str, list[tuple[int, str, dict[str, Any]]]] = {}
+        for entry in self.registers:
+            by_tier.setdefault(entry[2].get("tier", TIER_FAST), []).append(entry)
+
+        def compile_decoder(entries: list[tuple[int, str, dict[str, Any]]]) -> BlockDecoder:
+            slots = tuple(SLOTS[name] for _, name, _ in entries)
+            return BlockDecoder(self.count, tuple(entries), slots)
+
+        object.__setattr__(self, "decoder", compile_decoder(by_tier.pop(self.tier, [])))
+        object.__setattr__(
+            self,
+            "riders",
+            tuple(
+                (tier, compile_decoder(by_tier[tier])) for tier in TIERS if tier in by_tier
+            ),
+        )
+
+    def decoders(self, tiers: Container[str] | None = None) -> Iterator[BlockDecoder]:
+        """Yield the decoders of the block's tier and of the riders in tiers.
+
+        Every rider is included when tiers is None.
+        """
+        yield self.decoder
+        for tier, decoder in self.riders:
+            if tiers is None or tier in tiers:
+                yield decoder
+
+    @property
+    def name(self) -> str:
+        """Return the block as shown in diagnostics, e.g. "input 16-52"."""
+        return f"{self.kind} {self.start}-{self.start + self.count - 1}"
+
+
+def register_width(config: dict[str, Any]) -> int:
+    """Return the number of 16-bit words a register definition occupies."""
+    if config["type"] in ("uint32", "int32"):
+        return 2
+    return config.get("count", 1)
+
+
+def plan_blocks(
+    registers: dict[str, dict[str, Any]],
+    max_gap: int = READ_GAP_THRESHOLD,
+    max_count: int = MAX_READ_REGISTERS,
+    barriers: list[tuple[int, int]] | None = None,
+) -> list[tuple[int, int]]:
+    """Return the (start, count) requests that cover every register in the map.
+
+    Neighbouring registers are merged into one request when the hole between
+    them is at most max_gap words and the result still fits into max_count.
+    A hole is never bridged across a word of the (start, count) barriers.
+    A multi-word register is never split across two requests.
+    """
+    spans = sorted(
+        (config["address"], config["address"] + register_width(config))
+        for config in registers.values()
+    )
+
+    blocks: list[tuple[int, int]] = []
+    start = end = None
+    for span_start, span_end in spans:
+        if start is not None and (
+            span_start - end <= max_gap
+            and max(end, span_end) - start <= max_count
+            and not any(
+                end < barrier + length and barrier < span_start
+                for barrier, length in barriers or ()
+            )
+        ):
+            end = max(end, span_end)
+            continue
+        if start is not None:
+            blocks.append((start, end - start))
+        start, end = span_start, span_end
+
+    if start is not None:
+        blocks.append((start, end - start))
+    return blocks
+
+
+def build_read_plan(
+    kind: str,
+    registers: dict[str, dict[str, Any]],
+    max_gap: int = READ_GAP_THRESHOLD,
+    max_count: int = MAX_READ_REGISTERS,
+    tier: str = TIER_FAST,
+) -> list[ReadBlock]:
+    """Plan the reads for a register map and bucket its definitions by block."""
+    return _read_blocks(kind, tier, plan_blocks(registers, max_gap, max_count), registers)
+
+
+def _read_blocks(
+    kind: str,
+    tier: str,
+    spans: list[tuple[int, int]],
+    registers: dict[str, dict[str, Any]],
+) -> list[ReadBlock]:
+    """Return the blocks of the (start, count) spans with the registers they hold."""
+    plan = []
+    for start, count in spans:
+        entries = sorted(
+            (
+                (config["address"] - start, name, config)
+                for name, config in registers.items()
+                if start <= config["address"] < start + count
+            ),
+            key=lambda entry: entry[0],
+        )
+        plan.append(ReadBlock(kind, tier, start, count, tuple(entries)))
+    return plan
+
+
+def build_tiered_plan(
+    max_gap: int = READ_GAP_THRESHOLD,
+    max_count: int = MAX_READ_REGISTERS,
+    exclude: frozenset[str] = frozenset(),
+) -> dict[str, list[ReadBlock]]:
+    """Plan the reads of every polling tier separately.
+
+    A cycle that only reads the fast tier does not drag slow or static blocks
+    along. A block of another tier that would add at most max_gap words to
+    a fast block is read with it instead of on its own, as is any register a
+    fast block covers anyway; such riders are still only decoded when their
+    own tier is due. The blocks of one tier never bridge over the words of
+    another. Registers named in exclude (hardware that is not installed) are
+    left out of the plan.
+    """
+    plan: dict[str, list[ReadBlock]] = {tier: [] for tier in TIERS}
+    for kind, registers in (("input", INPUT_REGISTERS), ("holding", HOLDING_REGISTERS)):
+        by_tier: dict[str, dict[str, dict[str, Any]]] = {tier: {} for tier in TIERS}
+        for name, config in registers.items():
+            if name not in exclude:
+                by_tier[config.get("tier", TIER_FAST)][name] = config
+
+        fast = [
+            [start, start + count]
+            for start, count in plan_blocks(by_tier[TIER_FAST], max_gap, max_count)
+        ]
+        # Slow blocks first, they are worth more to absorb
+        for tier in reversed(TIERS[:-1]):
+            _, own = _split_riders(by_tier[tier], fast)
+            barriers = [(low, high - low) for low, high in fast]
+            for start, count in plan_blocks(own, max_gap, max_count, barriers):
+                end = start + count
+                best = None
+                for span in fast:
+                    low, high = min(span[0], start), max(span[1], end)
+                    added = high - low - (span[1] - span[0])
+                    if (
+                        high - low <= max_count
+                        and added <= max_gap
+                        and (best is None or added < best[0])
+                        and not any(
+                            other is not span and other[0] < high and low < other[1]
+                            for other in fast
+                        )
+                    ):
+                        best = (added, span)
+                if best is not None:
+                    span = best[1]
+                    span[0], span[1] = min(span[0], start), max(span[1], end)
+
+        spans = [(start, end - start) for start, end in fast]
+        riders: dict[str, dict[str, Any]] = {}
+        for tier in TIERS[:-1]:
+            tier_riders, own = _split_riders(by_tier[tier], fast)
+            riders.update(tier_riders)
+            plan[tier].extend(
+                _read_blocks(kind, tier, plan_blocks(own, max_gap, max_count, spans), own)
+            )
+        plan[TIER_FAST].extend(
+            _read_blocks(kind, TIER_FAST, spans, {**by_tier[TIER_FAST], **riders})
+        )
+    return plan
+
+
+def _split_riders(
+    registers: dict[str, dict[str, Any]], spans: list[list[int]]
+) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    """Split registers into those inside one of the [start, end) spans and the rest."""
+    inside, outside = {}, {}
+    for name, config in registers.items():
+        address = config["address"]
+        end = address + register_width(config)
+        if any(start <= address and end <= stop for start, stop in spans):
+            inside[name] = config
+        else:
+            outside[name] = config
+    return inside, outside
+
+
+def plan_keys(plan: dict[str, list[ReadBlock]]) -> dict[str, frozenset[str]]:
+    """Return the keys of every tier in a read plan, riders included."""
+    keys: dict[str, set[str]] = {tier: set() for tier in TIERS}
+    for blocks in plan.values():
+        for block in blocks:
+            for _, name, config in block.registers:
+                keys[config.get("tier", TIER_FAST)].add(name)
+    return {tier: frozenset(names) for tier, names in keys.items()}
+
+
+def plan_spans(plan: list[ReadBlock]) -> list[tuple[int, int]]:
+    """Return the (start, count) pairs of a read plan."""
+    return [(block.start, block.count) for block in plan]
+
+
+def plan_wire_bytes(blocks: list[tuple[int, int]]) -> int:
+    """Return the Modbus TCP bytes exchanged to execute a read plan."""
+    return sum(REQUEST_BYTES + RESPONSE_HEADER_BYTES + 2 * count for _, count in blocks)
+
+
+def format_plan(name: str, blocks: list[tuple[int, int]]) -> str:
+    """Return a human readable description of a read plan."""
+    ranges = ", ".join(f"{start}-{start + count - 1}" for start, count in blocks)
+    registers = sum(count for _, count in blocks)
+    return (
+        f"{name}: {len(blocks)} requests, {registers} registers, "
+        f"{plan_wire_bytes(blocks)} bytes [{ranges}]"
+    )
+
+
+# Decode tables for the default gap threshold, built once at import
+READ_PLAN = build_tiered_plan()
+
+
+if __name__ == "__main__":
+    # Hand-written chunks used before the planner existed
+    legacy_input = [(0, 80), (100, 20), (115, 40), (160, 80)]
+    legacy_holding = [(0, 25), (300, 75), (400, 74)]
+
+    print(format_plan("legacy input", legacy_input))
+    print(format_plan("legacy holding", legacy_holding))
+    print(format_plan("untiered input", plan_blocks(INPUT_REGISTERS)))
+    print(format_plan("untiered holding", plan_blocks(HOLDING_REGISTERS)))
+    for tier, blocks in READ_PLAN.items():
+        print(format_plan(f"{tier} tier", plan_spans(blocks)))
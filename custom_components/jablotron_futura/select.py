@@ -16,6 +16,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, HOLDING_REGISTERS, VENTILATION_LEVELS, ZONE_BUTTON_MODES
 from .coordinator import JablotronFuturaCoordinator
+from .snapshot import SLOTS, ZONE_SLOTS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,13 +51,18 @@ class JablotronFuturaBaseSelect(CoordinatorEntity, SelectEntity):
         self,
         coordinator: JablotronFuturaCoordinator,
         register_key: str,
+        keys: frozenset[str] = frozenset(),
     ) -> None:
-        """Initialize the select."""
-        super().__init__(coordinator)
+        """Initialize the select.
+
+        keys are data keys the entity depends on besides register_key.
+        """
+        super().__init__(coordinator, keys | {register_key})
         self._register_key = register_key
+        self._slot = SLOTS[register_key]
         self._config = HOLDING_REGISTERS.get(register_key, {})
         
-        self._attr_unique_id = f"{coordinator.host}_{register_key}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{register_key}"
         self._attr_name = self._config.get("name", register_key)
 
     async def async_select_option(self, option: str) -> None:
@@ -77,7 +83,7 @@ class JablotronFuturaVentilationLevelSelect(JablotronFuturaBaseSelect):
     @property
     def current_option(self) -> str | None:
         """Return the selected option."""
-        level = self.coordinator.data.get("ventilation_level")
+        level = self.coordinator.data.value(self._slot)
         if level is not None:
             return VENTILATION_LEVELS.get(level, "off")
         return None
@@ -103,8 +109,13 @@ class JablotronFuturaZoneButtonModeSelect(JablotronFuturaBaseSelect):
 
     def __init__(self, coordinator: JablotronFuturaCoordinator, zone: int) -> None:
         """Initialize the zone button mode select."""
-        super().__init__(coordinator, f"zone_{zone}_button_mode")
+        super().__init__(
+            coordinator,
+            f"zone_{zone}_button_mode",
+            frozenset({f"zone_{zone}_button_present"}),
+        )
         self._zone = zone
+        self._present_slot = ZONE_SLOTS[zone].button_present
         self._attr_name = f"Zone {zone} Button Mode"
         self._attr_options = list(ZONE_BUTTON_MODES.values())
         self._attr_icon = "mdi:gesture-tap-button"
@@ -112,7 +123,7 @@ class JablotronFuturaZoneButtonModeSelect(JablotronFuturaBaseSelect):
     @property
     def current_option(self) -> str | None:
         """Return the selected option."""
-        mode = self.coordinator.data.get(f"zone_{self._zone}_button_mode")
+        mode = self.coordinator.data.value(self._slot)
         if mode is not None:
             return ZONE_BUTTON_MODES.get(mode, "boost")
         return None
@@ -122,7 +133,7 @@ class JablotronFuturaZoneButtonModeSelect(JablotronFuturaBaseSelect):
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get(f"zone_{self._zone}_button_present", False)
+            and bool(self.coordinator.data.value(self._present_slot))
         )
 
     async def async_select_option(self, option: str) -> None:
@@ -1,7 +1,9 @@
 """Support for Jablotron Futura sensors."""
 from __future__ import annotations
 
+from datetime import datetime
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -13,17 +15,23 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONCENTRATION_PARTS_PER_MILLION,
     PERCENTAGE,
+    EntityCategory,
     UnitOfElectricPotential,
+    UnitOfInformation,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
     UnitOfVolumetricFlowRate,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, INPUT_REGISTERS, DEVICE_VARIANTS
 from .coordinator import JablotronFuturaCoordinator
+from .deadband import DeadbandFilter
+from .snapshot import SLOTS, ZONE_SLOTS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -112,6 +120,17 @@ async def async_setup_entry(
         JablotronFuturaVersionSensor(coordinator, "regmap_version", "Register Map Version"),
     ])
 
+    # Diagnostic sensors
+    entities.extend([
+        JablotronFuturaWriteConfirmationSensor(coordinator),
+        JablotronFuturaWriteWaitSensor(coordinator),
+        JablotronFuturaPollIntervalSensor(coordinator),
+        JablotronFuturaModbusLatencySensor(coordinator),
+        JablotronFuturaModbusLatencyP95Sensor(coordinator),
+        JablotronFuturaModbusErrorsSensor(coordinator),
+        JablotronFuturaModbusTrafficSensor(coordinator),
+    ])
+
     # Zone sensor entities (only if VarioBreeze is supported)
     variobreeze_supported = coordinator.data.get("config_variobreeze_supported", False)
     if variobreeze_supported:
@@ -129,6 +148,25 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+def _get_device_info(coordinator: JablotronFuturaCoordinator) -> dict[str, Any] | None:
+    """Return device info."""
+    serial_number = coordinator.data.get("serial_number")
+    device_variant = coordinator.data.get("device_variant")
+
+    if serial_number is None:
+        return None
+
+    model = DEVICE_VARIANTS.get(device_variant, f"Futura (variant {device_variant})")
+
+    return {
+        "identifiers": {(DOMAIN, str(serial_number))},
+        "name": "Jablotron Futura",
+        "manufacturer": "Jablotron Living Technology",
+        "model": model,
+        "sw_version": coordinator.data.get("fw_version"),
+    }
+
+
 class JablotronFuturaBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for Jablotron Futura sensors."""
 
@@ -138,39 +176,25 @@ class JablotronFuturaBaseSensor(CoordinatorEntity, SensorEntity):
         sensor_key: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset({sensor_key}))
         self._sensor_key = sensor_key
+        self._slot = SLOTS[sensor_key]
         self._config = INPUT_REGISTERS.get(sensor_key, {})
+        # Jittery registers only publish significant changes
+        self._deadband = DeadbandFilter.from_config(self._config)
+        self._published_available: bool | None = None
+        self._silence_timer: CALLBACK_TYPE | None = None
         
-        self._attr_unique_id = f"{coordinator.host}_{sensor_key}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{sensor_key}"
         self._attr_name = self._config.get("name", sensor_key)
         
-        device_info = self._get_device_info()
+        device_info = _get_device_info(coordinator)
         if device_info:
             self._attr_device_info = device_info
 
-    def _get_device_info(self) -> dict[str, Any] | None:
-        """Return device info."""
-        serial_number = self.coordinator.data.get("serial_number")
-        device_variant = self.coordinator.data.get("device_variant")
-        
-        if serial_number is None:
-            return None
-            
-        model = DEVICE_VARIANTS.get(device_variant, f"Futura (variant {device_variant})")
-        
-        return {
-            "identifiers": {(DOMAIN, str(serial_number))},
-            "name": "Jablotron Futura",
-            "manufacturer": "Jablotron Living Technology",
-            "model": model,
-            "sw_version": self.coordinator.data.get("fw_version"),
-        }
-
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        value = self.coordinator.data.get(self._sensor_key)
+    def _current_value(self) -> Any:
+        """Return the latest value read from the unit."""
+        value = self.coordinator.data.value(self._slot)
         
         # Handle special cases
         if self._sensor_key == "temp_external_ntc" and value == -99:
@@ -178,12 +202,65 @@ class JablotronFuturaBaseSensor(CoordinatorEntity, SensorEntity):
             
         return value
 
+    @property
+    def native_value(self) -> Any:
+        """Return the state of the sensor."""
+        if self._deadband is not None and self._deadband.published_at is not None:
+            return self._deadband.value
+        return self._current_value()
+
+    async def async_added_to_hass(self) -> None:
+        """Publish the initial value and cancel the silence timer on removal."""
+        await super().async_added_to_hass()
+        if self._deadband is not None:
+            self._deadband.publish(self._current_value(), time.monotonic())
+            self._published_available = self.available
+            self.async_on_remove(self._cancel_silence_timer)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the change is significant."""
+        if self._deadband is None:
+            super()._handle_coordinator_update()
+            return
+        now = time.monotonic()
+        value = self._current_value()
+        available = self.available
+        if available == self._published_available and not self._deadband.significant(value, now):
+            # Make sure a suppressed change is published after max_silence
+            # even if the value does not move again
+            if value != self._deadband.value and self._silence_timer is None:
+                self._silence_timer = async_call_later(
+                    self.hass, self._deadband.silence_remaining(now), self._async_silence_elapsed
+                )
+            return
+        self._publish(value, available, now)
+
+    @callback
+    def _async_silence_elapsed(self, _now: datetime) -> None:
+        """Publish a change that was suppressed for max_silence."""
+        self._silence_timer = None
+        self._publish(self._current_value(), self.available, time.monotonic())
+
+    def _publish(self, value: Any, available: bool, now: float) -> None:
+        """Record and write a new state."""
+        self._cancel_silence_timer()
+        self._deadband.publish(value, now)
+        self._published_available = available
+        self.async_write_ha_state()
+
+    def _cancel_silence_timer(self) -> None:
+        """Cancel a pending max_silence publish."""
+        if self._silence_timer is not None:
+            self._silence_timer()
+            self._silence_timer = None
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get(self._sensor_key) is not None
+            and self.coordinator.data.value(self._slot) is not None
         )
 
 
@@ -254,7 +331,7 @@ class JablotronFuturaDeviceVariantSensor(JablotronFuturaBaseSensor):
     @property
     def native_value(self) -> str | None:
         """Return the device variant name."""
-        variant = self.coordinator.data.get("device_variant")
+        variant = self.coordinator.data.value(self._slot)
         if variant is not None:
             return DEVICE_VARIANTS.get(variant, f"Unknown ({variant})")
         return None
@@ -287,7 +364,7 @@ class JablotronFuturaVersionSensor(JablotronFuturaBaseSensor):
     @property
     def native_value(self) -> str | None:
         """Return the version as formatted string."""
-        value = self.coordinator.data.get(self._sensor_key)
+        value = self.coordinator.data.value(self._slot)
         if value is not None:
             # Format as version string (e.g., 1.2.3.4)
             return f"{(value >> 24) & 0xFF}.{(value >> 16) & 0xFF}.{(value >> 8) & 0xFF}.{value & 0xFF}"
@@ -308,12 +385,17 @@ class JablotronFuturaZoneBaseSensor(CoordinatorEntity, SensorEntity):
         sensor_type: str,
     ) -> None:
         """Initialize the zone sensor."""
-        super().__init__(coordinator)
         self._zone = zone
         self._sensor_type = sensor_type
         self._sensor_key = f"zone_{zone}_{sensor_type}"
+        self._slot = SLOTS[self._sensor_key]
+        self._present_slot = ZONE_SLOTS[zone].sensors_present
+        super().__init__(
+            coordinator,
+            frozenset({self._sensor_key, f"zone_{zone}_sensors_present"}),
+        )
         
-        self._attr_unique_id = f"{coordinator.host}_zone_{zone}_{sensor_type}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_zone_{zone}_{sensor_type}"
         self._attr_name = f"Zone {zone} {sensor_type.replace('_', ' ').title()}"
 
     @property
@@ -321,14 +403,14 @@ class JablotronFuturaZoneBaseSensor(CoordinatorEntity, SensorEntity):
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get(f"zone_{self._zone}_sensors_present", False)
-            and self.coordinator.data.get(self._sensor_key) is not None
+            and bool(self.coordinator.data.value(self._present_slot))
+            and self.coordinator.data.value(self._slot) is not None
         )
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        return self.coordinator.data.get(self._sensor_key)
+        return self.coordinator.data.value(self._slot)
 
 
 class JablotronFuturaZoneTemperatureSensor(JablotronFuturaZoneBaseSensor):
@@ -373,3 +455,228 @@ class JablotronFuturaZoneFloorTemperatureSensor(JablotronFuturaZoneBaseSensor):
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+
+
+# =============================================================================
+# Diagnostic Sensor Classes
+# =============================================================================
+
+class JablotronFuturaDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """Base class for sensors about the integration's own operation."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self, coordinator: JablotronFuturaCoordinator, key: str, name: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{key}"
+        self._attr_name = name
+
+        device_info = _get_device_info(coordinator)
+        if device_info:
+            self._attr_device_info = device_info
+
+
+class JablotronFuturaWriteConfirmationSensor(JablotronFuturaDiagnosticSensor):
+    """Delay between showing a written value and the device confirming it."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-check-outline"
+
+    def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "write_confirmation_delay", "Write Confirmation Delay")
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the confirmation delay of the last confirmed write."""
+        delay = self.coordinator.write_confirmation_delay
+        if delay is None:
+            return None
+        return round(delay * 1000)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the confirmation and rollback counters."""
+        return {
+            "confirmed_writes": self.coordinator.write_confirmations,
+            "rolled_back_writes": self.coordinator.write_rollbacks,
+        }
+
+
+class JablotronFuturaWriteWaitSensor(JablotronFuturaDiagnosticSensor):
+    """Time the last write waited for the shared Modbus connection."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "write_queue_wait", "Write Queue Wait")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the queue wait of the last write."""
+        wait = self.coordinator.session_statistics["wait"]["write"]
+        if not wait["count"]:
+            return None
+        return wait["last_ms"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the queue depth and wait statistics per request type."""
+        statistics = self.coordinator.session_statistics
+        return {
+            "queue_depth": statistics["queue_depth"],
+            "max_queue_depth": statistics["max_queue_depth"],
+            **{
+                f"{kind}_wait_{name}": value
+                for kind, wait in statistics["wait"].items()
+                for name, value in wait.items()
+            },
+        }
+
+
+class JablotronFuturaPollIntervalSensor(JablotronFuturaDiagnosticSensor):
+    """Poll interval chosen by the adaptive controller."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_icon = "mdi:timer-refresh-outline"
+
+    def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "poll_interval", "Poll Interval")
+
+    @property
+    def native_value(self) -> float:
+        """Return the interval until the next poll."""
+        return round(self.coordinator.poll_interval.interval, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return why the interval was chosen and its bounds."""
+        poll_interval = self.coordinator.poll_interval
+        return {
+            "reason": poll_interval.reason,
+            "min_interval": poll_interval.minimum,
+            "max_interval": poll_interval.maximum,
+        }
+
+
+class JablotronFuturaModbusLatencySensor(JablotronFuturaDiagnosticSensor):
+    """Round trip time of this unit's Modbus transactions."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:lan-pending"
+
+    def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "modbus_latency", "Modbus Latency")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the average latency of this unit's transactions."""
+        latency = self.coordinator.session_statistics["latency"]
+        if not latency["count"]:
+            return None
+        return latency["avg_ms"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the latency statistics and the units sharing the connection."""
+        statistics = self.coordinator.session_statistics
+        return {
+            "slave_id": statistics["slave_id"],
+            **{f"latency_{name}": value for name, value in statistics["latency"].items()},
+            "errors": statistics["errors"],
+            "gateway_slave_ids": sorted(statistics["slaves"]),
+        }
+
+
+class JablotronFuturaModbusLatencyP95Sensor(JablotronFuturaDiagnosticSensor):
+    """95th percentile round trip time of this unit's Modbus transactions."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:chart-bell-curve-cumulative"
+
+    def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "modbus_latency_p95", "Modbus Latency P95")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the 95th percentile latency of all transactions."""
+        return self.coordinator.transaction_metrics.total.latency.percentile(95)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the latency percentiles per function code."""
+        metrics = self.coordinator.transaction_metrics.as_dict()
+        return {
+            f"{function}_{name}": value
+            for function, stats in metrics["functions"].items()
+            for name, value in stats["latency"].items()
+            if name in ("p50_ms", "p95_ms", "p99_ms")
+        }
+
+
+class JablotronFuturaModbusErrorsSensor(JablotronFuturaDiagnosticSensor):
+    """Failed Modbus transaction attempts of this unit."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:lan-disconnect"
+
+    def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "modbus_errors", "Modbus Errors")
+
+    @property
+    def native_value(self) -> int:
+        """Return the timeouts, exception responses and connection errors."""
+        total = self.coordinator.transaction_metrics.total
+        return total.timeouts + total.exceptions + total.errors
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the counters per kind of failure and per function code."""
+        metrics = self.coordinator.transaction_metrics.as_dict()
+        attributes = {
+            name: metrics["total"][name]
+            for name in ("transactions", "timeouts", "exceptions", "errors", "retries")
+        }
+        for function, stats in metrics["functions"].items():
+            for name in ("timeouts", "exceptions", "errors", "retries"):
+                attributes[f"{function}_{name}"] = stats[name]
+        return attributes
+
+
+class JablotronFuturaModbusTrafficSensor(JablotronFuturaDiagnosticSensor):
+    """Bytes exchanged with this unit, including the transport framing."""
+
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _attr_icon = "mdi:swap-vertical"
+
+    def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "modbus_traffic", "Modbus Traffic")
+
+    @property
+    def native_value(self) -> int:
+        """Return the bytes sent and received."""
+        total = self.coordinator.transaction_metrics.total
+        return total.bytes_sent + total.bytes_received
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the bytes per direction."""
+        total = self.coordinator.transaction_metrics.total
+        return {"bytes_sent": total.bytes_sent, "bytes_received": total.bytes_received}
@@ -0,0 +1,202 @@
+"""Services for the Jablotron Futura integration."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from datetime import timedelta
+from pathlib import Path
+import pstats
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    DATA_HUBS,
+    DOMAIN,
+    HISTORY_REGISTERS,
+    SERVICE_GET_HISTORY,
+    SERVICE_PROFILE_POLL,
+)
+from .coordinator import JablotronFuturaCoordinator
+
+ATTR_ENTRY_ID = "entry_id"
+ATTR_KEYS = "keys"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_RESOLUTION = "resolution"
+ATTR_POLLS = "polls"
+ATTR_TOP = "top"
+ATTR_INTEGRATION_ONLY = "integration_only"
+
+DEFAULT_HISTORY_WINDOW = timedelta(hours=1)
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_KEYS): vol.All(cv.ensure_list, [vol.In(HISTORY_REGISTERS)]),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_RESOLUTION): vol.All(vol.Coerce(float), vol.Range(min=1)),
+    }
+)
+
+PROFILE_POLL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_POLLS, default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+        vol.Optional(ATTR_TOP, default=25): vol.All(vol.Coerce(int), vol.Range(min=1, max=200)),
+        vol.Optional(ATTR_INTEGRATION_ONLY, default=False): cv.boolean,
+    }
+)
+
+# cProfile instruments the whole event loop thread, one profile at a time
+_PROFILE_LOCK = asyncio.Lock()
+INTEGRATION_DIR = str(Path(__file__).parent)
+
+
+def _get_coordinator(hass: HomeAssistant, entry_id: str | None) -> JablotronFuturaCoordinator:
+    """Return the coordinator of a config entry, or the only one."""
+    coordinators: dict[str, JablotronFuturaCoordinator] = {
+        entry_id: coordinator
+        for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+        if entry_id != DATA_HUBS
+    }
+    if entry_id is not None:
+        if entry_id not in coordinators:
+            raise ServiceValidationError(f"Unknown Jablotron Futura entry {entry_id}")
+        return coordinators[entry_id]
+    if len(coordinators) != 1:
+        raise ServiceValidationError(
+            "entry_id is required when more than one unit is configured"
+        )
+    return next(iter(coordinators.values()))
+
+
+async def _async_get_history(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return a time window of the in-memory register history."""
+    coordinator = _get_coordinator(hass, call.data.get(ATTR_ENTRY_ID))
+    end = dt_util.as_utc(call.data.get(ATTR_END) or dt_util.utcnow())
+    start = dt_util.as_utc(call.data.get(ATTR_START) or end - DEFAULT_HISTORY_WINDOW)
+    resolution = call.data.get(ATTR_RESOLUTION)
+
+    history = coordinator.history
+    samples = history.query(
+        start.timestamp(), end.timestamp(), call.data.get(ATTR_KEYS), resolution
+    )
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "resolution": resolution,
+        "registers": {
+            key: [[timestamp, value] for timestamp, value in values]
+            for key, values in samples.items()
+        },
+        "memory_bytes": history.memory_usage(),
+    }
+
+
+def _summarize_profile(
+    profile: cProfile.Profile, path: str, top: int, integration_only: bool
+) -> list[dict[str, Any]]:
+    """Write the call stats to path and return the top functions by cumulative time."""
+    profile.dump_stats(path)
+    stats = pstats.Stats(profile)
+    functions = []
+    for (filename, line, name), (primitive, calls, total, cumulative, _) in sorted(
+        stats.stats.items(), key=lambda item: item[1][3], reverse=True
+    ):
+        if integration_only and not filename.startswith(INTEGRATION_DIR):
+            continue
+        functions.append(
+            {
+                "function": pstats.func_std_string((filename, line, name)),
+                "calls": calls,
+                "primitive_calls": primitive,
+                "total_s": round(total, 6),
+                "cumulative_s": round(cumulative, 6),
+            }
+        )
+        if len(functions) == top:
+            break
+    return functions
+
+
+async def _async_profile_poll(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Run poll cycles under cProfile and return the hottest functions."""
+    coordinator = _get_coordinator(hass, call.data.get(ATTR_ENTRY_ID))
+    if _PROFILE_LOCK.locked():
+        raise ServiceValidationError("A poll profile is already running")
+
+    async with _PROFILE_LOCK:
+        polls = call.data[ATTR_POLLS]
+        successful = 0
+        profile = cProfile.Profile()
+        started = time.monotonic()
+        profile.enable()
+        try:
+            for _ in range(polls):
+                # A refresh is a complete poll cycle: read, decode, listener dispatch
+                await coordinator.async_refresh()
+                successful += coordinator.last_update_success
+        finally:
+            profile.disable()
+        duration = time.monotonic() - started
+
+        path = hass.config.path(f"{DOMAIN}_profile_{dt_util.utcnow():%Y%m%d_%H%M%S_%f}.prof")
+        functions = await hass.async_add_executor_job(
+            _summarize_profile,
+            profile,
+            path,
+            call.data[ATTR_TOP],
+            call.data[ATTR_INTEGRATION_ONLY],
+        )
+
+    return {
+        "file": path,
+        "polls": polls,
+        "successful_polls": successful,
+        "duration": round(duration, 3),
+        "functions": functions,
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services once."""
+    if hass.services.has_service(DOMAIN, SERVICE_GET_HISTORY):
+        return
+
+    async def async_get_history(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_history service."""
+        return await _async_get_history(hass, call)
+
+    async def async_profile_poll(call: ServiceCall) -> ServiceResponse:
+        """Handle the profile_poll service."""
+        return await _async_profile_poll(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_POLL,
+        async_profile_poll,
+        schema=PROFILE_POLL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the services when the last unit is unloaded."""
+    if not hass.data.get(DOMAIN):
+        hass.services.async_remove(DOMAIN, SERVICE_GET_HISTORY)
+        hass.services.async_remove(DOMAIN, SERVICE_PROFILE_POLL)
@@ -0,0 +1,438 @@
+"""Persistent Modbus session for Jablotron Futura units."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from pymodbus.client.base import ModbusBaseClient
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+from .const import (
+    KEEPALIVE_IDLE,
+    MODBUS_RETRIES,
+    RECONNECT_BACKOFF_MAX,
+    RECONNECT_BACKOFF_MIN,
+)
+from .metrics import (
+    READ_HOLDING_REGISTERS,
+    READ_INPUT_REGISTERS,
+    Transaction,
+    TransactionMetrics,
+)
+from .transport import ModbusEndpoint
+
+_LOGGER = logging.getLogger(__name__)
+
+# Errors after which the socket can no longer be trusted (timeout on a
+# half-open connection, peer reset, garbled frame).
+CONNECTION_ERRORS = (ConnectionException, ModbusIOException, asyncio.TimeoutError, OSError)
+# Of those, the ones meaning the request got no answer in time
+TIMEOUT_ERRORS = (ModbusIOException, asyncio.TimeoutError)
+
+# Transaction priorities, lower runs first. User writes overtake queued poll
+# reads; a poll gives way between two blocks since every block is queued on
+# its own. Within a priority the units behind one connection take turns.
+PRIORITY_WRITE = 0
+PRIORITY_READ = 1
+PRIORITY_NAMES = {PRIORITY_WRITE: "write", PRIORITY_READ: "read"}
+
+
+class TimingStatistics:
+    """Durations of one kind of transaction."""
+
+    __slots__ = ("count", "total", "last", "max")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record the duration of one transaction."""
+        self.count += 1
+        self.total += duration
+        self.last = duration
+        self.max = max(self.max, duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters in milliseconds."""
+        return {
+            "count": self.count,
+            "last_ms": round(self.last * 1000, 1),
+            "max_ms": round(self.max * 1000, 1),
+            "avg_ms": round(self.total / self.count * 1000, 1) if self.count else 0.0,
+        }
+
+
+class SlaveStatistics:
+    """Queue wait per priority and transaction latency of one slave ID."""
+
+    __slots__ = ("wait", "latency", "errors")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.wait = {priority: TimingStatistics() for priority in PRIORITY_NAMES}
+        self.latency = TimingStatistics()
+        self.errors = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters in milliseconds."""
+        return {
+            "wait": {
+                PRIORITY_NAMES[priority]: stats.as_dict()
+                for priority, stats in self.wait.items()
+            },
+            "latency": self.latency.as_dict(),
+            "errors": self.errors,
+        }
+
+
+class JablotronFuturaSession:
+    """Long-lived Modbus connection shared by polling and writes.
+
+    Every unit (slave ID) behind the endpoint shares the connection.
+    Transactions are serialized: only one request is on the wire at a time and
+    waiting requests are served by priority, then round robin between slave
+    IDs, then in arrival order.
+    """
+
+    def __init__(
+        self,
+        endpoint: ModbusEndpoint,
+        keepalive_idle: float = KEEPALIVE_IDLE,
+        retries: int = MODBUS_RETRIES,
+        backoff_min: float = RECONNECT_BACKOFF_MIN,
+        backoff_max: float = RECONNECT_BACKOFF_MAX,
+    ) -> None:
+        """Initialize the session."""
+        self.endpoint = endpoint
+        self._frame_gap = endpoint.frame_gap
+        self._keepalive_idle = keepalive_idle
+        self._retries = retries
+        self._backoff_min = backoff_min
+        self._backoff_max = backoff_max
+        self._client = endpoint.create_client()
+        self._last_activity = 0.0
+        self._reused = False
+        self._backoff = 0.0
+        self._retry_at = 0.0
+
+        self._busy = False
+        self._queue: list[tuple[int, int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        # Fair queueing: each transaction is tagged one round after the
+        # previous one of its slave ID, and no earlier than the round served
+        self._round = 0
+        self._slave_rounds: dict[int, int] = {}
+        self.max_queue_depth = 0
+        self.wait_statistics = {
+            priority: TimingStatistics() for priority in PRIORITY_NAMES
+        }
+        self.slave_statistics: dict[int, SlaveStatistics] = {}
+        self.transaction_metrics: dict[int, TransactionMetrics] = {}
+
+        self.connections_established = 0
+        # Established connections still open at the start of a later poll
+        self.connections_reused = 0
+        self.connect_failures = 0
+        self.keepalive_probes = 0
+        self.dead_connections = 0
+
+    @property
+    def connected(self) -> bool:
+        """Return true if the socket is open."""
+        return self._client.connected
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of transactions waiting for the connection."""
+        return sum(1 for *_, future in self._queue if not future.done())
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Return connection and scheduling counters."""
+        return {
+            "connected": self.connected,
+            "connections_established": self.connections_established,
+            "connections_reused": self.connections_reused,
+            "connect_failures": self.connect_failures,
+            "keepalive_probes": self.keepalive_probes,
+            "dead_connections": self.dead_connections,
+            "backoff": self._backoff,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "wait": {
+                PRIORITY_NAMES[priority]: stats.as_dict()
+                for priority, stats in self.wait_statistics.items()
+            },
+            "slaves": {
+                slave_id: stats.as_dict()
+                for slave_id, stats in self.slave_statistics.items()
+            },
+        }
+
+    def _slave(self, slave_id: int) -> SlaveStatistics:
+        """Return the counters of a slave ID."""
+        if (stats := self.slave_statistics.get(slave_id)) is None:
+            stats = self.slave_statistics[slave_id] = SlaveStatistics()
+        return stats
+
+    def metrics(self, slave_id: int) -> TransactionMetrics:
+        """Return the transaction metrics of a slave ID."""
+        if (metrics := self.transaction_metrics.get(slave_id)) is None:
+            metrics = self.transaction_metrics[slave_id] = TransactionMetrics(
+                self.endpoint.frame_overhead
+            )
+        return metrics
+
+    async def _async_acquire(self, priority: int, slave_id: int) -> None:
+        """Wait until the connection is free for a transaction of this priority."""
+        queued_at = time.monotonic()
+        turn = max(self._round, self._slave_rounds.get(slave_id, 0)) + 1
+        self._slave_rounds[slave_id] = turn
+        if self._busy or self._queue:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._queue, (priority, turn, next(self._sequence), future))
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The connection was handed over just before the cancel
+                    self._release()
+                raise
+        else:
+            self._busy = True
+            self._round = turn
+        wait = time.monotonic() - queued_at
+        self.wait_statistics[priority].record(wait)
+        self._slave(slave_id).wait[priority].record(wait)
+
+    def _release(self) -> None:
+        """Hand the connection to the next waiting transaction."""
+        while self._queue:
+            _, turn, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                # The connection stays busy, it now belongs to the waiter
+                self._round = turn
+                future.set_result(None)
+                return
+        self._busy = False
+
+    async def async_connect(self, slave_id: int) -> ModbusBaseClient:
+        """Return a connected client at the start of a poll.
+
+        The open socket is reused without a probe: the reads that follow find
+        out whether it still works.
+        """
+        await self._async_acquire(PRIORITY_READ, slave_id)
+        try:
+            if self._client.connected and not self._reused:
+                self._reused = True
+                self.connections_reused += 1
+            return await self._async_connect(slave_id, probe=False)
+        finally:
+            self._release()
+
+    async def _async_connect(self, slave_id: int, probe: bool) -> ModbusBaseClient:
+        """Connect while holding the connection.
+
+        With probe, a socket idle for longer than keepalive_idle is checked
+        before it is reused.
+        """
+        if self._client.connected and (
+            not probe
+            or time.monotonic() - self._last_activity < self._keepalive_idle
+            or await self._async_probe(slave_id)
+        ):
+            return self._client
+
+        now = time.monotonic()
+        if now < self._retry_at:
+            raise ConnectionException(
+                f"Reconnect to {self.endpoint} backing off for {self._retry_at - now:.1f} s"
+            )
+
+        if not await self._client.connect():
+            self.connect_failures += 1
+            self._backoff = min(
+                self._backoff * 2 if self._backoff else self._backoff_min,
+                self._backoff_max,
+            )
+            self._retry_at = time.monotonic() + self._backoff
+            raise ConnectionException(f"Unable to connect to {self.endpoint}")
+
+        self._enable_tcp_keepalive()
+        self.connections_established += 1
+        self._reused = False
+        self._backoff = 0.0
+        self._retry_at = 0.0
+        self._last_activity = time.monotonic()
+        _LOGGER.debug("Connected to %s", self.endpoint)
+        return self._client
+
+    async def _async_probe(self, slave_id: int) -> bool:
+        """Check an idle connection with a single register read."""
+        self.keepalive_probes += 1
+        try:
+            result = await self._client.read_input_registers(0, 1, slave_id)
+        except CONNECTION_ERRORS as ex:
+            _LOGGER.debug("Idle connection to %s is dead: %s", self.endpoint, ex)
+            self._drop()
+            return False
+        if result.isError():
+            # The device answered, so the socket itself is fine.
+            _LOGGER.debug("Keepalive probe returned %s", result)
+        self._last_activity = time.monotonic()
+        return True
+
+    def _enable_tcp_keepalive(self) -> None:
+        """Let the kernel detect half-open sockets between polls."""
+        transport = getattr(self._client, "transport", None)
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError as ex:
+            _LOGGER.debug("Unable to enable TCP keepalive: %s", ex)
+
+    def _drop(self) -> None:
+        """Close a connection that can no longer be trusted."""
+        self.dead_connections += 1
+        self._client.close()
+
+    async def async_execute(
+        self,
+        request: Callable[[ModbusBaseClient], Awaitable[Any]],
+        slave_id: int,
+        priority: int = PRIORITY_READ,
+        transaction: Transaction | None = None,
+    ) -> Any:
+        """Run one Modbus transaction of a slave ID on the shared connection.
+
+        A request that fails on the connection is resent on a fresh one up
+        to retries times. transaction describes the request for the metrics.
+        """
+        await self._async_acquire(priority, slave_id)
+        stats = self._slave(slave_id)
+        metrics = self.metrics(slave_id) if transaction is not None else None
+        try:
+            attempt = 0
+            while True:
+                # A request that can be resent is its own probe
+                client = await self._async_connect(slave_id, attempt >= self._retries)
+                if self._frame_gap:
+                    # Keep the line idle long enough to delimit the previous frame
+                    idle = time.monotonic() - self._last_activity
+                    if idle < self._frame_gap:
+                        await asyncio.sleep(self._frame_gap - idle)
+                if metrics is not None:
+                    metrics.record_sent(transaction, attempt > 0)
+                started = time.monotonic()
+                try:
+                    result = await request(client)
+                except CONNECTION_ERRORS as ex:
+                    stats.errors += 1
+                    if metrics is not None:
+                        metrics.record_failure(transaction, isinstance(ex, TIMEOUT_ERRORS))
+                    self._drop()
+                    if attempt >= self._retries:
+                        raise
+                    attempt += 1
+                    _LOGGER.debug(
+                        "Retrying request to %s (%d/%d): %s",
+                        self.endpoint, attempt, self._retries, ex,
+                    )
+                    continue
+                self._last_activity = time.monotonic()
+                latency = self._last_activity - started
+                stats.latency.record(latency)
+                if metrics is not None:
+                    metrics.record_response(transaction, latency, result.isError())
+                return result
+        finally:
+            self._release()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._client.close()
+
+
+class SlaveSession:
+    """One unit's view of a shared session, bound to its slave ID."""
+
+    def __init__(self, session: JablotronFuturaSession, slave_id: int) -> None:
+        """Initialize the view."""
+        self.session = session
+        self.slave_id = slave_id
+
+    @property
+    def connections_established(self) -> int:
+        """Return how often the shared connection was (re)established."""
+        return self.session.connections_established
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Return connection counters with the wait and latency of this unit."""
+        statistics = self.session.statistics
+        slave = statistics["slaves"].get(self.slave_id) or SlaveStatistics().as_dict()
+        return {
+            **statistics,
+            "slave_id": self.slave_id,
+            "gateway_wait": statistics["wait"],
+            "wait": slave["wait"],
+            "latency": slave["latency"],
+            "errors": slave["errors"],
+        }
+
+    @property
+    def metrics(self) -> TransactionMetrics:
+        """Return the transaction metrics of this unit."""
+        return self.session.metrics(self.slave_id)
+
+    async def async_connect(self) -> ModbusBaseClient:
+        """Return the connected client of the shared session."""
+        return await self.session.async_connect(self.slave_id)
+
+    async def async_read_input_registers(self, address: int, count: int) -> Any:
+        """Read input registers."""
+        return await self.session.async_execute(
+            lambda client: client.read_input_registers(address, count, self.slave_id),
+            self.slave_id,
+            transaction=Transaction.read(READ_INPUT_REGISTERS, "input", address, count),
+        )
+
+    async def async_read_holding_registers(self, address: int, count: int) -> Any:
+        """Read holding registers."""
+        return await self.session.async_execute(
+            lambda client: client.read_holding_registers(address, count, self.slave_id),
+            self.slave_id,
+            transaction=Transaction.read(READ_HOLDING_REGISTERS, "holding", address, count),
+        )
+
+    async def async_write_register(self, address: int, value: int) -> Any:
+        """Write a single holding register."""
+        return await self.session.async_execute(
+            lambda client: client.write_register(address, value, self.slave_id),
+            self.slave_id,
+            PRIORITY_WRITE,
+            Transaction.write(address, 1),
+        )
+
+    async def async_write_registers(self, address: int, values: list[int]) -> Any:
+        """Write multiple holding registers."""
+        return await self.session.async_execute(
+            lambda client: client.write_registers(address, values, self.slave_id),
+            self.slave_id,
+            PRIORITY_WRITE,
+            Transaction.write(address, len(values)),
+        )
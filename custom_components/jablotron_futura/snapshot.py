@@ -0,0 +1,148 @@
+"""Slot-indexed coordinator data for Jablotron Futura."""
+from __future__ import annotations
+
+from collections.abc import Iterator, MutableMapping
+from typing import Any, NamedTuple
+
+from .const import (
+    CONFIG_BITS,
+    ERROR_BITS,
+    HOLDING_REGISTERS,
+    INPUT_REGISTERS,
+    MODE_BITS,
+    TIER_FAST,
+    TIERS,
+    WARNING_BITS,
+    ZONE_BITS,
+)
+from .decoder import BitfieldExpander
+
+# Status words and the flags expanded from them
+STATUS_BITFIELDS = (
+    BitfieldExpander("current_mode", "mode", MODE_BITS),
+    BitfieldExpander("errors", "error", ERROR_BITS),
+    BitfieldExpander("warnings", "warning", WARNING_BITS),
+    BitfieldExpander("device_config", "config", CONFIG_BITS),
+    # Only read on units with VarioBreeze
+    BitfieldExpander("vzv_identify", "zone", ZONE_BITS),
+)
+
+
+def _register_order(item: tuple[int, str, dict[str, Any]]) -> tuple[int, int, int]:
+    """Sort registers by kind, tier and address."""
+    kind, _, config = item
+    return kind, TIERS.index(config.get("tier", TIER_FAST)), config["address"]
+
+
+# Registers of one tier get consecutive slots in address order, so a read
+# block usually lands in one contiguous slice of the snapshot.
+KEYS: tuple[str, ...] = tuple(
+    name
+    for _, name, _ in sorted(
+        (
+            (kind, name, config)
+            for kind, registers in enumerate((INPUT_REGISTERS, HOLDING_REGISTERS))
+            for name, config in registers.items()
+        ),
+        key=_register_order,
+    )
+) + tuple(key for bitfield in STATUS_BITFIELDS for key in bitfield.keys)
+SLOTS: dict[str, int] = {key: slot for slot, key in enumerate(KEYS)}
+
+# Flag key -> (status word slot, bit mask)
+STATUS_FLAGS: dict[str, tuple[int, int]] = {
+    key: (SLOTS[bitfield.source], mask)
+    for bitfield in STATUS_BITFIELDS
+    for key, mask in zip(bitfield.keys, bitfield.masks)
+}
+
+
+class ZoneSlots(NamedTuple):
+    """Slots of the registers of one VarioBreeze zone."""
+
+    sensors_present: int
+    sensors_invalidate: int
+    temperature: int
+    humidity: int
+    co2: int
+    floor_temperature: int
+    button_present: int
+    button_mode: int
+    button_timer: int
+    button_active: int
+
+
+ZONE_SLOTS: dict[int, ZoneSlots] = {
+    zone: ZoneSlots(*(SLOTS[f"zone_{zone}_{field}"] for field in ZoneSlots._fields))
+    for zone in range(1, 9)
+}
+
+
+class Snapshot(MutableMapping[str, Any]):
+    """Coordinator data stored in one list indexed by precomputed slots.
+
+    Behaves like the dict it replaces; a value of None means the key is
+    absent. Hot paths read by slot with value() and bit().
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: list[Any] | None = None) -> None:
+        """Initialize an empty snapshot or wrap a list of slot values."""
+        self.values = values if values is not None else [None] * len(KEYS)
+
+    def value(self, slot: int) -> Any:
+        """Return the value in a slot."""
+        return self.values[slot]
+
+    def bit(self, slot: int, mask: int) -> bool:
+        """Return one bit of the status word in a slot."""
+        word = self.values[slot]
+        return bool(word and word & mask)
+
+    def copy(self) -> Snapshot:
+        """Return a shallow copy."""
+        return Snapshot(self.values.copy())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of a key, or default if it is absent."""
+        slot = SLOTS.get(key)
+        if slot is None:
+            return default
+        value = self.values[slot]
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a key."""
+        value = self.values[SLOTS[key]]
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set the value of a key."""
+        self.values[SLOTS[key]] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a key."""
+        slot = SLOTS[key]
+        if self.values[slot] is None:
+            raise KeyError(key)
+        self.values[slot] = None
+
+    def __contains__(self, key: object) -> bool:
+        """Return true if the key has a value."""
+        slot = SLOTS.get(key)  # type: ignore[call-overload]
+        return slot is not None and self.values[slot] is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys that have a value."""
+        return (key for key, value in zip(KEYS, self.values) if value is not None)
+
+    def __len__(self) -> int:
+        """Return the number of keys that have a value."""
+        return len(self.values) - self.values.count(None)
+
+    def __repr__(self) -> str:
+        """Return the snapshot as a dict literal."""
+        return f"Snapshot({dict(self)!r})"
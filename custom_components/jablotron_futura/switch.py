@@ -17,6 +17,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, HOLDING_REGISTERS
 from .coordinator import JablotronFuturaCoordinator
+from .snapshot import SLOTS, ZONE_SLOTS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,11 +72,12 @@ class JablotronFuturaSwitch(CoordinatorEntity, SwitchEntity):
         register_key: str,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset({register_key}))
         self._register_key = register_key
+        self._slot = SLOTS[register_key]
         self._config = HOLDING_REGISTERS.get(register_key, {})
         
-        self._attr_unique_id = f"{coordinator.host}_{register_key}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{register_key}"
         self._attr_name = self._config.get("name", register_key)
         
         # Set appropriate icons
@@ -92,7 +94,7 @@ class JablotronFuturaSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        value = self.coordinator.data.get(self._register_key)
+        value = self.coordinator.data.value(self._slot)
         return bool(value) if value is not None else None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -123,17 +125,21 @@ class JablotronFuturaZoneButtonActiveSwitch(CoordinatorEntity, SwitchEntity):
         zone: int,
     ) -> None:
         """Initialize the zone button active switch."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            frozenset({f"zone_{zone}_button_active", f"zone_{zone}_button_present"}),
+        )
         self._zone = zone
+        self._slots = ZONE_SLOTS[zone]
         
-        self._attr_unique_id = f"{coordinator.host}_zone_{zone}_button_active"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_zone_{zone}_button_active"
         self._attr_name = f"Zone {zone} Button Active"
         self._attr_icon = "mdi:gesture-tap-button"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the button is active."""
-        value = self.coordinator.data.get(f"zone_{self._zone}_button_active")
+        value = self.coordinator.data.value(self._slots.button_active)
         return bool(value) if value is not None else None
 
     @property
@@ -141,7 +147,7 @@ class JablotronFuturaZoneButtonActiveSwitch(CoordinatorEntity, SwitchEntity):
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get(f"zone_{self._zone}_button_present", False)
+            and bool(self.coordinator.data.value(self._slots.button_present))
         )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -164,9 +170,16 @@ class JablotronFuturaCoolBreezeAutoPrioritySwitch(CoordinatorEntity, SwitchEntit
 
     def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
         """Initialize the CoolBreeze auto priority switch."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            frozenset({
+                "vb_coolbreeze_priority",
+                "config_coolbreeze_supported",
+                "config_variobreeze_supported",
+            }),
+        )
         
-        self._attr_unique_id = f"{coordinator.host}_coolbreeze_auto_priority"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_coolbreeze_auto_priority"
         self._attr_name = "CoolBreeze Auto Priority (CO2 vs Temperature)"
         self._attr_icon = "mdi:auto-mode"
 
@@ -212,9 +225,12 @@ class JablotronFuturaKitchenHoodModeSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, coordinator: JablotronFuturaCoordinator) -> None:
         """Initialize the kitchen hood mode switch."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            frozenset({"vb_kitchen_hood_normal", "config_variobreeze_supported"}),
+        )
         
-        self._attr_unique_id = f"{coordinator.host}_kitchen_hood_normally_open"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_kitchen_hood_normally_open"
         self._attr_name = "Kitchen Hood Normally Open"
         self._attr_icon = "mdi:stove"
 
@@ -0,0 +1,43 @@
+"""Timing breakdown of Jablotron Futura poll cycles."""
+from __future__ import annotations
+
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Return a duration in milliseconds, rounded for display."""
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+class PollTiming:
+    """Where the time of one poll cycle went, in seconds."""
+
+    __slots__ = ("started", "connect", "reads", "status", "update", "dispatch")
+
+    def __init__(self, started: float) -> None:
+        """Start the breakdown of a cycle started at wall clock time started."""
+        self.started = started
+        self.connect = 0.0
+        # (block name, read, decode); decode is None for an error response
+        self.reads: list[tuple[str, float, float | None]] = []
+        self.status = 0.0
+        self.update = 0.0
+        self.dispatch: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breakdown in milliseconds."""
+        return {
+            "started": dt_util.utc_from_timestamp(self.started).isoformat(),
+            "connect_ms": _ms(self.connect),
+            "reads": [
+                {"block": block, "read_ms": _ms(read), "decode_ms": _ms(decode)}
+                for block, read, decode in self.reads
+            ],
+            "read_ms": _ms(sum(read for _, read, _ in self.reads)),
+            "decode_ms": _ms(sum(decode for _, _, decode in self.reads if decode is not None)),
+            "status_ms": _ms(self.status),
+            "update_ms": _ms(self.update),
+            "dispatch_ms": _ms(self.dispatch),
+        }
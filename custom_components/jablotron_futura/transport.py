@@ -0,0 +1,136 @@
+"""Modbus transports for Jablotron Futura units."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+from pymodbus.client.base import ModbusBaseClient
+from pymodbus.transaction import ModbusRtuFramer
+
+from homeassistant.const import CONF_HOST, CONF_PORT
+
+from .const import (
+    CONF_BAUDRATE,
+    CONF_BYTESIZE,
+    CONF_DEVICE,
+    CONF_PARITY,
+    CONF_STOPBITS,
+    CONF_TRANSPORT,
+    DEFAULT_BAUDRATE,
+    DEFAULT_BYTESIZE,
+    DEFAULT_PARITY,
+    DEFAULT_PORT,
+    DEFAULT_STOPBITS,
+    RTU_MIN_FRAME_GAP,
+    TRANSPORT_PROFILES,
+    TRANSPORT_RTU_OVER_TCP,
+    TRANSPORT_SERIAL,
+    TRANSPORT_TCP,
+)
+
+
+@dataclass(frozen=True)
+class ModbusEndpoint:
+    """Where and how a unit is reached.
+
+    host is the serial device for TRANSPORT_SERIAL; any device path or
+    pyserial URL works, e.g. a pseudo-terminal or socket://localhost:5020.
+    """
+
+    transport: str
+    host: str
+    port: int = DEFAULT_PORT
+    baudrate: int = DEFAULT_BAUDRATE
+    bytesize: int = DEFAULT_BYTESIZE
+    parity: str = DEFAULT_PARITY
+    stopbits: int = DEFAULT_STOPBITS
+
+    @classmethod
+    def from_entry_data(cls, data: Mapping[str, Any]) -> ModbusEndpoint:
+        """Return the endpoint of a config entry."""
+        transport = data.get(CONF_TRANSPORT, TRANSPORT_TCP)
+        if transport == TRANSPORT_SERIAL:
+            return cls(
+                transport,
+                data[CONF_DEVICE],
+                baudrate=data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE),
+                bytesize=data.get(CONF_BYTESIZE, DEFAULT_BYTESIZE),
+                parity=data.get(CONF_PARITY, DEFAULT_PARITY),
+                stopbits=data.get(CONF_STOPBITS, DEFAULT_STOPBITS),
+            )
+        return cls(transport, data[CONF_HOST], data.get(CONF_PORT, DEFAULT_PORT))
+
+    @property
+    def key(self) -> str:
+        """Return the key of the hub shared by the units on this endpoint."""
+        if self.transport == TRANSPORT_SERIAL:
+            return self.host
+        return f"{self.host}:{self.port}"
+
+    @property
+    def profile(self) -> dict[str, Any]:
+        """Return the planning and timing profile of the transport."""
+        return TRANSPORT_PROFILES[self.transport]
+
+    @property
+    def frame_gap(self) -> float:
+        """Return the idle time to keep between two frames, in seconds."""
+        gap = self.profile["frame_gap"]
+        if gap is not None:
+            return gap
+        # Start bit, data bits, parity bit and stop bits of one character
+        bits = 1 + self.bytesize + (self.parity != "N") + self.stopbits
+        if self.baudrate > 19200:
+            return RTU_MIN_FRAME_GAP
+        return 3.5 * bits / self.baudrate
+
+    @property
+    def frame_overhead(self) -> int:
+        """Return the bytes each frame adds to a Modbus PDU."""
+        if self.transport == TRANSPORT_TCP:
+            # MBAP header: transaction, protocol, length and unit ID
+            return 7
+        # Slave address and CRC
+        return 3
+
+    def create_client(self) -> ModbusBaseClient:
+        """Return a disconnected pymodbus client for this endpoint.
+
+        The client does not retry by itself, the session resends a
+        transaction on a fresh connection and counts the retries.
+        """
+        timeout = self.profile["timeout"]
+        if self.transport == TRANSPORT_SERIAL:
+            return AsyncModbusSerialClient(
+                port=self.host,
+                framer=ModbusRtuFramer,
+                baudrate=self.baudrate,
+                bytesize=self.bytesize,
+                parity=self.parity,
+                stopbits=self.stopbits,
+                timeout=timeout,
+                retries=0,
+                reconnect_delay=0,
+            )
+        if self.transport == TRANSPORT_RTU_OVER_TCP:
+            return AsyncModbusTcpClient(
+                host=self.host,
+                port=self.port,
+                framer=ModbusRtuFramer,
+                timeout=timeout,
+                retries=0,
+                reconnect_delay=0,
+            )
+        return AsyncModbusTcpClient(
+            host=self.host,
+            port=self.port,
+            timeout=timeout,
+            retries=0,
+            reconnect_delay=0,
+        )
+
+    def __str__(self) -> str:
+        """Return the endpoint for log messages."""
+        return self.key
@@ -0,0 +1,149 @@
+"""Write coalescing for Jablotron Futura holding registers."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import WRITE_COALESCE_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def contiguous_runs(writes: dict[int, int]) -> list[tuple[int, list[int]]]:
+    """Group address -> value writes into (start address, values) runs."""
+    runs: list[tuple[int, list[int]]] = []
+    for address in sorted(writes):
+        if runs and runs[-1][0] + len(runs[-1][1]) == address:
+            runs[-1][1].append(writes[address])
+        else:
+            runs.append((address, [writes[address]]))
+    return runs
+
+
+class JablotronFuturaWriteBuffer:
+    """Collect register writes issued within a short window into few PDUs."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        write: Callable[[int, list[int]], Awaitable[bool]],
+        on_flushed: Callable[[list[int]], Awaitable[None]],
+        window: float = WRITE_COALESCE_WINDOW,
+    ) -> None:
+        """Initialize the buffer.
+
+        write sends one run of contiguous registers and returns success,
+        on_flushed runs in the background after every batch with the
+        addresses written; the writers do not wait for it.
+        """
+        self.hass = hass
+        self._write = write
+        self._on_flushed = on_flushed
+        self._window = window
+        self._pending: dict[int, int] = {}
+        self._waiters: dict[int, list[asyncio.Future[bool]]] = {}
+        self._flush_task: asyncio.Task | None = None
+        # Flushes and read-backs still running
+        self._tasks: set[asyncio.Task] = set()
+
+        self.writes_requested = 0
+        self.pdus_sent = 0
+        self.batches = 0
+
+    @property
+    def pdus_saved(self) -> int:
+        """Return how many PDUs coalescing has saved so far."""
+        return self.writes_requested - self.pdus_sent
+
+    async def async_write(self, address: int, value: int) -> bool:
+        """Queue a register write and wait for the batch that carries it."""
+        future: asyncio.Future[bool] = self.hass.loop.create_future()
+        # A later write to the same register within the window wins
+        self._pending[address] = value
+        self._waiters.setdefault(address, []).append(future)
+        self.writes_requested += 1
+
+        if self._flush_task is None:
+            self._flush_task = self._async_track(self._async_flush_later())
+        return await future
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop all flushes and read-backs, failing the writes not yet sent."""
+        self._flush_task = None
+        for task in self._tasks:
+            task.cancel()
+        self._pending = {}
+        self._fail(self._waiters)
+        self._waiters = {}
+
+    def _async_track(self, coro: Awaitable[None]) -> asyncio.Task:
+        """Run a flush or read-back as a task async_cancel can stop."""
+        task = self.hass.async_create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    @staticmethod
+    def _fail(waiters: dict[int, list[asyncio.Future[bool]]]) -> None:
+        """Report writes that were never sent as failed."""
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_result(False)
+
+    async def _async_flush_later(self) -> None:
+        """Wait for the window to close, then send the batch."""
+        await asyncio.sleep(self._window)
+        self._flush_task = None
+
+        pending, self._pending = self._pending, {}
+        waiters, self._waiters = self._waiters, {}
+        runs = contiguous_runs(pending)
+        requested = sum(len(futures) for futures in waiters.values())
+
+        results: dict[int, bool | BaseException] = {}
+        try:
+            for start, values in runs:
+                try:
+                    success: bool | BaseException = await self._write(start, values)
+                except Exception as ex:  # pylint: disable=broad-except
+                    success = ex
+                for offset in range(len(values)):
+                    results[start + offset] = success
+        except asyncio.CancelledError:
+            self._fail(waiters)
+            raise
+
+        self.pdus_sent += len(runs)
+        self.batches += 1
+        _LOGGER.debug(
+            "Wrote %d register writes in %d PDUs (%d saved)",
+            requested,
+            len(runs),
+            requested - len(runs),
+        )
+
+        for address, futures in waiters.items():
+            result = results[address]
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+        # Callers do not wait for the read-back
+        if written := [address for address, result in results.items() if result is True]:
+            self._async_track(self._async_verify(written))
+
+    async def _async_verify(self, written: list[int]) -> None:
+        """Run on_flushed for a batch, logging instead of raising its errors."""
+        try:
+            await self._on_flushed(written)
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.warning("Unable to verify writes to %s: %s", written, ex)
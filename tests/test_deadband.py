@@ -0,0 +1,67 @@
+"""Significant-change filtering of sensor states."""
+from __future__ import annotations
+
+from custom_components.jablotron_futura.const import INPUT_REGISTERS
+from custom_components.jablotron_futura.deadband import DeadbandFilter
+
+
+def _published(deadband: DeadbandFilter, samples: list[tuple[float, float | None]]) -> list:
+    """Feed (time, value) samples through a filter and return the published values."""
+    published = []
+    for now, value in samples:
+        if deadband.significant(value, now):
+            deadband.publish(value, now)
+            published.append(value)
+    return published
+
+
+def test_jitter_within_the_deadband_is_suppressed() -> None:
+    """Last-digit noise is dropped, a real move is published."""
+    deadband = DeadbandFilter(0.2)
+    samples = [(0, 21.5), (30, 21.6), (60, 21.4), (90, 21.5), (120, 21.7), (150, 21.8)]
+    assert _published(deadband, samples) == [21.5, 21.7]
+
+
+def test_scaled_values_reach_the_deadband_exactly() -> None:
+    """Float error of scaled words does not swallow a change of one deadband."""
+    deadband = DeadbandFilter(0.2)
+    assert _published(deadband, [(0, 215 * 0.1), (30, 217 * 0.1)]) == [215 * 0.1, 217 * 0.1]
+
+
+def test_hysteresis_widens_the_band_against_the_last_change() -> None:
+    """Reversing needs deadband plus hysteresis, continuing only the deadband."""
+    deadband = DeadbandFilter(1.0, hysteresis=1.0)
+    assert _published(deadband, [(0, 50), (30, 51)]) == [50, 51]
+    assert not deadband.significant(50, 60)
+    assert deadband.significant(49, 60)
+    assert deadband.significant(52, 60)
+
+
+def test_max_silence_publishes_a_suppressed_change() -> None:
+    """A small change is published once max_silence has passed, an equal value is not."""
+    deadband = DeadbandFilter(1.0, max_silence=900)
+    deadband.publish(20, 0)
+    assert not deadband.significant(20.5, 899)
+    assert deadband.significant(20.5, 900)
+    assert not deadband.significant(20, 900)
+    assert deadband.silence_remaining(300) == 600
+    assert deadband.silence_remaining(1000) == 0
+
+
+def test_values_appearing_and_disappearing_are_significant() -> None:
+    """Availability changes always reach the state machine."""
+    deadband = DeadbandFilter(1.0)
+    assert deadband.silence_remaining(0) == 0
+    assert _published(deadband, [(0, None), (30, 20), (60, None), (90, None), (120, 20.1)]) == [
+        None,
+        20,
+        None,
+        20.1,
+    ]
+
+
+def test_from_config() -> None:
+    """Registers without a deadband are not filtered."""
+    assert DeadbandFilter.from_config({"address": 0, "type": "uint16"}) is None
+    deadband = DeadbandFilter.from_config(INPUT_REGISTERS["temp_indoor"])
+    assert deadband.deadband == INPUT_REGISTERS["temp_indoor"]["deadband"]
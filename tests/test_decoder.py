@@ -0,0 +1,43 @@
+"""Batch decoding against the per-register decoder it replaced."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from custom_components.jablotron_futura.const import MODE_BITS, TIERS
+from custom_components.jablotron_futura.coordinator import JablotronFuturaCoordinator
+from custom_components.jablotron_futura.decoder import BitfieldExpander
+from custom_components.jablotron_futura.planner import build_tiered_plan
+from custom_components.jablotron_futura.snapshot import Snapshot
+
+# The per-register decoder does not use the coordinator
+extract_register_value = JablotronFuturaCoordinator._extract_register_value
+
+
+@pytest.mark.parametrize("max_gap", [0, 10, 40])
+def test_block_decoder_matches_register_decoder(max_gap) -> None:
+    """Every register decodes to the same value from random words."""
+    rng = random.Random(max_gap)
+    plan = build_tiered_plan(max_gap)
+    for block in (block for tier in TIERS for block in plan[tier]):
+        for _ in range(20):
+            # Edge words as well, they flip the sign of signed registers
+            words = [rng.choice((0, 1, 0x7FFF, 0x8000, 0xFFFF, rng.randrange(0x10000)))
+                     for _ in range(block.count)]
+            data = Snapshot()
+            for decoder in block.decoders():
+                decoder.decode_into(words, data)
+            for offset, name, config in block.registers:
+                assert data[name] == extract_register_value(None, words, offset, config), name
+
+
+def test_bitfield_expander_shares_flags_of_equal_words() -> None:
+    """Equal status words expand to the same, cached flags."""
+    expander = BitfieldExpander("current_mode", "mode", MODE_BITS)
+    bit, name = next(iter(MODE_BITS.items()))
+    flags = expander.expand(1 << bit)
+    assert flags[f"mode_{name}"] is True
+    assert sum(flags.values()) == 1
+    assert expander.expand(1 << bit) is flags
+    assert not any(expander.expand(0).values())
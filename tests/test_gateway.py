@@ -0,0 +1,82 @@
+"""Two units behind one gateway, served by the simulator."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.jablotron_futura import (
+    binary_sensor,
+    migrate_unique_id,
+    number,
+    select,
+    switch,
+)
+from custom_components.jablotron_futura.const import DOMAIN, TRANSPORT_TCP
+from custom_components.jablotron_futura.coordinator import JablotronFuturaCoordinator
+from custom_components.jablotron_futura.transport import ModbusEndpoint
+from tools.simulator import FuturaModel, FuturaSimulator
+
+PLATFORMS = (binary_sensor, number, select, switch)
+
+
+async def _async_unique_ids(tmp_path) -> tuple[set[tuple], set[tuple], bool]:
+    """Set up two units on one endpoint and return their entities' unique IDs.
+
+    Unique IDs only need to be unique within a platform, so they are
+    returned with the platform.
+    """
+    simulator = FuturaSimulator(
+        {1: FuturaModel(zones=2, seed=1), 2: FuturaModel(serial_number=7654321, seed=2)}
+    )
+    port = await simulator.start(port=0)
+    hass = HomeAssistant(str(tmp_path))
+    endpoint = ModbusEndpoint(TRANSPORT_TCP, "127.0.0.1", port)
+    coordinators = [JablotronFuturaCoordinator(hass, endpoint, slave_id) for slave_id in (1, 2)]
+    try:
+        await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+        unique_ids = []
+        for index, coordinator in enumerate(coordinators):
+            assert coordinator.last_update_success
+            hass.data.setdefault(DOMAIN, {})[f"entry_{index}"] = coordinator
+            ids = []
+            for platform in PLATFORMS:
+                entities = []
+                await platform.async_setup_entry(
+                    hass, SimpleNamespace(entry_id=f"entry_{index}"), entities.extend
+                )
+                ids.extend((platform.__name__, entity.unique_id) for entity in entities)
+            assert len(set(ids)) == len(ids)
+            unique_ids.append(set(ids))
+        shared = coordinators[0]._session.session is coordinators[1]._session.session
+        return unique_ids[0], unique_ids[1], shared
+    finally:
+        for coordinator in coordinators:
+            await coordinator.async_close()
+        await simulator.stop()
+        await hass.async_stop(force=True)
+
+
+def test_units_behind_one_gateway_have_distinct_unique_ids(tmp_path) -> None:
+    """Entities of two slave IDs on one connection must not collide."""
+    first, second, shared = asyncio.run(_async_unique_ids(tmp_path))
+    assert shared
+    assert first and second
+    assert not first & second
+    assert all(unique_id.startswith("127.0.0.1_1_") for _, unique_id in first)
+    assert all(unique_id.startswith("127.0.0.1_2_") for _, unique_id in second)
+
+
+def test_migrate_unique_id() -> None:
+    """Unique IDs from before the slave ID was part of them are migrated once."""
+
+    def entry(unique_id: str) -> er.RegistryEntry:
+        return SimpleNamespace(unique_id=unique_id)
+
+    assert migrate_unique_id(entry("10.0.0.5_temp_indoor"), "10.0.0.5", 3) == {
+        "new_unique_id": "10.0.0.5_3_temp_indoor"
+    }
+    assert migrate_unique_id(entry("10.0.0.5_3_temp_indoor"), "10.0.0.5", 3) is None
+    assert migrate_unique_id(entry("10.0.0.6_temp_indoor"), "10.0.0.5", 3) is None
@@ -0,0 +1,67 @@
+"""Short-horizon register history."""
+from __future__ import annotations
+
+from custom_components.jablotron_futura.history import JablotronFuturaHistory
+from custom_components.jablotron_futura.snapshot import Snapshot
+
+KEYS = ("temp_indoor", "humidity_indoor", "serial_number")
+
+
+def _snapshot(**values) -> Snapshot:
+    """Return a snapshot holding values."""
+    data = Snapshot()
+    for key, value in values.items():
+        data[key] = value
+    return data
+
+
+def test_ring_keeps_the_newest_samples_oldest_first() -> None:
+    """Once full, every poll overwrites the oldest sample."""
+    history = JablotronFuturaHistory(KEYS, size=4)
+    for second in range(6):
+        history.append(second, _snapshot(temp_indoor=20 + second / 10))
+
+    samples = history.query(0, 10)["temp_indoor"]
+    assert samples == [(2, 20.2), (3, 20.3), (4, 20.4), (5, 20.5)]
+    assert history.query(3, 4, ["temp_indoor"]) == {"temp_indoor": [(3, 20.3), (4, 20.4)]}
+
+
+def test_ring_before_it_wraps() -> None:
+    """A ring that is not full yet only returns the samples recorded."""
+    history = JablotronFuturaHistory(KEYS, size=4)
+    history.append(1.0, _snapshot(temp_indoor=21.0))
+    history.append(2.0, _snapshot(temp_indoor=21.1))
+    assert history.query(0, 10)["temp_indoor"] == [(1.0, 21.0), (2.0, 21.1)]
+
+
+def test_missing_values_and_registers() -> None:
+    """A register gets its ring with its first value, gaps read back as None."""
+    history = JablotronFuturaHistory(KEYS, size=4)
+    history.append(1, _snapshot(humidity_indoor=40.5))
+    history.append(2, _snapshot(temp_indoor=21.0, humidity_indoor=None))
+    history.append(3, _snapshot(temp_indoor=-5.5, serial_number=4000000000))
+
+    result = history.query(0, 10)
+    assert result["humidity_indoor"] == [(1, 40.5), (2, None), (3, None)]
+    assert result["temp_indoor"] == [(1, None), (2, 21.0), (3, -5.5)]
+    assert result["serial_number"] == [(1, None), (2, None), (3, 4000000000)]
+
+
+def test_downsampled_query_averages_buckets() -> None:
+    """Samples are averaged per bucket, all-gap buckets give None."""
+    history = JablotronFuturaHistory(KEYS, size=8)
+    for second, value in ((0, 20.0), (10, 21.0), (20, None), (30, 22.0), (40, 23.0)):
+        history.append(second, _snapshot(temp_indoor=value))
+    assert history.query(0, 50, resolution=20)["temp_indoor"] == [
+        (0, 20.5),
+        (20, 22.0),
+        (40, 23.0),
+    ]
+
+
+def test_memory_is_bounded_by_the_size() -> None:
+    """Memory depends on the ring size and register width, not the number of polls."""
+    history = JablotronFuturaHistory(KEYS, size=4)
+    for second in range(100):
+        history.append(second, _snapshot(temp_indoor=21.0, serial_number=1))
+    assert history.memory_usage() == {"temp_indoor": 8, "serial_number": 16, "timestamps": 32}
@@ -0,0 +1,72 @@
+"""Adaptive poll interval."""
+from __future__ import annotations
+
+from custom_components.jablotron_futura.const import SCAN_INTERVAL
+from custom_components.jablotron_futura.interval import (
+    REASON_ACTIVE,
+    REASON_INITIAL,
+    REASON_STABLE,
+    REASON_STANDBY,
+    REASON_VOLATILE,
+    AdaptivePollInterval,
+)
+from custom_components.jablotron_futura.snapshot import Snapshot
+
+
+def _snapshot(temp_indoor: float = 22.0, **flags: bool) -> Snapshot:
+    """Return the data of a running unit, with flags overridden."""
+    data = Snapshot()
+    data["temp_indoor"] = temp_indoor
+    data["temp_fresh"] = 19.0
+    data["mode_device_on"] = True
+    data["mode_standby"] = False
+    for key, value in flags.items():
+        data[key] = value
+    return data
+
+
+def test_stable_unit_relaxes_to_the_maximum() -> None:
+    """The interval grows while nothing moves, up to the maximum."""
+    controller = AdaptivePollInterval(5, 120)
+    assert (controller.interval, controller.reason) == (SCAN_INTERVAL, REASON_INITIAL)
+    intervals = []
+    for _ in range(6):
+        intervals.append(controller.update(_snapshot(), controller.interval))
+    assert intervals == [45, 67.5, 101.25, 120, 120, 120]
+    assert controller.reason == REASON_STABLE
+
+
+def test_active_mode_polls_at_the_minimum() -> None:
+    """A boost or a pressed zone button polls at once at the minimum."""
+    controller = AdaptivePollInterval(5, 120, initial=120)
+    assert controller.update(_snapshot(mode_boost_active=True), 120) == 5
+    assert controller.reason == REASON_ACTIVE
+    assert controller.update(_snapshot(zone_2_button_active=1), 5) == 5
+    assert controller.update(_snapshot(), 5) == 7.5
+
+
+def test_standby_polls_at_the_maximum() -> None:
+    """A unit that is off or in standby is polled rarely."""
+    controller = AdaptivePollInterval(5, 120)
+    assert controller.update(_snapshot(mode_standby=True), 30) == 120
+    assert controller.reason == REASON_STANDBY
+    assert controller.update(_snapshot(mode_device_on=False), 120) == 120
+
+
+def test_volatile_values_tighten_the_interval() -> None:
+    """A value moving faster than its threshold over the window halves the interval."""
+    controller = AdaptivePollInterval(5, 120, initial=60)
+    controller.update(_snapshot(22.0), 0)
+    assert controller.update(_snapshot(23.0), 60) == 45
+    assert controller.reason == REASON_VOLATILE
+    # The verdict holds until the next window is complete
+    assert controller.update(_snapshot(23.4), 20) == 22.5
+    assert controller.update(_snapshot(23.0), 40) == 33.75
+    assert controller.reason == REASON_STABLE
+
+
+def test_bounds() -> None:
+    """The interval never leaves the configured bounds."""
+    controller = AdaptivePollInterval(10, 5, initial=1)
+    assert (controller.minimum, controller.maximum, controller.interval) == (10, 10, 10)
+    assert controller.update(_snapshot(), 10) == 10
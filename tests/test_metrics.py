@@ -0,0 +1,85 @@
+"""Modbus transaction metrics."""
+from __future__ import annotations
+
+from custom_components.jablotron_futura.const import LATENCY_BUCKETS
+from custom_components.jablotron_futura.metrics import (
+    READ_INPUT_REGISTERS,
+    LatencyHistogram,
+    Transaction,
+    TransactionMetrics,
+)
+
+
+def test_empty_histogram() -> None:
+    """Nothing recorded, no percentiles."""
+    assert LatencyHistogram().as_dict() == {
+        "count": 0,
+        "avg_ms": None,
+        "p50_ms": None,
+        "p95_ms": None,
+        "p99_ms": None,
+        "max_ms": 0.0,
+    }
+
+
+def test_percentiles_fall_into_the_right_buckets() -> None:
+    """Each percentile lies within the bucket holding its rank, never above the maximum."""
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(0.010)
+    for _ in range(10):
+        histogram.record(0.100)
+
+    stats = histogram.as_dict()
+    assert stats["count"] == 100
+    assert stats["avg_ms"] == 19.0
+    assert stats["max_ms"] == 100.0
+    assert 9.09 <= stats["p50_ms"] <= 11.37
+    assert 84.7 <= stats["p95_ms"] <= 100.0
+    assert 84.7 <= stats["p99_ms"] <= 100.0
+    assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+
+
+def test_latency_above_the_last_bucket() -> None:
+    """Outliers land in the overflow bucket and are estimated up to the maximum."""
+    histogram = LatencyHistogram()
+    histogram.record(LATENCY_BUCKETS[-1] / 1000 * 2)
+    assert histogram.buckets[-1] == 1
+    assert histogram.percentile(100) == round(LATENCY_BUCKETS[-1] * 2, 2)
+    assert LATENCY_BUCKETS[-1] <= histogram.percentile(50) <= histogram.max
+
+
+def test_transactions_count_per_block_and_function() -> None:
+    """Every attempt counts towards the total, its block and its function code."""
+    metrics = TransactionMetrics(frame_overhead=7)
+    read = Transaction.read(READ_INPUT_REGISTERS, "input", 16, 37)
+    write = Transaction.write(300, 3)
+
+    metrics.record_sent(read, retry=False)
+    metrics.record_failure(read, timeout=True)
+    metrics.record_sent(read, retry=True)
+    metrics.record_response(read, 0.02, error=False)
+    metrics.record_sent(write, retry=False)
+    metrics.record_response(write, 0.01, error=True)
+
+    stats = metrics.as_dict()
+    block = stats["blocks"]["input 16-52"]
+    assert (block["transactions"], block["retries"], block["timeouts"]) == (1, 1, 1)
+    assert block["bytes_sent"] == 2 * (5 + 7)
+    assert block["bytes_received"] == 2 + 2 * 37 + 7
+    assert block["latency"]["count"] == 1
+
+    function = stats["functions"]["write_registers"]
+    assert (function["transactions"], function["exceptions"]) == (1, 1)
+    assert function["bytes_sent"] == 6 + 2 * 3 + 7
+    assert function["bytes_received"] == 2 + 7
+    assert stats["blocks"]["holding 300-302"]["exceptions"] == 1
+
+    total = stats["total"]
+    assert (total["transactions"], total["retries"], total["timeouts"], total["exceptions"]) == (
+        2,
+        1,
+        1,
+        1,
+    )
+    assert total["latency"]["count"] == 2
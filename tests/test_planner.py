@@ -0,0 +1,108 @@
+"""Read planning: gap bridging, request size and polling tiers."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.jablotron_futura.const import (
+    HOLDING_REGISTERS,
+    INPUT_REGISTERS,
+    MAX_READ_REGISTERS,
+    TIER_FAST,
+    TIER_SLOW,
+    TIER_STATIC,
+    TIERS,
+)
+from custom_components.jablotron_futura.planner import (
+    READ_PLAN,
+    build_tiered_plan,
+    plan_blocks,
+    plan_keys,
+    register_width,
+)
+
+REGISTERS = {"input": INPUT_REGISTERS, "holding": HOLDING_REGISTERS}
+
+
+def _registers(*addresses: int, kind: str = "uint16") -> dict[str, dict]:
+    """Return a register map with one register of a type at each address."""
+    return {f"r{address}": {"address": address, "type": kind} for address in addresses}
+
+
+def test_gap_up_to_max_gap_is_bridged() -> None:
+    """A hole of at most max_gap words is read along rather than split."""
+    registers = _registers(0, 5, 20)
+    assert plan_blocks(registers, max_gap=4) == [(0, 6), (20, 1)]
+    assert plan_blocks(registers, max_gap=3) == [(0, 1), (5, 1), (20, 1)]
+    assert plan_blocks(registers, max_gap=15) == [(0, 21)]
+
+
+def test_requests_stay_within_max_count() -> None:
+    """No request reads more than the Modbus limit of 125 registers."""
+    blocks = plan_blocks(_registers(*range(300)), max_gap=10)
+    assert blocks == [(0, MAX_READ_REGISTERS), (125, MAX_READ_REGISTERS), (250, 50)]
+    assert plan_blocks(_registers(*range(300)), max_gap=10, max_count=64)[0] == (0, 64)
+
+
+def test_multi_word_register_is_not_split() -> None:
+    """A 32-bit register at the size limit starts the next request."""
+    registers = {**_registers(*range(124)), **_registers(124, kind="uint32")}
+    assert plan_blocks(registers, max_gap=0) == [(0, 124), (124, 2)]
+
+
+def test_gap_is_not_bridged_across_a_barrier() -> None:
+    """Words read by another tier are never read twice."""
+    registers = _registers(0, 5)
+    assert plan_blocks(registers, max_gap=10) == [(0, 6)]
+    assert plan_blocks(registers, max_gap=10, barriers=[(2, 1)]) == [(0, 1), (5, 1)]
+
+
+@pytest.mark.parametrize("max_gap", [0, 5, 10, 24, 40])
+@pytest.mark.parametrize("max_count", [16, 64, MAX_READ_REGISTERS])
+@pytest.mark.parametrize("exclude", [frozenset(), frozenset({"vzv_identify", "zone_3_co2"})])
+def test_tiered_plan_reads_every_word_once(max_gap, max_count, exclude) -> None:
+    """Every register is planned exactly once and no two requests overlap."""
+    plan = build_tiered_plan(max_gap, max_count, exclude)
+    for kind, registers in REGISTERS.items():
+        blocks = [block for tier in TIERS for block in plan[tier] if block.kind == kind]
+        words = [
+            address for block in blocks for address in range(block.start, block.start + block.count)
+        ]
+        assert len(words) == len(set(words))
+        assert all(block.count <= max_count for block in blocks)
+
+        planned = [name for block in blocks for _, name, _ in block.registers]
+        assert sorted(planned) == sorted(set(registers) - exclude)
+        for block in blocks:
+            for offset, name, config in block.registers:
+                assert offset + register_width(config) <= block.count
+                assert registers[name] is config
+
+
+def test_riders_are_only_decoded_when_their_tier_is_due() -> None:
+    """Slow registers inside a fast block are skipped on fast-only polls."""
+    block = next(
+        block
+        for block in READ_PLAN[TIER_FAST]
+        if any(tier == TIER_SLOW for tier, _ in block.riders)
+    )
+    slow = {
+        name for _, name, config in block.registers if config.get("tier") == TIER_SLOW
+    }
+    fast_keys = {key for decoder in block.decoders((TIER_FAST,)) for key in decoder.keys}
+    all_keys = {key for decoder in block.decoders() for key in decoder.keys}
+    assert slow and not slow & fast_keys
+    assert slow <= all_keys
+    assert all_keys == {name for _, name, _ in block.registers}
+
+
+def test_plan_keys_follow_register_tiers() -> None:
+    """Riders count towards their own tier, not the block's."""
+    keys = plan_keys(READ_PLAN)
+    for tier in TIERS:
+        assert all(
+            REGISTERS["input"].get(key, REGISTERS["holding"].get(key)).get("tier", TIER_FAST)
+            == tier
+            for key in keys[tier]
+        )
+    assert "serial_number" in keys[TIER_STATIC]
+    assert "temp_setpoint" in keys[TIER_SLOW]
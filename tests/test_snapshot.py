@@ -0,0 +1,71 @@
+"""Slot-indexed coordinator data."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.jablotron_futura.const import TIERS
+from custom_components.jablotron_futura.planner import READ_PLAN
+from custom_components.jablotron_futura.snapshot import (
+    KEYS,
+    SLOTS,
+    STATUS_FLAGS,
+    ZONE_SLOTS,
+    Snapshot,
+)
+
+
+def test_slots_are_unique() -> None:
+    """Every register and flag has a slot of its own."""
+    assert len(set(KEYS)) == len(KEYS)
+    assert sorted(SLOTS.values()) == list(range(len(KEYS)))
+    assert SLOTS["zone_1_co2"] == ZONE_SLOTS[1].co2
+    assert all(key in SLOTS for key in STATUS_FLAGS)
+
+
+def test_read_blocks_store_into_consecutive_slots() -> None:
+    """The registers of one tier of a block land in one slice of the snapshot."""
+    for block in (block for tier in TIERS for block in READ_PLAN[tier]):
+        for decoder in block.decoders():
+            slots = [SLOTS[key] for key in decoder.keys]
+            assert slots == list(range(slots[0], slots[0] + len(slots))), block.name
+
+
+def test_snapshot_behaves_like_a_dict() -> None:
+    """None is an absent key, copies are independent."""
+    data = Snapshot()
+    assert len(data) == 0
+    assert "temp_indoor" not in data
+    assert data.get("temp_indoor", 1) == 1
+    assert data.get("no_such_key") is None
+
+    data["temp_indoor"] = 21.5
+    data["current_mode"] = 0
+    assert data["temp_indoor"] == 21.5
+    assert data.value(SLOTS["temp_indoor"]) == 21.5
+    assert "current_mode" in data
+    assert dict(data) == {"temp_indoor": 21.5, "current_mode": 0}
+
+    copy = data.copy()
+    copy["temp_indoor"] = 22.0
+    del copy["current_mode"]
+    assert data["temp_indoor"] == 21.5
+    assert "current_mode" in data
+    assert list(copy) == ["temp_indoor"]
+
+    data["temp_indoor"] = None
+    assert "temp_indoor" not in data
+    with pytest.raises(KeyError):
+        data["temp_indoor"]
+    with pytest.raises(KeyError):
+        del data["temp_indoor"]
+
+
+def test_bit_reads_a_status_word() -> None:
+    """Flags are read from the raw status word without expanding it."""
+    data = Snapshot()
+    slot, mask = next(iter(STATUS_FLAGS.values()))
+    assert data.bit(slot, mask) is False
+    data.values[slot] = mask
+    assert data.bit(slot, mask) is True
+    data.values[slot] = 0
+    assert data.bit(slot, mask) is False
@@ -0,0 +1,180 @@
+"""Write coalescing and optimistic values against the simulator."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+
+from homeassistant.core import Event, HomeAssistant, callback
+
+from custom_components.jablotron_futura.const import (
+    EVENT_WRITE_REJECTED,
+    HOLDING_REGISTERS,
+    TRANSPORT_TCP,
+    WRITE_CONFIRM_TIMEOUT,
+)
+from custom_components.jablotron_futura.coordinator import JablotronFuturaCoordinator
+from custom_components.jablotron_futura.metrics import (
+    WRITE_MULTIPLE_REGISTERS,
+    WRITE_SINGLE_REGISTER,
+)
+from custom_components.jablotron_futura.transport import ModbusEndpoint
+from custom_components.jablotron_futura.write_buffer import contiguous_runs
+from tools.simulator import FuturaModel, FuturaSimulator
+
+VENTILATION_LEVEL = HOLDING_REGISTERS["ventilation_level"]["address"]
+TIME_PROGRAM_ENABLE = HOLDING_REGISTERS["time_program_enable"]["address"]
+ANTIRADON_ENABLE = HOLDING_REGISTERS["antiradon_enable"]["address"]
+
+
+def _run(tmp_path, test: Callable[..., Awaitable[None]]) -> None:
+    """Run test(coordinator, model, simulator, events) against a polled simulated unit."""
+
+    async def run() -> None:
+        model = FuturaModel(seed=1)
+        simulator = FuturaSimulator({1: model})
+        port = await simulator.start(port=0)
+        hass = HomeAssistant(str(tmp_path))
+        coordinator = JablotronFuturaCoordinator(
+            hass, ModbusEndpoint(TRANSPORT_TCP, "127.0.0.1", port), 1
+        )
+        events: list[dict] = []
+
+        @callback
+        def rejected(event: Event) -> None:
+            events.append(event.data)
+
+        hass.bus.async_listen(EVENT_WRITE_REJECTED, rejected)
+        try:
+            coordinator.data = await coordinator._async_update_data()
+            await test(coordinator, model, simulator, events)
+        finally:
+            await coordinator.async_close()
+            await simulator.stop()
+            await hass.async_stop(force=True)
+
+    asyncio.run(run())
+
+
+async def _async_wait_for(condition: Callable[[], bool]) -> None:
+    """Wait for a background read-back to get somewhere."""
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError("Condition not met")
+
+
+def test_contiguous_runs() -> None:
+    """Writes to neighbouring registers form one run each, in address order."""
+    assert contiguous_runs({}) == []
+    assert contiguous_runs({13: 1, 0: 3, 12: 0, 14: 5, 20: 7}) == [
+        (0, [3]),
+        (12, [0, 1, 5]),
+        (20, [7]),
+    ]
+
+
+def test_writes_within_the_window_share_one_pdu(tmp_path) -> None:
+    """Neighbouring writes issued together are sent as one request and confirmed."""
+
+    async def test(coordinator, model, simulator, events) -> None:
+        results = await asyncio.gather(
+            coordinator.async_write_register(ANTIRADON_ENABLE, 1),
+            coordinator.async_write_register(TIME_PROGRAM_ENABLE, 1),
+            coordinator.async_write_register(VENTILATION_LEVEL, 4),
+        )
+        assert results == [True, True, True]
+        assert simulator.requests[WRITE_MULTIPLE_REGISTERS] == 1
+        assert simulator.requests[WRITE_SINGLE_REGISTER] == 1
+        assert coordinator.write_statistics["pdus_saved"] == 1
+        assert model.get("holding", "antiradon_enable") == 1
+        assert model.get("holding", "time_program_enable") == 1
+        assert model.get("holding", "ventilation_level") == 4
+
+        await _async_wait_for(lambda: coordinator.write_confirmations == 3)
+        assert coordinator.data["ventilation_level"] == 4
+        assert coordinator.write_rollbacks == 0
+        assert not events
+
+    _run(tmp_path, test)
+
+
+def test_later_write_to_a_register_wins(tmp_path) -> None:
+    """Writes to one register within the window collapse into the last one."""
+
+    async def test(coordinator, model, simulator, events) -> None:
+        results = await asyncio.gather(
+            coordinator.async_write_register(VENTILATION_LEVEL, 1),
+            coordinator.async_write_register(VENTILATION_LEVEL, 3),
+        )
+        assert results == [True, True]
+        assert simulator.requests[WRITE_SINGLE_REGISTER] == 1
+        assert model.get("holding", "ventilation_level") == 3
+
+    _run(tmp_path, test)
+
+
+def test_rejected_write_rolls_back(tmp_path) -> None:
+    """A value the unit refuses goes back to the last known value."""
+
+    async def test(coordinator, model, simulator, events) -> None:
+        write = asyncio.ensure_future(coordinator.async_write_register(VENTILATION_LEVEL, 9))
+        await asyncio.sleep(0)
+        # Shown right away
+        assert coordinator.data["ventilation_level"] == 9
+        assert await write is False
+        assert coordinator.data["ventilation_level"] == 2
+        assert model.get("holding", "ventilation_level") == 2
+        assert coordinator.write_rollbacks == 1
+        assert events == [
+            {
+                "host": "127.0.0.1",
+                "key": "ventilation_level",
+                "expected": 9,
+                "actual": 2,
+                "reason": "write_failed",
+            }
+        ]
+
+    _run(tmp_path, test)
+
+
+def test_device_mismatch_rolls_back_to_the_device_value(tmp_path) -> None:
+    """A read after an acknowledged write that disagrees with it wins."""
+
+    async def test(coordinator, model, simulator, events) -> None:
+        coordinator._set_optimistic(VENTILATION_LEVEL, [4])
+        coordinator._acknowledge_write(VENTILATION_LEVEL, True)
+        # Changed on the unit's panel in the meantime
+        model.set("holding", "ventilation_level", 5)
+        coordinator.data = await coordinator._async_update_data()
+        await asyncio.sleep(0)
+        assert coordinator.data["ventilation_level"] == 5
+        assert coordinator.write_rollbacks == 1
+        assert events[0]["reason"] == "device_mismatch"
+        assert events[0]["actual"] == 5
+
+    _run(tmp_path, test)
+
+
+def test_unconfirmed_write_expires(tmp_path) -> None:
+    """An optimistic value no read confirms is dropped after WRITE_CONFIRM_TIMEOUT."""
+
+    async def test(coordinator, model, simulator, events) -> None:
+        # Never acknowledged, e.g. the answer got lost
+        coordinator._set_optimistic(VENTILATION_LEVEL, [4])
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.data["ventilation_level"] == 4
+        assert not events
+
+        coordinator._pending_writes["ventilation_level"].written_at = (
+            time.monotonic() - WRITE_CONFIRM_TIMEOUT
+        )
+        coordinator.data = await coordinator._async_update_data()
+        await asyncio.sleep(0)
+        assert coordinator.data["ventilation_level"] == 2
+        assert not coordinator._pending_writes
+        assert events[0]["reason"] == "unconfirmed"
+
+    _run(tmp_path, test)
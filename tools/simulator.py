@@ -0,0 +1,570 @@
+"""Simulated Jablotron Futura unit serving its register map over Modbus.
+
+The input and holding address spaces are generated from INPUT_REGISTERS and
+HOLDING_REGISTERS in const.py and encoded with the integration's own type
+table. Values follow simple dynamics:
+
+- outdoor temperature and humidity swing over the day, indoor values drift
+  slowly, and supply and exhaust air follow them through the heat exchanger
+- fan PWM follows the ventilation level and the active mode, and the RPM
+  follows the PWM with a lag
+- timers flagged "countdown" in const.py count down by themselves and set
+  the matching mode bits in current_mode while they run
+- measurements jitter by their last digit
+
+Writes to holding registers are validated against the register
+definitions and take effect like on the unit. Latency, jitter and faults
+(dropped replies, busy exceptions, disconnects, corrupted frames) can be
+injected to exercise the client side.
+
+Run from the repository root:
+
+    python tools/simulator.py --port 5020
+    python tools/simulator.py --port 5020 --slave 1 --slave 2 --latency 0.02 --drop-rate 0.01
+    python tools/simulator.py --port 5021 --framer rtu --zones 3 --speed 60
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import logging
+import math
+from pathlib import Path
+import random
+import struct
+import sys
+import time
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.jablotron_futura.const import (  # noqa: E402
+    CONFIG_BITS,
+    HOLDING_REGISTERS,
+    INPUT_REGISTERS,
+    MODE_BITS,
+    ZONE_BITS,
+)
+from custom_components.jablotron_futura.decoder import TYPE_CODES  # noqa: E402
+
+_LOGGER = logging.getLogger("futura_simulator")
+
+DAY = 24 * 3600
+
+# Modbus function codes and exception codes
+READ_HOLDING_REGISTERS = 0x03
+READ_INPUT_REGISTERS = 0x04
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_DATA_ADDRESS = 0x02
+ILLEGAL_DATA_VALUE = 0x03
+SLAVE_DEVICE_BUSY = 0x06
+GATEWAY_TARGET_FAILED = 0x0B
+
+MODE = {name: 1 << bit for bit, name in MODE_BITS.items()}
+CONFIG = {name: 1 << bit for bit, name in CONFIG_BITS.items()}
+ZONE = {name: 1 << bit for bit, name in ZONE_BITS.items()}
+
+# Countdown timer -> mode bit set while it runs, and the fan PWM it drives
+# (supply, exhaust)
+TIMER_MODES = {
+    "boost_time": ("boost_active", (90, 90)),
+    "circulation_time": ("circulation_active", (40, 0)),
+    "overpressure_time": ("overpressure_active", (70, 40)),
+    "night_time": ("night_mode_active", (20, 20)),
+    "party_time": ("party_active", (80, 80)),
+}
+LEVEL_PWM = {0: 0, 1: 20, 2: 35, 3: 50, 4: 70, 5: 90, 6: 45}
+RPM_PER_PWM = 32  # rpm per % PWM
+FAN_TIME_CONSTANT = 6.0  # seconds for the fans to cover 63 % of a speed change
+AIR_FLOW_PER_PWM = 3.2  # m³/h per % PWM
+HEAT_EXCHANGER_EFFICIENCY = 0.88
+
+
+class ModbusError(Exception):
+    """A request the unit answers with a Modbus exception."""
+
+    def __init__(self, code: int) -> None:
+        """Initialize with the exception code."""
+        super().__init__(code)
+        self.code = code
+
+
+def address_space(registers: dict[str, dict[str, Any]]) -> int:
+    """Return the number of words covering every register of a map."""
+    return max(
+        config["address"] + max(TYPE_CODES[config["type"]][1], config.get("count", 1))
+        for config in registers.values()
+    )
+
+
+class FuturaModel:
+    """Register contents and dynamics of one simulated unit."""
+
+    def __init__(
+        self,
+        serial_number: int = 1234567,
+        zones: int = 0,
+        seed: int | None = None,
+        speed: float = 1.0,
+        clock: Any = time.monotonic,
+    ) -> None:
+        """Initialize a unit at level 2 on a mild day."""
+        self.rng = random.Random(seed)
+        self.speed = speed
+        self._clock = clock
+        self._started = clock()
+        self._time = 0.0  # simulated seconds since start
+        self.input = [0] * address_space(INPUT_REGISTERS)
+        self.holding = [0] * address_space(HOLDING_REGISTERS)
+        self.zones = zones
+
+        config = CONFIG["internal_heating_supported"] | CONFIG["bypass_supported"]
+        if zones:
+            config |= CONFIG["variobreeze_supported"]
+        for key, value in {
+            "device_id": 39,
+            "serial_number": serial_number,
+            "hw_version": 0x00010002,
+            "fw_version": 0x00020105,
+            "regmap_version": 0x00010003,
+            "device_variant": 2,
+            "device_config": config,
+            "filter_wear_level": 23,
+            "voltage_uin1": 3.3,
+            "battery_voltage": 3.02,
+            "temp_external_ntc": -99,
+        }.items():
+            self.set("input", key, value)
+        address = INPUT_REGISTERS["mac_address"]["address"]
+        self.input[address : address + 3] = [0x0050, 0xC2A8, 0x1234]
+        for key, value in {
+            "ventilation_level": 2,
+            "temp_setpoint": 22,
+            "humidity_setpoint": 50,
+            "bypass_enable": 1,
+            "vb_boost_volume": 100,
+            "vb_kitchen_hood_volume": 120,
+        }.items():
+            self.set("holding", key, value)
+
+        # Continuous state behind the integer registers
+        self.indoor = 22.0
+        self.indoor_humidity = 42.0
+        self.rpm = [LEVEL_PWM[2] * RPM_PER_PWM] * 2
+        self.co2 = {zone: 600.0 for zone in range(1, zones + 1)}
+        self.bypass_open = False
+        self.timers: dict[str, float] = {}
+        identify = 0
+        for zone in range(1, zones + 1):
+            identify |= ZONE[f"supply_zone_{zone}"] | ZONE[f"exhaust_zone_{zone}"]
+            self.set("holding", f"zone_{zone}_sensors_present", 0x0F)
+            self.set("holding", f"zone_{zone}_button_present", 1)
+        if zones:
+            self.set("input", "vzv_identify", identify)
+        self.advance()
+
+    # ------------------------------------------------------------------ #
+    # Register access
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _definition(kind: str, key: str) -> dict[str, Any]:
+        """Return the definition of a register."""
+        return (INPUT_REGISTERS if kind == "input" else HOLDING_REGISTERS)[key]
+
+    def _space(self, kind: str) -> list[int]:
+        """Return the words of an address space."""
+        return self.input if kind == "input" else self.holding
+
+    def set(self, kind: str, key: str, value: float) -> None:
+        """Encode a decoded value into the words of a register."""
+        config = self._definition(kind, key)
+        code, width = TYPE_CODES[config["type"]]
+        raw = round(value / config["scale"] if "scale" in config else value)
+        words = struct.unpack(f">{width}H", struct.pack(f">{code}", raw))
+        address = config["address"]
+        self._space(kind)[address : address + width] = words
+
+    def get(self, kind: str, key: str) -> float:
+        """Decode the value of a register."""
+        config = self._definition(kind, key)
+        code, width = TYPE_CODES[config["type"]]
+        address = config["address"]
+        words = self._space(kind)[address : address + width]
+        (raw,) = struct.unpack(f">{code}", struct.pack(f">{width}H", *words))
+        return raw * config["scale"] if "scale" in config else raw
+
+    def _jitter(self, kind: str, key: str, value: float, lsb: int = 1) -> None:
+        """Set a measurement with last-digit noise."""
+        config = self._definition(kind, key)
+        scale = config.get("scale", 1)
+        self.set(kind, key, value + self.rng.randint(-lsb, lsb) * scale)
+
+    def read(self, kind: str, address: int, count: int) -> list[int]:
+        """Return count words starting at address."""
+        space = self._space(kind)
+        if count < 1 or count > 125 or address + count > len(space):
+            raise ModbusError(ILLEGAL_DATA_ADDRESS)
+        self.advance()
+        return space[address : address + count]
+
+    def write(self, address: int, values: list[int]) -> None:
+        """Write holding registers, validated like the unit does."""
+        if not values or address + len(values) > len(self.holding):
+            raise ModbusError(ILLEGAL_DATA_ADDRESS)
+        self.advance()
+        previous = self.holding[address : address + len(values)]
+        self.holding[address : address + len(values)] = values
+        for key, config in HOLDING_REGISTERS.items():
+            start = config["address"]
+            if not address <= start < address + len(values):
+                continue
+            value = self.get("holding", key)
+            if not config.get("min", value) <= value <= config.get("max", value):
+                self.holding[address : address + len(values)] = previous
+                raise ModbusError(ILLEGAL_DATA_VALUE)
+            if config.get("countdown"):
+                self.timers[key] = float(value)
+
+    # ------------------------------------------------------------------ #
+    # Dynamics
+    # ------------------------------------------------------------------ #
+
+    def advance(self) -> None:
+        """Step the simulation to the current time."""
+        now = (self._clock() - self._started) * self.speed
+        dt = now - self._time
+        self._time = now
+        self._count_down(dt)
+        supply_pwm, exhaust_pwm = self._fans(dt)
+        self._climate(dt, supply_pwm, exhaust_pwm)
+        self._zones(dt, supply_pwm)
+        self._mode(supply_pwm)
+
+    def _count_down(self, dt: float) -> None:
+        """Run the countdown timers down."""
+        for key in list(self.timers):
+            remaining = max(0.0, self.timers[key] - dt)
+            self.set("holding", key, math.ceil(remaining))
+            if remaining:
+                self.timers[key] = remaining
+            else:
+                del self.timers[key]
+
+    def _fans(self, dt: float) -> tuple[int, int]:
+        """Set the PWM of the active mode and let the RPM follow it."""
+        level = int(self.get("holding", "ventilation_level"))
+        pwm = (LEVEL_PWM.get(level, 0),) * 2
+        for key, (_, mode_pwm) in TIMER_MODES.items():
+            if key in self.timers:
+                pwm = mode_pwm
+                break
+        if any(key.endswith("_button_timer") for key in self.timers):
+            pwm = (max(pwm[0], 80), max(pwm[1], 80))
+
+        lag = 1 - math.exp(-dt / FAN_TIME_CONSTANT) if dt > 0 else 0.0
+        for index, (key, fan_pwm) in enumerate(zip(("supply", "exhaust"), pwm)):
+            self.rpm[index] += (fan_pwm * RPM_PER_PWM - self.rpm[index]) * lag
+            self.set("input", f"fan_{key}_pwm", fan_pwm)
+            self._jitter("input", f"fan_{key}_rpm", max(0.0, self.rpm[index]), 8 if fan_pwm else 0)
+        return pwm
+
+    def _climate(self, dt: float, supply_pwm: int, exhaust_pwm: int) -> None:
+        """Update temperatures, humidities and power figures."""
+        phase = 2 * math.pi * (self._time % DAY) / DAY
+        outdoor = 8.0 + 6.0 * math.sin(phase)
+        outdoor_humidity = 75.0 - 15.0 * math.sin(phase)
+        # Indoor air drifts slowly around the setpoint
+        setpoint = self.get("holding", "temp_setpoint")
+        self.indoor += (setpoint - self.indoor) * min(1.0, dt / 3600) + self.rng.gauss(0, 0.002) * math.sqrt(max(dt, 0))
+        self.indoor_humidity += (42.0 - self.indoor_humidity) * min(1.0, dt / 7200)
+
+        efficiency = HEAT_EXCHANGER_EFFICIENCY if supply_pwm and exhaust_pwm else 0.0
+        # Bypass opens for free cooling when it is too warm inside
+        self.bypass_open = bool(
+            self.get("holding", "bypass_enable") and self.indoor > setpoint + 1 and outdoor < self.indoor
+        )
+        if self.bypass_open:
+            efficiency = 0.0
+        fresh = outdoor + efficiency * (self.indoor - outdoor)
+        waste = self.indoor - efficiency * (self.indoor - outdoor)
+        for key, value in (
+            ("temp_ambient", outdoor),
+            ("temp_fresh", fresh),
+            ("temp_indoor", self.indoor),
+            ("temp_waste", waste),
+        ):
+            self._jitter("input", key, value)
+        for key, value in (
+            ("humidity_ambient", outdoor_humidity),
+            ("humidity_fresh", (outdoor_humidity + self.indoor_humidity) / 2),
+            ("humidity_indoor", self.indoor_humidity),
+            ("humidity_waste", self.indoor_humidity + 8),
+        ):
+            self._jitter("input", key, value, 2)
+
+        air_flow = supply_pwm * AIR_FLOW_PER_PWM
+        self._jitter("input", "air_flow", air_flow, 1 if air_flow else 0)
+        self._jitter("input", "power_consumption", 4 + 0.012 * (supply_pwm**2 + exhaust_pwm**2) / 10, 1)
+        self.set("input", "heat_recovery", max(0, round(0.34 * air_flow * (fresh - outdoor))))
+        self._jitter("input", "voltage_uin1", 3.3, 2)
+        self._jitter("input", "battery_voltage", 3.02, 1)
+
+    def _zones(self, dt: float, supply_pwm: int) -> None:
+        """Update the VarioBreeze zone sensors and buttons."""
+        for zone in range(1, self.zones + 1):
+            # Occupants add CO2, fresh air removes it
+            ventilation = supply_pwm / 100 * 0.002 * (self.co2[zone] - 420)
+            self.co2[zone] = max(420.0, self.co2[zone] + (0.15 - ventilation) * dt)
+            self._jitter("holding", f"zone_{zone}_co2", self.co2[zone], 3)
+            self._jitter("holding", f"zone_{zone}_temperature", self.indoor + 0.3 * zone - 0.6)
+            self._jitter("holding", f"zone_{zone}_humidity", self.indoor_humidity)
+            self._jitter("holding", f"zone_{zone}_floor_temperature", self.indoor + 1.5)
+            active = f"zone_{zone}_button_timer" in self.timers
+            self.set("holding", f"zone_{zone}_button_active", int(active))
+
+    def _mode(self, supply_pwm: int) -> None:
+        """Compose the current_mode status word."""
+        mode = 0
+        for key, (bit, _) in TIMER_MODES.items():
+            if key in self.timers:
+                mode |= MODE[bit]
+        if any(key.endswith("_button_timer") for key in self.timers):
+            mode |= MODE["zone_boost"]
+        if supply_pwm:
+            mode |= MODE["device_on"]
+        else:
+            mode |= MODE["standby"]
+        if self.get("holding", "time_program_enable"):
+            mode |= MODE["time_program_active"]
+        if self.get("holding", "antiradon_enable"):
+            mode |= MODE["antiradon_active"]
+        if self.bypass_open:
+            mode |= MODE["bypass_open"]
+        self.set("input", "current_mode", mode)
+
+
+@dataclass
+class FaultProfile:
+    """Transport behaviour of the simulated unit."""
+
+    latency: float = 0.0  # seconds before every reply
+    jitter: float = 0.0  # uniform extra delay up to this many seconds
+    drop_rate: float = 0.0  # requests left unanswered
+    exception_rate: float = 0.0  # requests answered with SLAVE_DEVICE_BUSY
+    disconnect_rate: float = 0.0  # requests answered by closing the connection
+    corrupt_rate: float = 0.0  # replies with a damaged frame
+
+
+def crc16(frame: bytes) -> int:
+    """Return the Modbus RTU CRC of a frame."""
+    crc = 0xFFFF
+    for byte in frame:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+class FuturaSimulator:
+    """asyncio Modbus server for one or more simulated units.
+
+    framer "socket" speaks Modbus TCP; "rtu" speaks RTU frames over TCP like
+    a transparent RS-485 converter.
+    """
+
+    def __init__(
+        self,
+        units: dict[int, FuturaModel],
+        faults: FaultProfile | None = None,
+        framer: str = "socket",
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the server."""
+        self.units = units
+        self.faults = faults or FaultProfile()
+        self.framer = framer
+        self.rng = random.Random(seed)
+        self.requests: dict[int, int] = {}
+        self.injected: dict[str, int] = {}
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 5020) -> int:
+        """Start listening and return the bound port (port 0 picks a free one)."""
+        self._server = await asyncio.start_server(self._handle, host, port)
+        bound = self._server.sockets[0].getsockname()[1]
+        _LOGGER.info(
+            "Serving slave IDs %s over Modbus %s on %s:%s",
+            sorted(self.units), "RTU over TCP" if self.framer == "rtu" else "TCP", host, bound,
+        )
+        return bound
+
+    async def stop(self) -> None:
+        """Stop listening and close the connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def _inject(self, fault: str, rate: float) -> bool:
+        """Return true if a fault should be injected, counting it."""
+        if rate and self.rng.random() < rate:
+            self.injected[fault] = self.injected.get(fault, 0) + 1
+            return True
+        return False
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection."""
+        read_frame = self._read_rtu if self.framer == "rtu" else self._read_socket
+        try:
+            while True:
+                request = await read_frame(reader)
+                if request is None:
+                    continue
+                header, unit, pdu = request
+                self.requests[pdu[0]] = self.requests.get(pdu[0], 0) + 1
+                reply = self._execute(unit, pdu)
+
+                faults = self.faults
+                delay = faults.latency + self.rng.uniform(0, faults.jitter)
+                if delay:
+                    await asyncio.sleep(delay)
+                if self._inject("disconnect", faults.disconnect_rate):
+                    break
+                if reply is None or self._inject("drop", faults.drop_rate):
+                    continue
+                if self._inject("exception", faults.exception_rate):
+                    reply = bytes((pdu[0] | 0x80, SLAVE_DEVICE_BUSY))
+                frame = self._frame(header, unit, reply)
+                if self._inject("corrupt", faults.corrupt_rate):
+                    position = self.rng.randrange(len(frame))
+                    frame = frame[:position] + bytes((frame[position] ^ 0xFF,)) + frame[position + 1 :]
+                writer.write(frame)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_socket(self, reader: asyncio.StreamReader) -> tuple[bytes, int, bytes]:
+        """Read one Modbus TCP request: MBAP header, unit ID and PDU."""
+        header = await reader.readexactly(7)
+        _, _, length, unit = struct.unpack(">HHHB", header)
+        return header[:4], unit, await reader.readexactly(length - 1)
+
+    async def _read_rtu(self, reader: asyncio.StreamReader) -> tuple[bytes, int, bytes] | None:
+        """Read one RTU request; frames with a bad CRC are ignored like on the bus."""
+        head = await reader.readexactly(2)
+        if head[1] == WRITE_MULTIPLE_REGISTERS:
+            fixed = await reader.readexactly(5)
+            body = fixed + await reader.readexactly(fixed[4] + 2)
+        else:
+            body = await reader.readexactly(6)
+        frame = head + body
+        if crc16(frame[:-2]) != int.from_bytes(frame[-2:], "little"):
+            self.injected["bad_crc_received"] = self.injected.get("bad_crc_received", 0) + 1
+            return None
+        return b"", head[0], frame[1:-2]
+
+    def _frame(self, header: bytes, unit: int, pdu: bytes) -> bytes:
+        """Wrap a reply PDU for the wire."""
+        if self.framer == "rtu":
+            frame = bytes((unit,)) + pdu
+            return frame + crc16(frame).to_bytes(2, "little")
+        return header + struct.pack(">HB", len(pdu) + 1, unit) + pdu
+
+    def _execute(self, unit: int, pdu: bytes) -> bytes | None:
+        """Return the reply PDU of a request, None if nobody answers."""
+        function = pdu[0]
+        model = self.units.get(unit)
+        if model is None:
+            # A TCP gateway reports the missing unit, on a bus nobody answers
+            return None if self.framer == "rtu" else bytes((function | 0x80, GATEWAY_TARGET_FAILED))
+        try:
+            if function in (READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS):
+                address, count = struct.unpack(">HH", pdu[1:5])
+                kind = "holding" if function == READ_HOLDING_REGISTERS else "input"
+                words = model.read(kind, address, count)
+                return struct.pack(f">BB{count}H", function, 2 * count, *words)
+            if function == WRITE_SINGLE_REGISTER:
+                address, value = struct.unpack(">HH", pdu[1:5])
+                model.write(address, [value])
+                return pdu[:5]
+            if function == WRITE_MULTIPLE_REGISTERS:
+                address, count, size = struct.unpack(">HHB", pdu[1:6])
+                if size != 2 * count:
+                    raise ModbusError(ILLEGAL_DATA_VALUE)
+                model.write(address, list(struct.unpack(f">{count}H", pdu[6 : 6 + size])))
+                return pdu[:5]
+            raise ModbusError(ILLEGAL_FUNCTION)
+        except ModbusError as err:
+            return bytes((function | 0x80, err.code))
+
+
+def _preset(model: FuturaModel, assignment: str) -> None:
+    """Apply a --set key=value assignment to a model."""
+    key, _, value = assignment.partition("=")
+    kind = "input" if key in INPUT_REGISTERS else "holding"
+    model.set(kind, key, float(value))
+    if HOLDING_REGISTERS.get(key, {}).get("countdown"):
+        model.timers[key] = float(value)
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run the simulator until interrupted."""
+    units = {}
+    for index, slave_id in enumerate(args.slave or [1]):
+        seed = None if args.seed is None else args.seed + index
+        model = FuturaModel(1234567 + slave_id, args.zones, seed, args.speed)
+        for assignment in args.set or []:
+            _preset(model, assignment)
+        units[slave_id] = model
+    faults = FaultProfile(
+        args.latency, args.jitter, args.drop_rate, args.exception_rate,
+        args.disconnect_rate, args.corrupt_rate,
+    )
+    simulator = FuturaSimulator(units, faults, args.framer, args.seed)
+    await simulator.start(args.host, args.port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+        _LOGGER.info("Requests by function code: %s, injected faults: %s", simulator.requests, simulator.injected)
+
+
+def main() -> None:
+    """Parse the command line and run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    parser.add_argument("--framer", choices=("socket", "rtu"), default="socket",
+                        help="Modbus TCP, or RTU frames over TCP like an RS-485 converter")
+    parser.add_argument("--slave", type=int, action="append",
+                        help="slave ID of a simulated unit, repeat for several units (default: 1)")
+    parser.add_argument("--zones", type=int, default=0, choices=range(9),
+                        help="VarioBreeze zones with sensors and buttons")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="simulated seconds per real second")
+    parser.add_argument("--set", action="append", metavar="KEY=VALUE",
+                        help="preset a register, e.g. errors=16 or boost_time=600")
+    parser.add_argument("--latency", type=float, default=0.0, help="reply delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra delay in seconds")
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--exception-rate", type=float, default=0.0)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    parser.add_argument("--corrupt-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level, format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()